@@ -1,11 +1,16 @@
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any
 
 import tiktoken
-from sqlalchemy.orm import aliased, Session
+from cachetools import TTLCache
+from sqlalchemy.orm import Session
 
-from dispatch.case.enums import CaseResolutionReason
 from dispatch.case.models import Case
+from dispatch.config import GENAI_HISTORICAL_CONTEXT_CACHE_TTL
 from dispatch.enums import Visibility
 from dispatch.incident.models import Incident
 from dispatch.plugin import service as plugin_service
@@ -19,6 +24,12 @@ from .exceptions import GenAIException
 
 log = logging.getLogger(__name__)
 
+HISTORICAL_CONTEXT_MAX_WORKERS = 8
+
+# (case updated at, case context) by (organization slug, case id)
+_case_contexts = TTLCache(maxsize=1000, ttl=GENAI_HISTORICAL_CONTEXT_CACHE_TTL)
+_case_contexts_lock = threading.Lock()
+
 
 def get_model_token_limit(model_name: str, buffer_percentage: float = 0.05) -> int:
     """
@@ -51,66 +62,145 @@ def get_model_token_limit(model_name: str, buffer_percentage: float = 0.05) -> i
     return safe_limit
 
 
-def num_tokens_from_string(message: str, model: str) -> tuple[list[int], int, tiktoken.Encoding]:
+@lru_cache(maxsize=None)
+def get_encoding(model: str) -> tiktoken.Encoding:
     """
-    Calculate the number of tokens in a given string for a specified model.
+    Returns the tokenizer encoding for a specified model, cached for the life of the process.
 
     Args:
-        message (str): The input string to be tokenized.
         model (str): The model name to use for tokenization.
 
     Returns:
-        tuple: A tuple containing a list of token integers, the number of tokens, and the encoding object.
+        tiktoken.Encoding: The encoding of the model, or o200k_base if the model is unknown.
     """
     try:
-        encoding = tiktoken.encoding_for_model(model)
+        return tiktoken.encoding_for_model(model)
     except KeyError:
         log.warning(
             f"We could not automatically map {model} to a tokeniser. Using o200k_base encoding."
         )
         # defaults to o200k_base encoding used in gpt-4o, gpt-4o-mini models
-        encoding = tiktoken.get_encoding("o200k_base")
+        return tiktoken.get_encoding("o200k_base")
+
+
+class PromptSection(object):
+    """A part of a prompt, made of one text or of items ordered from most to least relevant."""
 
-    tokenized_message = encoding.encode(message)
-    num_tokens = len(tokenized_message)
+    def __init__(
+        self, items: list[str], priority: int, droppable: bool, header: str = "", footer: str = ""
+    ):
+        self.items = items
+        self.priority = priority
+        self.droppable = droppable
+        self.header = header
+        self.footer = footer
+        self.tokens = None
 
-    return tokenized_message, num_tokens, encoding
+    def render(self) -> str:
+        return "\n".join([t for t in [self.header, *self.items, self.footer] if t])
 
 
-def truncate_prompt(
-    tokenized_prompt: list[int],
-    num_tokens: int,
-    encoding: tiktoken.Encoding,
-    model_token_limit: int,
-) -> str:
+class PromptBuilder(object):
     """
-    Truncate the tokenized prompt to ensure it does not exceed the maximum number of tokens.
+    Assembles a prompt from sections so that it fits within the token limit of a model.
 
-    Args:
-        tokenized_prompt (list[int]): The tokenized input prompt to be truncated.
-        num_tokens (int): The number of tokens in the input prompt.
-        encoding (tiktoken.Encoding): The encoding object used for tokenization.
+    When the prompt is too long, the items of the least important droppable sections are
+    dropped first, starting with the least relevant ones, and only then are the least
+    important texts truncated. Since a token is at least one byte long, prompts whose UTF-8
+    size fits within the limit are not tokenized at all.
 
-    Returns:
-        str: The truncated prompt as a string.
+    Args:
+        model (str): The model the prompt is for.
+        token_limit (int): The maximum number of tokens, defaults to the model's limit.
     """
-    excess_tokens = num_tokens - model_token_limit
-    truncated_tokenized_prompt = tokenized_prompt[:-excess_tokens]
-    truncated_prompt = encoding.decode(truncated_tokenized_prompt)
-    log.warning(f"GenAI prompt truncated to fit within {model_token_limit} tokens.")
-    return truncated_prompt
 
+    def __init__(self, model: str, token_limit: int | None = None):
+        self.model = model
+        self.token_limit = token_limit or get_model_token_limit(model)
+        self.sections: list[PromptSection] = []
+
+    def add(self, text: str, priority: int = 0) -> "PromptBuilder":
+        """Adds a text to the prompt. Texts of a lower priority are truncated first."""
+        self.sections.append(PromptSection([str(text)], priority, droppable=False))
+        return self
+
+    def add_items(
+        self, items: list[str], priority: int = 0, header: str = "", footer: str = ""
+    ) -> "PromptBuilder":
+        """Adds items, ordered from most to least relevant, that may be dropped to fit the limit."""
+        self.sections.append(
+            PromptSection(list(items), priority, droppable=True, header=header, footer=footer)
+        )
+        return self
+
+    def build(self) -> str:
+        """Returns the prompt, reduced to fit within the token limit if needed."""
+        prompt = self.render()
+        if len(prompt.encode("utf-8")) <= self.token_limit:
+            return prompt
+
+        encoding = get_encoding(self.model)
+        for section in self.sections:
+            section.tokens = encoding.encode_ordinary_batch(
+                [section.header, *section.items, section.footer]
+            )
+
+        # one token is counted for every line break, emitted between the texts that aren't empty
+        parts = sum(1 for section in self.sections for tokens in section.tokens if tokens)
+
+        def drop_part() -> int:
+            """Returns the number of line break tokens saved by dropping a text."""
+            nonlocal parts
+            parts -= 1
+            return 1 if parts else 0
 
-def generate_case_signal_historical_context(case: Case, db_session: Session) -> str:
+        excess = (
+            sum(len(tokens) for section in self.sections for tokens in section.tokens)
+            + max(parts - 1, 0)
+            - self.token_limit
+        )
+        if excess <= 0:
+            return prompt
+
+        by_priority = sorted(self.sections, key=lambda section: section.priority)
+        for section in [s for s in by_priority if s.droppable]:
+            while excess > 0 and section.items:
+                section.items.pop()
+                tokens = section.tokens.pop(-2)
+                if tokens:
+                    excess -= len(tokens) + drop_part()
+
+        for section in [s for s in by_priority if not s.droppable]:
+            if excess <= 0:
+                break
+            tokens = section.tokens[1]
+            if not tokens:
+                continue
+            if excess >= len(tokens):
+                section.items = [""]
+                excess -= len(tokens) + drop_part()
+            else:
+                section.items = [encoding.decode(tokens[: len(tokens) - excess])]
+                excess = 0
+
+        log.warning(f"GenAI prompt reduced to fit within {self.token_limit} tokens.")
+        return self.render()
+
+    def render(self) -> str:
+        # sections left empty are skipped
+        return "\n".join(text for text in (s.render() for s in self.sections) if text)
+
+
+def get_case_signal_historical_context(case: Case, db_session: Session) -> list[str]:
     """
-    Generate historical context for a case stemming from a signal, including related cases and relevant data.
+    Get the historical context for a case stemming from a signal, one item per related case.
 
     Args:
         case (Case): The case object for which historical context is being generated.
         db_session (Session): The database session used for querying related data.
 
     Returns:
-        str: A string containing the historical context for the case, or an error message if context generation fails.
+        list[str]: The context of each related case, ordered from most to least relevant.
     """
     # we fetch the first instance id and signal
     (first_instance_id, first_instance_signal) = signal_service.get_instances_in_case(
@@ -141,56 +231,143 @@ def generate_case_signal_historical_context(case: Case, db_session: Session) ->
         log.warning(message)
         raise GenAIException(message)
 
-    # we fetch related cases
-    related_cases = []
-    for resolution_reason in CaseResolutionReason:
-        # Get the query for cases for a specific resolution reason
-        query = signal_service.get_cases_for_signal_by_resolution_reason(
-            db_session=db_session,
-            signal_id=first_instance_signal.id,
-            resolution_reason=resolution_reason,
-        )
+    return get_related_case_contexts(
+        case=case, signal_id=first_instance_signal.id, db_session=db_session
+    )
 
-        # Create an alias for the subquery
-        subquery = query.subquery()
-        case_alias = aliased(Case, subquery)
-
-        # Filter the cases and extend the related_cases list
-        related_cases.extend(db_session.query(case_alias).filter(case_alias.id != case.id).all())
-
-    # we prepare historical context
-    historical_context = []
-    for related_case in related_cases:
-        historical_context.append("<case>")
-        historical_context.append(f"<case_name>{related_case.name}</case_name>")
-        historical_context.append(f"<case_resolution>{related_case.resolution}</case_resolution")
-        historical_context.append(
-            f"<case_resolution_reason>{related_case.resolution_reason}</case_resolution_reason>"
-        )
-        historical_context.append(
-            f"<case_alert_data>{related_case.signal_instances[0].raw}</case_alert_data>"
+
+def format_case_context(case: Case, raw: dict | None, conversation_replies: list[str]) -> str:
+    """Formats the context of a related case for a GenAI prompt."""
+    case_context = [
+        "<case>",
+        f"<case_name>{case.name}</case_name>",
+        f"<case_resolution>{case.resolution}</case_resolution",
+        f"<case_resolution_reason>{case.resolution_reason}</case_resolution_reason>",
+        f"<case_alert_data>{raw}</case_alert_data>",
+    ]
+    for reply in conversation_replies:
+        case_context.append(f"<case_conversation_reply>{reply}</case_conversation_reply>")
+    case_context.append("</case>")
+    return "\n".join(case_context)
+
+
+def get_conversation_replies(
+    plugin_class: type,
+    configuration: Any,
+    project_id: int,
+    conversations: dict[int, tuple[str, str]],
+) -> dict[int, list[str]]:
+    """
+    Fetches the replies of conversations concurrently.
+
+    Plugin objects are thread local, so each worker binds its own plugin object to the
+    configuration. Conversations whose replies could not be fetched are left out.
+
+    Args:
+        plugin_class (type): The class of the conversation plugin.
+        configuration (Any): The configuration of the conversation plugin instance.
+        project_id (int): The project of the conversation plugin instance.
+        conversations (dict[int, tuple[str, str]]): The channel and thread ids by case id.
+
+    Returns:
+        dict[int, list[str]]: The conversation replies by case id.
+    """
+
+    def fetch(channel_id: str, thread_id: str) -> list[str]:
+        plugin = plugin_class()
+        plugin.configuration = configuration
+        plugin.project_id = project_id
+        return plugin.get_conversation_replies(conversation_id=channel_id, thread_ts=thread_id)
+
+    with ThreadPoolExecutor(
+        max_workers=min(HISTORICAL_CONTEXT_MAX_WORKERS, len(conversations))
+    ) as executor:
+        futures = {
+            case_id: executor.submit(fetch, channel_id, thread_id)
+            for case_id, (channel_id, thread_id) in conversations.items()
+        }
+
+    replies = {}
+    for case_id, future in futures.items():
+        try:
+            replies[case_id] = future.result()
+        except Exception as e:
+            log.warning(f"Unable to fetch conversation replies for case {case_id}: {e}")
+    return replies
+
+
+def get_related_case_contexts(case: Case, signal_id: int, db_session: Session) -> list[str]:
+    """
+    Returns the context of each case related to a case stemming from a signal.
+
+    The contexts of related cases are cached until the related case is updated, and the
+    conversation replies of the related cases not cached yet are fetched concurrently.
+
+    Args:
+        case (Case): The case object for which historical context is being generated.
+        signal_id (int): The id of the signal the case stems from.
+        db_session (Session): The database session used for querying related data.
+
+    Returns:
+        list[str]: The context of each related case.
+    """
+    related_cases = signal_service.get_recent_cases_for_signal(
+        db_session=db_session, signal_id=signal_id, exclude_case_id=case.id
+    )
+    if not related_cases:
+        return []
+
+    organization_slug = case.project.organization.slug
+    fragments = {}
+    with _case_contexts_lock:
+        for related_case in related_cases:
+            cached = _case_contexts.get((organization_slug, related_case.id))
+            if cached and cached[0] == related_case.updated_at:
+                fragments[related_case.id] = cached[1]
+
+    missing_cases = [c for c in related_cases if c.id not in fragments]
+    if missing_cases:
+        raws = signal_service.get_first_instance_raw_by_case_id(
+            db_session=db_session, case_ids=[c.id for c in missing_cases]
         )
+
         conversation_plugin = plugin_service.get_active_instance(
             db_session=db_session, project_id=case.project.id, plugin_type="conversation"
         )
-        if conversation_plugin:
-            if related_case.conversation and related_case.conversation.channel_id:
-                # we fetch conversation replies for the related case
-                conversation_replies = conversation_plugin.instance.get_conversation_replies(
-                    conversation_id=related_case.conversation.channel_id,
-                    thread_ts=related_case.conversation.thread_id,
-                )
-                for reply in conversation_replies:
-                    historical_context.append(
-                        f"<case_conversation_reply>{reply}</case_conversation_reply>"
-                    )
-        else:
+        if not conversation_plugin:
             log.warning(
                 "Conversation replies not included in historical context. No conversation plugin enabled."
             )
-        historical_context.append("</case>")
 
-    return "\n".join(historical_context)
+        # conversations are read here, as the session can't be shared with the workers
+        conversations = {
+            c.id: (c.conversation.channel_id, c.conversation.thread_id)
+            for c in missing_cases
+            if conversation_plugin and c.conversation and c.conversation.channel_id
+        }
+        replies = {}
+        if conversations:
+            plugin = conversation_plugin.instance
+            replies = get_conversation_replies(
+                type(plugin), plugin.configuration, plugin.project_id, conversations
+            )
+
+        for related_case in missing_cases:
+            fragment = format_case_context(
+                related_case, raws.get(related_case.id), replies.get(related_case.id, [])
+            )
+            fragments[related_case.id] = fragment
+
+            # contexts missing replies that could not be fetched are not cached
+            if related_case.id in conversations and related_case.id not in replies:
+                continue
+            with _case_contexts_lock:
+                _case_contexts[(organization_slug, related_case.id)] = (
+                    related_case.updated_at,
+                    fragment,
+                )
+
+    return [fragments[c.id] for c in related_cases]
 
 
 def generate_case_signal_summary(case: Case, db_session: Session) -> dict[str, str]:
@@ -206,9 +383,7 @@ def generate_case_signal_summary(case: Case, db_session: Session) -> dict[str, s
     """
     # we generate the historical context
     try:
-        historical_context = generate_case_signal_historical_context(
-            case=case, db_session=db_session
-        )
+        historical_context = get_case_signal_historical_context(case=case, db_session=db_session)
     except GenAIException as e:
         log.warning(f"Error generating GenAI historical context for {case.name}: {str(e)}")
         raise e
@@ -259,35 +434,20 @@ def generate_case_signal_summary(case: Case, db_session: Session) -> dict[str, s
         log.warning(message)
         raise GenAIException(message)
 
-    # we generate the prompt
-    prompt = f"""
-    <prompt>
-    {signal_instance.signal.genai_prompt}
-    </prompt>
-
-    <current_event>
-    {str(signal_instance.raw)}
-    </current_event>
-
-    <runbook>
-    {signal_instance.signal.runbook}
-    </runbook>
-
-    <historical_context>
-    {historical_context}
-    </historical_context>
-    """
-
-    tokenized_prompt, num_tokens, encoding = num_tokens_from_string(
-        prompt, genai_plugin.instance.configuration.chat_completion_model
-    )
-
-    # we check if the prompt exceeds the token limit
-    model_token_limit = get_model_token_limit(
-        genai_plugin.instance.configuration.chat_completion_model
+    # we generate the prompt, dropping the least relevant historical cases first if it's too long
+    prompt = (
+        PromptBuilder(genai_plugin.instance.configuration.chat_completion_model)
+        .add(f"<prompt>\n{signal_instance.signal.genai_prompt}\n</prompt>", priority=3)
+        .add(f"<current_event>\n{str(signal_instance.raw)}\n</current_event>", priority=2)
+        .add(f"<runbook>\n{signal_instance.signal.runbook}\n</runbook>", priority=1)
+        .add_items(
+            historical_context,
+            priority=0,
+            header="<historical_context>",
+            footer="</historical_context>",
+        )
+        .build()
     )
-    if num_tokens > model_token_limit:
-        prompt = truncate_prompt(tokenized_prompt, num_tokens, encoding, model_token_limit)
 
     # we generate the analysis
     response = genai_plugin.instance.chat_completion(prompt=prompt)
@@ -372,16 +532,12 @@ def generate_incident_summary(incident: Incident, db_session: Session) -> str:
             {pir_doc}
         """
 
-        tokenized_prompt, num_tokens, encoding = num_tokens_from_string(
-            prompt, genai_plugin.instance.configuration.chat_completion_model
-        )
-
-        # we check if the prompt exceeds the token limit
-        model_token_limit = get_model_token_limit(
-            genai_plugin.instance.configuration.chat_completion_model
+        # we truncate the prompt if it exceeds the token limit
+        prompt = (
+            PromptBuilder(genai_plugin.instance.configuration.chat_completion_model)
+            .add(prompt)
+            .build()
         )
-        if num_tokens > model_token_limit:
-            prompt = truncate_prompt(tokenized_prompt, num_tokens, encoding, model_token_limit)
 
         summary = genai_plugin.instance.chat_completion(prompt=prompt)
 
@@ -529,16 +685,10 @@ def get_tag_recommendations(
 
     prompt += f"** Tags you can use: {tag_list} \n ** Security event details: {resources}"
 
-    tokenized_prompt, num_tokens, encoding = num_tokens_from_string(
-        prompt, genai_plugin.instance.configuration.chat_completion_model
-    )
-
-    # we check if the prompt exceeds the token limit
-    model_token_limit = get_model_token_limit(
-        genai_plugin.instance.configuration.chat_completion_model
+    # we truncate the prompt if it exceeds the token limit
+    prompt = (
+        PromptBuilder(genai_plugin.instance.configuration.chat_completion_model).add(prompt).build()
     )
-    if num_tokens > model_token_limit:
-        prompt = truncate_prompt(tokenized_prompt, num_tokens, encoding, model_token_limit)
 
     try:
         result = genai_plugin.instance.chat_completion(prompt=prompt)
@@ -5,7 +5,7 @@ from fastapi import HTTPException
 from starlette.requests import Request
 from starlette.status import HTTP_403_FORBIDDEN, HTTP_404_NOT_FOUND
 
-from dispatch.auth.service import get_current_user
+from dispatch.auth.service import get_auth_context
 from dispatch.case import service as case_service
 from dispatch.case.models import Case
 from dispatch.incident.models import Incident
@@ -13,8 +13,6 @@ from dispatch.enums import UserRoles, Visibility
 from dispatch.incident import service as incident_service
 from dispatch.individual import service as individual_contact_service
 from dispatch.models import PrimaryKeyModel
-from dispatch.organization import service as organization_service
-from dispatch.organization.models import OrganizationRead
 from dispatch.participant_role.enums import ParticipantRoleType
 
 log = logging.getLogger(__name__)
@@ -69,35 +67,14 @@ class BasePermission(ABC):
     def has_required_permissions(self, request: Request) -> bool: ...
 
     def __init__(self, request: Request):
-        organization = None
-        if request.path_params.get("organization"):
-            organization = organization_service.get_by_slug_or_raise(
-                db_session=request.state.db,
-                organization_in=OrganizationRead(
-                    slug=request.path_params["organization"],
-                    name=request.path_params["organization"],
-                ),
-            )
-        elif request.path_params.get("organization_id"):
-            organization = organization_service.get(
-                db_session=request.state.db, organization_id=request.path_params["organization_id"]
-            )
-
-        if not organization:
-            raise HTTPException(status_code=self.org_error_code, detail=self.org_error_msg)
-
-        org_check = organization_service.get_by_slug(
-            db_session=request.state.db, slug=organization.slug
-        )
-
-        if not org_check or org_check.id != organization.id:
+        self.context = get_auth_context(request=request)
+        if not self.context.organization:
             raise HTTPException(status_code=self.org_error_code, detail=self.org_error_msg)
 
-        user = get_current_user(request=request)
-        if not user:
+        if not self.context.user:
             raise HTTPException(status_code=self.user_error_code, detail=self.user_error_msg)
 
-        self.role = user.get_organization_role(organization.slug)
+        self.role = self.context.role
         if not self.has_required_permissions(request):
             raise HTTPException(
                 status_code=self.user_role_error_code, detail=self.user_role_error_msg
@@ -220,7 +197,7 @@ class IndividualContactUpdatePermission(BasePermission):
             if not individual_contact:
                 return False
 
-            current_user = get_current_user(request=request)
+            current_user = self.context.user
             if individual_contact.email == current_user.email:
                 return True
 
@@ -326,7 +303,7 @@ class IncidentReporterPermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        current_user = get_current_user(request=request)
+        current_user = self.context.user
         pk = PrimaryKeyModel(id=request.path_params["incident_id"])
         current_incident = incident_service.get(db_session=request.state.db, incident_id=pk.id)
 
@@ -345,7 +322,7 @@ class IncidentCommanderPermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        current_user = get_current_user(request=request)
+        current_user = self.context.user
         pk = PrimaryKeyModel(id=request.path_params["incident_id"])
         current_incident = incident_service.get(db_session=request.state.db, incident_id=pk.id)
         if not current_incident:
@@ -363,7 +340,7 @@ class IncidentCommanderOrScribePermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        current_user = get_current_user(request=request)
+        current_user = self.context.user
         pk = PrimaryKeyModel(id=request.path_params["incident_id"])
         current_incident = incident_service.get(db_session=request.state.db, incident_id=pk.id)
         if not current_incident:
@@ -391,7 +368,7 @@ class IncidentParticipantPermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        current_user = get_current_user(request=request)
+        current_user = self.context.user
         pk = PrimaryKeyModel(id=request.path_params["incident_id"])
         current_incident: Incident = incident_service.get(
             db_session=request.state.db, incident_id=pk.id
@@ -450,7 +427,7 @@ class CaseParticipantPermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        current_user = get_current_user(request=request)
+        current_user = self.context.user
         pk = PrimaryKeyModel(id=request.path_params["case_id"])
         current_case: Case = case_service.get(db_session=request.state.db, case_id=pk.id)
         participant_emails: list[str] = [
@@ -510,7 +487,7 @@ class FeedbackDeletePermission(BasePermission):
                 if not individual_contact:
                     return False
 
-                current_user = get_current_user(request=request)
+                current_user = self.context.user
                 if individual_contact.email == current_user.email:
                     return True
 
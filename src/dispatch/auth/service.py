@@ -6,6 +6,7 @@
 """
 
 import logging
+from dataclasses import dataclass
 from typing import Annotated
 
 from fastapi import HTTPException, Depends
@@ -19,7 +20,7 @@ from dispatch.config import (
 )
 from dispatch.enums import UserRoles
 from dispatch.organization import service as organization_service
-from dispatch.organization.models import OrganizationRead
+from dispatch.organization.models import Organization, OrganizationRead
 from dispatch.plugins.base import plugins
 from dispatch.project import service as project_service
 
@@ -254,7 +255,14 @@ def update(*, db_session, user: DispatchUser, user_in: UserUpdate) -> DispatchUs
 
 
 def get_current_user(request: Request) -> DispatchUser:
-    """Attempts to get the current user depending on the configured authentication provider."""
+    """Attempts to get the current user depending on the configured authentication provider.
+
+    The user is resolved once per request and memoized on the request's state.
+    """
+    user = getattr(request.state, "current_user", None)
+    if user is not None:
+        return user
+
     if DISPATCH_AUTHENTICATION_PROVIDER_SLUG:
         auth_plugin = plugins.get(DISPATCH_AUTHENTICATION_PROVIDER_SLUG)
         user_email = auth_plugin.get_current_user(request)
@@ -274,16 +282,63 @@ def get_current_user(request: Request) -> DispatchUser:
         user_in=UserRegister(email=user_email),
     )
 
+    request.state.current_user = user
     return user
 
 
 CurrentUser = Annotated[DispatchUser, Depends(get_current_user)]
 
 
+@dataclass
+class AuthContext:
+    """The identity and authorization of the user making a request."""
+
+    user: DispatchUser
+    organization: Organization | None
+    role: UserRoles | None
+
+
+def get_auth_context(request: Request) -> AuthContext:
+    """Returns the auth context of the request, computed once and memoized on its state.
+
+    The organization is the one the request's path refers to, if any.
+    """
+    context = getattr(request.state, "auth_context", None)
+    if context is not None:
+        return context
+
+    organization = None
+    if request.path_params.get("organization"):
+        organization = organization_service.get_by_slug_or_raise(
+            db_session=request.state.db,
+            organization_in=OrganizationRead(
+                slug=request.path_params["organization"],
+                name=request.path_params["organization"],
+            ),
+        )
+    elif request.path_params.get("organization_id"):
+        organization = organization_service.get(
+            db_session=request.state.db, organization_id=request.path_params["organization_id"]
+        )
+
+    user = get_current_user(request=request)
+    context = AuthContext(
+        user=user,
+        organization=organization,
+        role=user.get_organization_role(organization.slug) if organization else None,
+    )
+    request.state.auth_context = context
+    return context
+
+
 def get_current_role(
     request: Request, current_user: DispatchUser = Depends(get_current_user)
 ) -> UserRoles:
     """Attempts to get the current user depending on the configured authentication provider."""
+    context = getattr(request.state, "auth_context", None)
+    if context is not None and context.organization:
+        if context.organization.slug == request.state.organization:
+            return context.role
     return current_user.get_organization_role(organization_slug=request.state.organization)
 
 
@@ -1,4 +1,3 @@
-import json
 import logging
 from datetime import datetime
 from typing import Annotated
@@ -17,7 +16,7 @@ from dispatch.auth.permissions import (
 )
 from dispatch.auth.service import CurrentUser
 from dispatch.case.enums import CaseStatus
-from dispatch.common.utils.views import create_pydantic_include
+from dispatch.common.utils.views import create_pagination_response
 from dispatch.database.core import DbSession
 from dispatch.database.service import CommonParameters, search_filter_sort_paginate
 from dispatch.event import flows as event_flows
@@ -132,20 +131,10 @@ def get_cases(
     pagination = search_filter_sort_paginate(model="Case", **common)
 
     if expand:
-        return json.loads(CaseExpandedPagination(**pagination).json())
-
+        return create_pagination_response(CaseExpandedPagination, pagination)
     if include:
-        # only allow two levels for now
-        include_sets = create_pydantic_include(include)
-
-        include_fields = {
-            "items": {"__all__": include_sets},
-            "itemsPerPage": ...,
-            "page": ...,
-            "total": ...,
-        }
-        return json.loads(CaseExpandedPagination(**pagination).json(include=include_fields))
-    return json.loads(CasePagination(**pagination).json())
+        return create_pagination_response(CaseExpandedPagination, pagination, include)
+    return create_pagination_response(CasePagination, pagination)
 
 
 @router.get("/minimal", summary="Retrieves a list of cases with minimal data.")
@@ -155,7 +144,7 @@ def get_cases_minimal(
     """Retrieves all cases with minimal data."""
     pagination = search_filter_sort_paginate(model="Case", **common)
 
-    return json.loads(CasePaginationMinimalWithExtras(**pagination).json())
+    return create_pagination_response(CasePaginationMinimalWithExtras, pagination)
 
 
 @router.post("", response_model=CaseRead, summary="Creates a new case.")
@@ -12,9 +12,8 @@ from dispatch.case_cost_type import service as case_cost_type_service
 from dispatch.case.enums import CostModelType
 from dispatch.cost_model import service as cost_model_service
 from dispatch.participant import service as participant_service
-from dispatch.participant.models import ParticipantRead
 from dispatch.participant_activity import service as participant_activity_service
-from dispatch.participant_activity.models import ParticipantActivityCreate, ParticipantActivity
+from dispatch.participant_activity.models import ParticipantActivity
 from dispatch.participant_role.models import ParticipantRoleType, ParticipantRole
 from dispatch.plugin import service as plugin_service
 
@@ -263,36 +262,40 @@ def update_case_participant_activities(
     if cost_model:
         for activity in cost_model.activities:
             # Array of sorted (timestamp, user_id) tuples.
-            case_events.extend(
-                fetch_case_events(
-                    case=case, activity=activity, oldest=oldest, db_session=db_session
-                )
-            )
-
-        # Sort case_events by timestamp
-        sorted(case_events, key=lambda x: x[0])
+            for ts, user_id in fetch_case_events(
+                case=case, activity=activity, oldest=oldest, db_session=db_session
+            ):
+                case_events.append((ts, user_id, activity))
+
+        # Resolve all the event users to case participants at once.
+        participants = participant_service.get_all_by_case_id_and_conversation_ids(
+            db_session=db_session,
+            case_id=case.id,
+            user_conversation_ids=list({user_id for _, user_id, _ in case_events}),
+        )
+        participant_ids = {p.user_conversation_id: p.id for p in participants}
 
-        for ts, user_id in case_events:
-            participant = participant_service.get_by_case_id_and_conversation_id(
-                db_session=db_session,
-                case_id=case.id,
-                user_conversation_id=user_id,
-            )
-            if not participant:
+        activities = []
+        for ts, user_id, activity in case_events:
+            participant_id = participant_ids.get(user_id)
+            if not participant_id:
                 log.warning("Cannot resolve participant.")
                 continue
 
-            activity_in = ParticipantActivityCreate(
-                plugin_event=activity.plugin_event,
-                started_at=ts,
-                ended_at=ts + timedelta(seconds=activity.response_time_seconds),
-                participant=ParticipantRead(id=participant.id),
-                case=case,
+            activities.append(
+                (
+                    participant_id,
+                    activity.plugin_event.id,
+                    ts,
+                    ts + timedelta(seconds=activity.response_time_seconds),
+                )
             )
 
-            most_recent_activity = participant_activity_service.create_or_update(
-                db_session=db_session, activity_in=activity_in
+        if activities:
+            activities = participant_activity_service.create_or_update_case_activities(
+                db_session=db_session, case_id=case.id, activities=activities
             )
+            most_recent_activity = max(activities, key=lambda a: a.ended_at, default=None)
     return most_recent_activity
 
 
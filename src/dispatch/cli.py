@@ -704,8 +704,9 @@ def dispatch_scheduler():
     )
     from .incident_cost.scheduled import calculate_incidents_response_cost  # noqa
     from .monitor.scheduled import sync_active_stable_monitors  # noqa
+    from .notification.scheduled import reconcile_email_bounces  # noqa
     from .report.scheduled import incident_report_reminders  # noqa
-    from .tag.scheduled import build_tag_models, sync_tags  # noqa
+    from .tag.scheduled import build_tag_models, sync_tags, update_tag_models  # noqa
     from .task.scheduled import (
         create_incident_tasks_reminders,  # noqa
     )
@@ -848,144 +849,82 @@ def signals_group():
 
 
 @signals_group.command("consume")
-def consume_signals():
+@click.option(
+    "--max-backoff", default=300.0, help="Maximum seconds to wait before restarting a consumer."
+)
+@click.option(
+    "--refresh-interval", default=300.0, help="Seconds between checks for new signal consumers."
+)
+def consume_signals(max_backoff, refresh_interval):
     """
     Runs a continuous process that consumes signals from the specified plugins.
 
-    This function sets up consumer threads for all active signal-consumer plugins
-    across all organizations and projects. It monitors these threads and restarts
-    them if they die. The process can be terminated using SIGINT or SIGTERM.
-
-    Returns:
-        None
+    Every active signal-consumer plugin instance across all organizations and projects
+    runs in its own thread with its own session. Consumers that die are restarted with
+    an exponential backoff. The process can be terminated using SIGINT or SIGTERM.
     """
+    import signal
+
     from dispatch.common.utils.cli import install_plugins
-    from dispatch.database.core import get_organization_session, get_session
-    from dispatch.organization.service import get_all as get_all_organizations
-    from dispatch.plugin import service as plugin_service
-    from dispatch.project import service as project_service
+    from dispatch.signal.consumer import SignalConsumerSupervisor
 
     install_plugins()
 
-    try:
-        with get_session() as session:
-            organizations = get_all_organizations(db_session=session)
-    except Exception as e:
-        log.exception(f"Error fetching organizations: {e}")
-        return
+    supervisor = SignalConsumerSupervisor(
+        max_backoff=max_backoff, refresh_interval=refresh_interval
+    )
 
-    for organization in organizations:
-        try:
-            with get_organization_session(organization.slug) as session:
-                projects = project_service.get_all(db_session=session)
-
-                for project in projects:
-                    try:
-                        plugins = plugin_service.get_active_instances(
-                            db_session=session, plugin_type="signal-consumer", project_id=project.id
-                        )
-
-                        if not plugins:
-                            log.warning(
-                                f"No signals consumed. No signal-consumer plugins enabled. Project: {project.name}. Organization: {project.organization.name}"
-                            )
-                            continue
-
-                        for plugin in plugins:
-                            log.debug(f"Consuming signals for plugin: {plugin.plugin.slug}")
-                            try:
-                                plugin.instance.consume(db_session=session, project=project)
-                            except Exception as e:
-                                log.error(
-                                    f"Error consuming signals for plugin: {plugin.plugin.slug}. Error: {e}"
-                                )
-                    except Exception as e:
-                        log.exception(f"Error processing project {project.name}: {e}")
-        except Exception as e:
-            log.exception(f"Error processing organization {organization.slug}: {e}")
+    def stop_supervisor(signum, frame):
+        click.secho("Stopping signal consumers...", fg="blue")
+        supervisor.stop()
+
+    for s in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(s, stop_supervisor)
+
+    click.secho("Starting signal consumers...", fg="blue")
+    supervisor.run()
 
 
 @signals_group.command("process")
-def process_signals():
+@click.option("--num-workers", default=1, help="Number of worker threads to use.")
+@click.option(
+    "--batch-size", default=50, help="Number of signal instances each worker claims at a time."
+)
+@click.option(
+    "--idle-sleep", default=1.0, help="Seconds to wait after a round finds no signal instances."
+)
+@click.option("--max-idle-sleep", default=30.0, help="Maximum seconds to wait between idle rounds.")
+def process_signals(num_workers, batch_size, idle_sleep, max_idle_sleep):
     """
     Runs a continuous process that does additional processing on newly created signals.
 
-    This function processes signal instances across all organizations by:
-    1. Creating a session for each organization using a context manager
-    2. Fetching unprocessed signal instances (with no filter_action or case_id)
-    3. Processing each instance with proper error handling
-    4. Ensuring proper session cleanup even if exceptions occur
-
-    Returns:
-        None
+    Signal instances with no filter action or case are claimed in batches by a pool of
+    workers across all organizations, so several processes can run side by side. Workers
+    back off while there is nothing to process and stop gracefully on SIGINT or SIGTERM.
     """
-    from contextlib import contextmanager
-
-    from sqlalchemy import asc
-    from sqlalchemy.orm import sessionmaker
+    import signal
 
     from dispatch.common.utils.cli import install_plugins
-    from dispatch.database.core import SessionLocal, engine
-    from dispatch.organization.service import get_all as get_all_organizations
-    from dispatch.signal import flows as signal_flows
-    from dispatch.signal.models import SignalInstance
+    from dispatch.signal.processor import SignalProcessor
 
     install_plugins()
 
-    @contextmanager
-    def session_scope(schema_engine):
-        """Provide a transactional scope around a series of operations."""
-        session = sessionmaker(bind=schema_engine)()
-        try:
-            yield session
-            session.commit()
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
-
-    organizations = get_all_organizations(db_session=SessionLocal())
-
-    while True:
-        for organization in organizations:
-            schema_engine = engine.execution_options(
-                schema_translate_map={
-                    None: f"dispatch_organization_{organization.slug}",
-                }
-            )
+    processor = SignalProcessor(
+        num_workers=num_workers,
+        batch_size=batch_size,
+        idle_sleep=idle_sleep,
+        max_idle_sleep=max_idle_sleep,
+    )
+
+    def stop_processor(signum, frame):
+        click.secho("Stopping signal processor...", fg="blue")
+        processor.stop()
+
+    for s in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(s, stop_processor)
 
-            try:
-                with session_scope(schema_engine) as db_session:
-                    # Get IDs first rather than full instances
-                    signal_instance_ids = (
-                        db_session.query(SignalInstance.id)
-                        .filter(SignalInstance.filter_action == None)  # noqa
-                        .filter(SignalInstance.case_id == None)  # noqa
-                        .order_by(asc(SignalInstance.created_at))
-                        .limit(500)
-                        .all()
-                    )
-
-                    # Process each instance with its own transaction
-                    for (instance_id,) in signal_instance_ids:
-                        try:
-                            # Process each signal instance in its own transaction
-                            # This ensures each instance is fresh and attached to the session
-                            signal_flows.signal_instance_create_flow(
-                                db_session=db_session,
-                                signal_instance_id=instance_id,
-                            )
-                            # Commit after each successful processing to avoid
-                            # accumulating too many objects in the session
-                            db_session.commit()
-                        except Exception as e:
-                            log.exception(f"Error processing signal instance {instance_id}: {e}")
-                            # Rollback this specific transaction but continue with others
-                            db_session.rollback()
-            except Exception as e:
-                log.exception(f"Error processing signals for organization {organization.slug}: {e}")
-                # No need to close the session here as it's handled by the context manager
+    click.secho(f"Starting signal processor with {num_workers} worker(s)...", fg="blue")
+    processor.run()
 
 
 @signals_group.command("perf-test")
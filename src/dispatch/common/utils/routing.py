@@ -0,0 +1,72 @@
+import re
+from dataclasses import dataclass, field
+
+from starlette.routing import compile_path
+
+
+@dataclass
+class _RouteNode:
+    """A node in the path segment trie."""
+
+    static: dict[str, "_RouteNode"] = field(default_factory=dict)
+    dynamic: "_RouteNode | None" = None
+    # (route index, compiled path regex) for templates ending at this node
+    routes: list[tuple[int, re.Pattern]] = field(default_factory=list)
+    # (route index, compiled path regex) for templates with a path converter at this node
+    catch_all: list[tuple[int, re.Pattern]] = field(default_factory=list)
+
+
+class PathParamsMatcher:
+    """Extracts path parameters from a request path using precompiled routes.
+
+    Route templates are compiled once and stored in a trie keyed on their path segments,
+    so that only the few routes sharing the request's path shape are matched against it.
+    When several routes match, the one registered last wins.
+    """
+
+    def __init__(self, routes):
+        self._root = _RouteNode()
+        for index, route in enumerate(routes):
+            self._add(index, route.path)
+
+    def _add(self, index: int, path: str):
+        path_regex, _, _ = compile_path(path)
+        node = self._root
+        for segment in path.split("/")[1:]:
+            if ":path}" in segment:
+                node.catch_all.append((index, path_regex))
+                return
+
+            if "{" in segment:
+                if node.dynamic is None:
+                    node.dynamic = _RouteNode()
+                node = node.dynamic
+            else:
+                node = node.static.setdefault(segment, _RouteNode())
+        node.routes.append((index, path_regex))
+
+    def _candidates(self, node: _RouteNode, segments: list[str], position: int):
+        yield from node.catch_all
+
+        if position == len(segments):
+            yield from node.routes
+            return
+
+        segment = segments[position]
+        if segment in node.static:
+            yield from self._candidates(node.static[segment], segments, position + 1)
+        if node.dynamic is not None and segment:
+            yield from self._candidates(node.dynamic, segments, position + 1)
+
+    def match(self, path: str) -> dict[str, str]:
+        """Returns the path parameters of the last registered route matching the path."""
+        candidates = sorted(
+            self._candidates(self._root, path.split("/")[1:], 0),
+            key=lambda candidate: candidate[0],
+            reverse=True,
+        )
+        for _, path_regex in candidates:
+            match = path_regex.match(path)
+            if match:
+                return match.groupdict()
+        return {}
@@ -1,3 +1,7 @@
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
 def create_pydantic_include(include):
     """Creates a pydantic sets based on dotted notation."""
     include_sets = {}
@@ -15,3 +19,28 @@ def create_pydantic_include(include):
         include_sets.update(keyset)
 
     return include_sets
+
+
+def create_pagination_response(
+    pagination_model: type[BaseModel], pagination: dict, include: list[str] | None = None
+) -> Response:
+    """Serializes a page of results straight to a JSON response.
+
+    The page is validated and serialized to JSON once, rather than being dumped to a string,
+    loaded back and serialized again. `include` restricts the fields of the items, in the
+    dotted notation of `create_pydantic_include`.
+    """
+    include_fields = None
+    if include:
+        # only allow two levels for now
+        include_fields = {
+            "items": {"__all__": create_pydantic_include(include)},
+            "itemsPerPage": ...,
+            "page": ...,
+            "total": ...,
+        }
+
+    return Response(
+        content=pagination_model(**pagination).model_dump_json(include=include_fields),
+        media_type="application/json",
+    )
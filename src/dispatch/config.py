@@ -107,6 +107,8 @@ MJML_PATH = config(
     "MJML_PATH",
     default=f"{os.path.dirname(os.path.realpath(__file__))}/static/dispatch/node_modules/.bin",
 )
+# The number of node processes kept running to render emails
+MJML_WORKERS = config("MJML_WORKERS", cast=int, default=2)
 DISPATCH_MARKDOWN_IN_INCIDENT_DESC = config(
     "DISPATCH_MARKDOWN_IN_INCIDENT_DESC", cast=bool, default=False
 )
@@ -144,6 +146,13 @@ DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS = config(
     "DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS", default=None
 )
 
+DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS_CACHE_SECONDS = config(
+    "DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS_CACHE_SECONDS", cast=int, default=3600
+)
+DISPATCH_AUTHENTICATION_PROVIDER_PKCE_TOKEN_CACHE_SECONDS = config(
+    "DISPATCH_AUTHENTICATION_PROVIDER_PKCE_TOKEN_CACHE_SECONDS", cast=int, default=60
+)
+
 DISPATCH_PKCE_DONT_VERIFY_AT_HASH = config("DISPATCH_PKCE_DONT_VERIFY_AT_HASH", default=False)
 
 if DISPATCH_AUTHENTICATION_PROVIDER_SLUG == "dispatch-auth-provider-pkce":
@@ -191,6 +200,25 @@ VITE_DISPATCH_AUTHENTICATION_PROVIDER_USE_ID_TOKEN = config(
     "DISPATCH_AUTHENTICATION_PROVIDER_USE_ID_TOKEN", default=""
 )
 
+# conversations
+CONVERSATION_INDEX_SIZE = config("CONVERSATION_INDEX_SIZE", cast=int, default=10000)
+# How long conversations that could not be resolved to an organization are remembered
+CONVERSATION_INDEX_MISS_TTL = config("CONVERSATION_INDEX_MISS_TTL", cast=int, default=10)  # Seconds
+
+# genai
+# How long the context of past cases in signal summaries is cached, unless the case is updated
+GENAI_HISTORICAL_CONTEXT_CACHE_TTL = config(
+    "GENAI_HISTORICAL_CONTEXT_CACHE_TTL", cast=int, default=3600
+)
+
+# incident metrics
+# How long incident forecasts are cached, they are also dropped when incidents change
+INCIDENT_FORECAST_CACHE_TTL = config("INCIDENT_FORECAST_CACHE_TTL", cast=int, default=3600)
+
+# search
+# The number of best ranked results of each type a search returns by default
+SEARCH_LIMIT_PER_TYPE = config("SEARCH_LIMIT_PER_TYPE", cast=int, default=50)
+
 # static files
 DEFAULT_STATIC_DIR = os.path.join(
     os.path.abspath(os.path.dirname(__file__)), os.path.join("static", "dispatch", "dist")
@@ -199,6 +227,8 @@ STATIC_DIR = config("STATIC_DIR", default=DEFAULT_STATIC_DIR)
 
 # metrics
 METRIC_PROVIDERS = config("METRIC_PROVIDERS", cast=CommaSeparatedStrings, default="")
+METRIC_FLUSH_INTERVAL = config("METRIC_FLUSH_INTERVAL", cast=float, default=10)  # Seconds
+METRIC_QUEUE_SIZE = config("METRIC_QUEUE_SIZE", cast=int, default=100000)
 
 # database
 DATABASE_HOSTNAME = config("DATABASE_HOSTNAME")
@@ -215,6 +245,8 @@ DATABASE_ENGINE_POOL_PING = config("DATABASE_ENGINE_POOL_PING", default=False)
 DATABASE_ENGINE_POOL_RECYCLE = config("DATABASE_ENGINE_POOL_RECYCLE", cast=int, default=3600)
 DATABASE_ENGINE_POOL_SIZE = config("DATABASE_ENGINE_POOL_SIZE", cast=int, default=20)
 DATABASE_ENGINE_POOL_TIMEOUT = config("DATABASE_ENGINE_POOL_TIMEOUT", cast=int, default=30)
+# How long the list of organization schemas is cached in memory
+DATABASE_SCHEMA_CACHE_TTL = config("DATABASE_SCHEMA_CACHE_TTL", cast=int, default=300)
 SQLALCHEMY_DATABASE_URI = f"postgresql+psycopg2://{_DATABASE_CREDENTIAL_USER}:{_QUOTED_DATABASE_PASSWORD}@{DATABASE_HOSTNAME}:{DATABASE_PORT}/{DATABASE_NAME}"
 
 ALEMBIC_CORE_REVISION_PATH = config(
@@ -17,6 +17,7 @@ from dispatch.ticket.models import Ticket
 from dispatch.types import Subject
 from dispatch.utils import deslug_and_capitalize_resource_type
 
+from . import index as conversation_index
 from .models import Conversation, ConversationCreate, ConversationUpdate
 from .service import create, update
 
@@ -96,6 +97,11 @@ def create_case_conversation(
             channel_id=conversation["id"],
         )
         case.conversation = create(db_session=db_session, conversation_in=conversation_in)
+        conversation_index.add(
+            case.conversation.channel_id,
+            case.conversation.thread_id,
+            organization_slug=case.project.organization.slug,
+        )
 
         event_service.log_case_event(
             db_session=db_session,
@@ -119,6 +125,12 @@ def create_case_conversation(
         update(
             db_session=db_session, conversation=case.conversation, conversation_in=conversation_in
         )
+        conversation_index.remove(thread_conversation_channel_id, thread_conversation_thread_id)
+        conversation_index.add(
+            case.conversation.channel_id,
+            case.conversation.thread_id,
+            organization_slug=case.project.organization.slug,
+        )
 
         event_service.log_case_event(
             db_session=db_session,
@@ -227,6 +239,9 @@ def create_incident_conversation(incident: Incident, db_session: Session):
         channel_id=external_conversation["id"],
     )
     incident.conversation = create(conversation_in=conversation_in, db_session=db_session)
+    conversation_index.add(
+        incident.conversation.channel_id, organization_slug=incident.project.organization.slug
+    )
 
     db_session.add(incident)
     db_session.commit()
@@ -0,0 +1,91 @@
+"""Index of conversation channel and thread ids to the organization owning the conversation.
+
+Conversations live in each organization's schema, so finding the conversation for a
+channel id would otherwise require querying every organization. The index remembers
+which organization a (channel id, thread id) pair resolved to, and briefly remembers
+pairs that could not be resolved at all.
+"""
+
+import logging
+import threading
+import time
+
+from cachetools import LRUCache, TTLCache
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from dispatch.config import CONVERSATION_INDEX_MISS_TTL, CONVERSATION_INDEX_SIZE
+from dispatch.database.core import get_organization_schema
+
+log = logging.getLogger(__name__)
+
+
+_organization_slugs = LRUCache(maxsize=CONVERSATION_INDEX_SIZE)
+# when each unresolved thread id expires by channel id
+_unresolved = TTLCache(maxsize=CONVERSATION_INDEX_SIZE, ttl=CONVERSATION_INDEX_MISS_TTL)
+_lock = threading.Lock()
+
+
+def get_organization_slug(channel_id: str, thread_id: str = None) -> str | None:
+    """Returns the organization slug a conversation was last resolved to."""
+    with _lock:
+        return _organization_slugs.get((channel_id, thread_id))
+
+
+def is_unresolved(channel_id: str, thread_id: str = None) -> bool:
+    """Returns whether the conversation recently could not be resolved to any organization."""
+    with _lock:
+        threads = _unresolved.get(channel_id)
+        return bool(threads) and threads.get(thread_id, 0) > time.monotonic()
+
+
+def add(channel_id: str, thread_id: str = None, *, organization_slug: str) -> None:
+    """Records the organization owning a conversation."""
+    with _lock:
+        _organization_slugs[(channel_id, thread_id)] = organization_slug
+        _unresolved.pop(channel_id, None)
+
+
+def add_unresolved(channel_id: str, thread_id: str = None) -> None:
+    """Records that a conversation could not be resolved to any organization."""
+    now = time.monotonic()
+    with _lock:
+        threads = {
+            t: expires_at
+            for t, expires_at in _unresolved.get(channel_id, {}).items()
+            if expires_at > now
+        }
+        threads[thread_id] = now + CONVERSATION_INDEX_MISS_TTL
+        _unresolved[channel_id] = threads
+
+
+def remove(channel_id: str, thread_id: str = None) -> None:
+    """Forgets the organization owning a conversation."""
+    with _lock:
+        _organization_slugs.pop((channel_id, thread_id), None)
+        _organization_slugs.pop((channel_id, None), None)
+
+
+def find_organization_slugs(
+    *, db_session: Session, channel_id: str, organization_slugs: list[str]
+) -> list[str]:
+    """Returns the organizations having a conversation with the given channel id.
+
+    All organization schemas are searched with a single query.
+    """
+    if not organization_slugs:
+        return []
+
+    preparer = db_session.get_bind().dialect.identifier_preparer
+    selects = [
+        f"SELECT {position} AS position FROM "
+        f"{preparer.quote_schema(get_organization_schema(slug))}.conversation "
+        "WHERE channel_id = :channel_id"
+        for position, slug in enumerate(organization_slugs)
+    ]
+    query = text(" UNION ALL ".join(selects))
+
+    positions = sorted(
+        {row.position for row in db_session.execute(query, {"channel_id": channel_id})}
+    )
+    return [organization_slugs[position] for position in positions]
@@ -7,11 +7,13 @@
 
 import functools
 import re
+import threading
+import time
 from contextlib import contextmanager
 
 from fastapi import Depends
 from pydantic import BaseModel, ValidationError
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import Engine, create_engine, inspect
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.orm import Session, object_session, sessionmaker, DeclarativeBase, declared_attr
 from sqlalchemy.sql.expression import true
@@ -20,6 +22,7 @@ from starlette.requests import Request
 from typing import Annotated, Any
 from dispatch import config
 from dispatch.search.fulltext import make_searchable
+from dispatch.database.enums import DISPATCH_ORGANIZATION_SCHEMA_PREFIX
 from dispatch.database.logging import SessionTracker
 
 
@@ -75,6 +78,81 @@ engine = create_db_engine(
 SessionLocal = sessionmaker(bind=engine)
 
 
+class SchemaRegistry:
+    """Caches the schema names known to the database.
+
+    Looking up the schema names requires a round-trip to the database catalog, so we keep
+    them in memory for `ttl` seconds. Lookups for unknown schemas trigger a refresh, at most
+    once every `miss_refresh_interval` seconds, so that schemas created by other processes
+    become visible without waiting for the ttl to expire.
+    """
+
+    def __init__(self, ttl: int, miss_refresh_interval: int = 5):
+        self.ttl = ttl
+        self.miss_refresh_interval = miss_refresh_interval
+        self._schema_names: frozenset[str] = frozenset()
+        self._refreshed_at: float | None = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> frozenset[str]:
+        """Reloads the schema names from the database."""
+        with self._lock:
+            self._schema_names = frozenset(inspect(engine).get_schema_names())
+            self._refreshed_at = time.monotonic()
+        return self._schema_names
+
+    def invalidate(self) -> None:
+        """Forces the next lookup to reload the schema names from the database."""
+        with self._lock:
+            self._refreshed_at = None
+
+    def exists(self, schema: str) -> bool:
+        """Returns whether the schema exists, consulting the database only when required."""
+        refreshed_at = self._refreshed_at
+        age = time.monotonic() - refreshed_at if refreshed_at is not None else None
+
+        if age is None or age > self.ttl:
+            return schema in self.refresh()
+
+        if schema in self._schema_names:
+            return True
+
+        if age > self.miss_refresh_interval:
+            return schema in self.refresh()
+
+        return False
+
+
+schema_registry = SchemaRegistry(ttl=config.DATABASE_SCHEMA_CACHE_TTL)
+
+
+def get_organization_schema(organization_slug: str) -> str:
+    """Returns the schema name for a given organization."""
+    return f"{DISPATCH_ORGANIZATION_SCHEMA_PREFIX}_{organization_slug}"
+
+
+@functools.lru_cache(maxsize=None)
+def get_organization_engine(organization_slug: str) -> Engine:
+    """Returns an engine translating tenant tables to the organization's schema.
+
+    The engine shares the connection pool of the default engine.
+    """
+    return engine.execution_options(
+        schema_translate_map={
+            None: get_organization_schema(organization_slug),
+        }
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_organization_sessionmaker(organization_slug: str) -> sessionmaker:
+    """Returns a session factory bound to the organization's schema.
+
+    The session factory is built once per organization and reused across requests.
+    """
+    return sessionmaker(bind=get_organization_engine(organization_slug))
+
+
 def resolve_table_name(name):
     """Resolves table names to their mapped names."""
     names = re.split("(?=[A-Z])", name)  # noqa
@@ -228,12 +306,7 @@ def ensure_unique_default_per_project(target, value, oldvalue, initiator):
 
 def refetch_db_session(organization_slug: str) -> Session:
     """Create a new database session for a specific organization."""
-    schema_engine = engine.execution_options(
-        schema_translate_map={
-            None: f"dispatch_organization_{organization_slug}",
-        }
-    )
-    session = sessionmaker(bind=schema_engine)()
+    session = get_organization_sessionmaker(organization_slug)()
     session._dispatch_session_id = SessionTracker.track_session(
         session, context=f"organization_{organization_slug}"
     )
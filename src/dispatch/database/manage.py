@@ -18,7 +18,7 @@ from dispatch.search.fulltext import (
     sync_trigger,
 )
 
-from .core import Base, sessionmaker
+from .core import Base, schema_registry, sessionmaker
 from .enums import DISPATCH_ORGANIZATION_SCHEMA_PREFIX
 
 
@@ -141,6 +141,9 @@ def init_schema(*, engine: Engine, organization: Organization) -> Organization:
     with engine.begin() as connection:
         connection.execute(CreateSchema(schema_name, if_not_exists=True))
 
+    # make the new schema visible to the api without waiting for the cache to expire
+    schema_registry.invalidate()
+
     # set the schema for table creation
     tables = get_tenant_tables()
 
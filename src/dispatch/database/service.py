@@ -506,16 +506,26 @@ def apply_filter_specific_joins(model: Base, filter_spec: dict, query: orm.query
     return query
 
 
-def composite_search(*, db_session, query_str: str, models: list[Base], current_user: DispatchUser):
-    """Perform a multi-table search based on the supplied query."""
-    s = CompositeSearch(db_session, models)
-    query = s.build_query(query_str, sort=True)
-
-    # TODO can we do this with composite filtering?
-    # for model in models:
-    #    query = apply_model_specific_filters(model, query, current_user)
+def composite_search(
+    *,
+    db_session,
+    query_str: str,
+    models: list[Base],
+    current_user: DispatchUser,
+    limit: int = None,
+    limit_per_type: int = None,
+    cursor: tuple = None,
+):
+    """Perform a multi-table search based on the supplied query.
 
-    return s.search(query=query)
+    Returns a page of results by type and the cursor of the next page, if any.
+    """
+    s = CompositeSearch(
+        db_session,
+        models,
+        filters={Incident: lambda query: restricted_incident_search_filter(query, current_user)},
+    )
+    return s.search_page(query_str, limit=limit, limit_per_type=limit_per_type, cursor=cursor)
 
 
 def search(*, query_str: str, query: Query, model: str, sort=False):
@@ -823,6 +833,24 @@ def restricted_incident_filter(query: orm.Query, current_user: DispatchUser, rol
     return query.distinct()
 
 
+def restricted_incident_search_filter(query: orm.Query, current_user: DispatchUser):
+    """Filters out the restricted incidents a user can't find with a search.
+
+    Users find open incidents, incidents they participate in, and any incident of the
+    projects they are an admin of.
+    """
+    admin_project_ids = [p.project_id for p in current_user.projects if p.role == UserRoles.admin]
+    return query.filter(
+        or_(
+            Incident.visibility == Visibility.open,
+            Incident.project_id.in_(admin_project_ids),
+            Incident.participants.any(
+                Participant.individual.has(IndividualContact.email == current_user.email)
+            ),
+        )
+    )
+
+
 def restricted_case_filter(query: orm.Query, current_user: DispatchUser, role: UserRoles):
     """Adds additional case filters to query (usually for permissions)."""
     if role == UserRoles.member:
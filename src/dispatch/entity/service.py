@@ -1,11 +1,13 @@
 from datetime import datetime, timedelta
 import logging
 import re
+import threading
 from collections.abc import Generator, Sequence
 from typing import NamedTuple
 import jsonpath_ng
+from cachetools import LRUCache
 from pydantic import ValidationError
-from sqlalchemy import desc
+from sqlalchemy import desc, insert, tuple_
 from sqlalchemy.orm import Session, joinedload
 
 from dispatch.project import service as project_service
@@ -244,14 +246,158 @@ def get_signal_instances_with_entities(
     return signal_instances
 
 
-EntityTypePair = NamedTuple(
-    "EntityTypePairTuple",
-    [
-        ("entity_type", EntityType),
-        ("regex", re.Pattern[str] | None),
-        ("json_path", jsonpath_ng.JSONPath | None),
-    ],
-)
+class CompiledEntityType(NamedTuple):
+    """The compiled expressions of an entity type and the sources they were compiled from."""
+
+    jpath: str | None
+    regular_expression: str | None
+    json_path: jsonpath_ng.JSONPath | None
+    regex: re.Pattern[str] | None
+
+
+_compiled_entity_types = LRUCache(maxsize=1024)
+_compiled_entity_types_lock = threading.Lock()
+
+
+def compile_entity_type(entity_type: EntityType) -> CompiledEntityType:
+    """Returns the compiled JSONPath and regular expression of an entity type.
+
+    Compiled expressions are cached per entity type, and recompiled when the entity
+    type's expressions change. Expressions that fail to compile are skipped.
+    """
+    cached = None
+    if entity_type.id is not None:
+        with _compiled_entity_types_lock:
+            cached = _compiled_entity_types.get(entity_type.id)
+    if (
+        cached
+        and cached.jpath == entity_type.jpath
+        and cached.regular_expression == entity_type.regular_expression
+    ):
+        return cached
+
+    json_path = None
+    if entity_type.jpath:
+        try:
+            json_path = jsonpath_ng.parse(entity_type.jpath)
+        except Exception as e:
+            log.warning(f"Unable to parse JSONPath {entity_type.jpath}: {e}")
+
+    regex = None
+    if entity_type.regular_expression:
+        try:
+            regex = re.compile(entity_type.regular_expression)
+        except re.error as e:
+            log.warning(
+                f"Unable to compile regular expression {entity_type.regular_expression}: {e}"
+            )
+
+    compiled = CompiledEntityType(
+        jpath=entity_type.jpath,
+        regular_expression=entity_type.regular_expression,
+        json_path=json_path,
+        regex=regex,
+    )
+    if entity_type.id is not None:
+        with _compiled_entity_types_lock:
+            _compiled_entity_types[entity_type.id] = compiled
+    return compiled
+
+
+def invalidate_entity_type(entity_type_id: int) -> None:
+    """Drops the compiled expressions cached for an entity type."""
+    with _compiled_entity_types_lock:
+        _compiled_entity_types.pop(entity_type_id, None)
+
+
+def _iter_strings(value) -> Generator[str, None, None]:
+    """Yields all the string values nested in a JSON value."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _iter_strings(v)
+    elif isinstance(value, list):
+        for v in value:
+            yield from _iter_strings(v)
+
+
+def _extract_values(signal_instance: SignalInstance, compiled: CompiledEntityType) -> set[str]:
+    """Returns the entity values an entity type extracts from a signal instance.
+
+    The JSONPath selects string values from the raw payload, or all of its string values
+    when the entity type has no JSONPath. The regular expression, if any, then extracts
+    values from those strings: its first group, or the whole match if it has no groups.
+    """
+    if compiled.json_path:
+        try:
+            strings = [
+                match.value
+                for match in compiled.json_path.find(signal_instance.raw)
+                if isinstance(match.value, str)
+            ]
+        except KeyError:
+            log.warning(
+                f"Unable to extract entity {compiled.jpath} is not a valid JSONPath for Instance {signal_instance.id}."
+                f"A KeyError usually occurs when the JSONPath includes a list index lookup against a dictionary value."
+                f"  Example: dictionary[0].value"
+            )
+            return set()
+        except Exception as e:
+            log.exception(
+                f"An error occurred while extracting entity {compiled.jpath} from Instance {signal_instance.id}: {str(e)}"
+            )
+            return set()
+    elif compiled.regex:
+        strings = _iter_strings(signal_instance.raw)
+    else:
+        return set()
+
+    if not compiled.regex:
+        return set(strings)
+
+    values = set()
+    for string in strings:
+        for match in compiled.regex.finditer(string):
+            value = match.group(1) if compiled.regex.groups else match.group(0)
+            if value:
+                values.add(value)
+    return values
+
+
+def get_by_values_or_create(
+    *, db_session: Session, project_id: int, values: list[tuple[int, str]]
+) -> list[Entity]:
+    """Gets or creates the entities for (entity type id, value) pairs in bulk.
+
+    Existing entities are fetched with a single query and the missing ones are created
+    with a single multi-row insert.
+    """
+    if not values:
+        return []
+
+    existing = {}
+    for entity in (
+        db_session.query(Entity)
+        .filter(tuple_(Entity.entity_type_id, Entity.value).in_(values))
+        .order_by(Entity.id)
+    ):
+        existing.setdefault((entity.entity_type_id, entity.value), entity)
+
+    missing = [key for key in values if key not in existing]
+    if missing:
+        created = db_session.scalars(
+            insert(Entity).returning(Entity),
+            [
+                {"entity_type_id": entity_type_id, "value": value, "project_id": project_id}
+                for entity_type_id, value in missing
+            ],
+        )
+        for entity in created:
+            existing[(entity.entity_type_id, entity.value)] = entity
+        db_session.commit()
+
+    return [existing[key] for key in values]
 
 
 def find_entities(
@@ -268,67 +414,30 @@ def find_entities(
     Returns:
         list[Entity]: A list of entities found in the SignalInstance.
     """
-
-    def _find_entities_by_jsonpath_expression(
-        signal_instance: SignalInstance,
-        entity_type_pairs: list[EntityTypePair],
-    ) -> Generator[EntityCreate, None, None]:
-        """
-        Yield entities found in a SignalInstance by searching its fields using regular expressions and JSONPath expressions.
-
-        Args:
-            signal_instance: The SignalInstance to extract entities from.
-            entity_type_pairs: A list of (entity_type, entity_regex, jpath) tuples to search for.
-
-        Yields:
-            EntityCreate: An entity found in the SignalInstance.
-        """
-        for entity_type, _, jpath in entity_type_pairs:
-            if jpath:
-                try:
-                    matches = jpath.find(signal_instance.raw)
-                    for match in matches:
-                        if isinstance(match.value, str):
-                            yield EntityCreate(
-                                id=None,
-                                value=match.value,
-                                entity_type=entity_type,
-                                project=signal_instance.project,
-                            )
-
-                except KeyError:
-                    log.warning(
-                        f"Unable to extract entity {str(jpath)} is not a valid JSONPath for Instance {signal_instance.id}."
-                        f"A KeyError usually occurs when the JSONPath includes a list index lookup against a dictionary value."
-                        f"  Example: dictionary[0].value"
-                    )
-                    continue
-                except Exception as e:  # Add this to handle general exceptions
-                    log.exception(
-                        f"An error occurred while extracting entity {str(jpath)} from Instance {signal_instance.id}: {str(e)}"
+    values = {}
+    entities_in = []
+    for entity_type in entity_types:
+        compiled = compile_entity_type(entity_type)
+        for value in _extract_values(signal_instance, compiled):
+            if entity_type.id is None:
+                # entity types that are not stored yet are created along with their entities
+                entities_in.append(
+                    EntityCreate(
+                        id=None,
+                        value=value,
+                        entity_type=entity_type,
+                        project=signal_instance.project,
                     )
-                    continue
-
-    # Create a list of (entity type, regular expression, jpath) tuples
-    entity_type_pairs = [
-        (
-            type,
-            re.compile(type.regular_expression) if type.regular_expression else None,
-            jsonpath_ng.parse(type.jpath) if type.jpath else None,
-        )
-        for type in entity_types
-        if isinstance(type.regular_expression, str) or type.jpath is not None
-    ]
-
-    entities = []
+                )
+            else:
+                values[(entity_type.id, value)] = None
 
-    entities.extend(_find_entities_by_jsonpath_expression(signal_instance, entity_type_pairs))
-
-    # Filter out duplicate entities
-    entities = list(set(entities))
-
-    entities_out = [
-        get_by_value_or_create(db_session=db_session, entity_in=entity_in) for entity_in in entities
-    ]
+    entities_out = get_by_values_or_create(
+        db_session=db_session, project_id=signal_instance.project_id, values=list(values)
+    )
+    entities_out.extend(
+        get_by_value_or_create(db_session=db_session, entity_in=entity_in)
+        for entity_in in entities_in
+    )
 
     return entities_out
@@ -141,6 +141,10 @@ def update(
     set_jpath(entity_type, entity_type_in)
 
     db_session.commit()
+
+    from dispatch.entity.service import invalidate_entity_type
+
+    invalidate_entity_type(entity_type.id)
     return entity_type
 
 
@@ -150,6 +154,10 @@ def delete(*, db_session: Session, entity_type_id: int) -> None:
     db_session.delete(entity_type)
     db_session.commit()
 
+    from dispatch.entity.service import invalidate_entity_type
+
+    invalidate_entity_type(entity_type_id)
+
 
 def set_jpath(entity_type: EntityType, entity_type_in: EntityTypeCreate):
     entity_type.jpath = ""
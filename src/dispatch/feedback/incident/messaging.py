@@ -15,18 +15,10 @@ from .models import Feedback
 log = logging.getLogger(__name__)
 
 
-def send_incident_feedback_daily_report(
-    commander_email: str, feedback: list[Feedback], project_id: int, db_session: Session
-):
-    """Sends an incident feedback daily report to all incident commanders who received feedback."""
-    plugin = plugin_service.get_active_instance(
-        db_session=db_session, project_id=project_id, plugin_type="email"
-    )
-
-    if not plugin:
-        log.warning("Incident feedback daily report not sent. Email plugin is not enabled.")
-        return
-
+def create_incident_feedback_daily_report(
+    commander_email: str, feedback: list[Feedback], owner_email: str
+) -> dict:
+    """Creates an incident feedback daily report for an incident commander who received feedback."""
     items = []
     for piece in feedback:
         participant = piece.participant.individual.name if piece.participant else "Anonymous"
@@ -42,41 +34,24 @@ def send_incident_feedback_daily_report(
         )
 
     name = subject = notification_text = "Incident Feedback Daily Report"
-    commander_fullname = feedback[0].incident.commander.individual.name
-    commander_weblink = feedback[0].incident.commander.individual.weblink
-
-    # Can raise exception "tenacity.RetryError: RetryError". (Email may still go through).
-    try:
-        plugin.instance.send(
-            commander_email,
-            notification_text,
-            INCIDENT_FEEDBACK_DAILY_REPORT,
-            MessageType.incident_feedback_daily_report,
-            name=name,
-            subject=subject,
-            cc=plugin.project.owner_email,
-            items=items,
-            contact_fullname=commander_fullname,
-            contact_weblink=commander_weblink,
-        )
-    except Exception as e:
-        log.error(f"Error in sending {notification_text} email to {commander_email}: {e}")
-
-    log.debug(f"Incident feedback daily report sent to {commander_email}.")
-
-
-def send_case_feedback_daily_report(
-    assignee_email: str, feedback: list[Feedback], project_id: int, db_session: Session
-):
-    """Sends an case feedback daily report to all case assignees who received feedback."""
-    plugin = plugin_service.get_active_instance(
-        db_session=db_session, project_id=project_id, plugin_type="email"
-    )
-
-    if not plugin:
-        log.warning("Case feedback daily report not sent. Email plugin is not enabled.")
-        return
-
+    return {
+        "recipient": commander_email,
+        "notification_text": notification_text,
+        "notification_template": INCIDENT_FEEDBACK_DAILY_REPORT,
+        "notification_type": MessageType.incident_feedback_daily_report,
+        "name": name,
+        "subject": subject,
+        "cc": owner_email,
+        "items": items,
+        "contact_fullname": feedback[0].incident.commander.individual.name,
+        "contact_weblink": feedback[0].incident.commander.individual.weblink,
+    }
+
+
+def create_case_feedback_daily_report(
+    assignee_email: str, feedback: list[Feedback], owner_email: str
+) -> dict:
+    """Creates a case feedback daily report for a case assignee who received feedback."""
     items = []
     for piece in feedback:
         participant = piece.participant.individual.name if piece.participant else "Anonymous"
@@ -92,24 +67,40 @@ def send_case_feedback_daily_report(
         )
 
     name = subject = notification_text = "Case Feedback Daily Report"
-    assignee_fullname = feedback[0].case.assignee.individual.name
-    assignee_weblink = feedback[0].case.assignee.individual.weblink
+    return {
+        "recipient": assignee_email,
+        "notification_text": notification_text,
+        "notification_template": CASE_FEEDBACK_DAILY_REPORT,
+        "notification_type": MessageType.case_feedback_daily_report,
+        "name": name,
+        "subject": subject,
+        "cc": owner_email,
+        "items": items,
+        "contact_fullname": feedback[0].case.assignee.individual.name,
+        "contact_weblink": feedback[0].case.assignee.individual.weblink,
+    }
+
+
+def send_feedback_daily_reports(reports: list[dict], project_id: int, db_session: Session):
+    """Sends feedback daily reports in a single batch."""
+    plugin = plugin_service.get_active_instance(
+        db_session=db_session, project_id=project_id, plugin_type="email"
+    )
+
+    if not plugin:
+        log.warning("Feedback daily reports not sent. Email plugin is not enabled.")
+        return
 
-    # Can raise exception "tenacity.RetryError: RetryError". (Email may still go through).
     try:
-        plugin.instance.send(
-            assignee_email,
-            notification_text,
-            CASE_FEEDBACK_DAILY_REPORT,
-            MessageType.case_feedback_daily_report,
-            name=name,
-            subject=subject,
-            cc=plugin.project.owner_email,
-            items=items,
-            contact_fullname=assignee_fullname,
-            contact_weblink=assignee_weblink,
-        )
+        results = plugin.instance.send_batch(reports)
     except Exception as e:
-        log.error(f"Error in sending {notification_text} email to {assignee_email}: {e}")
+        log.error(f"Error in sending feedback daily report emails: {e}")
+        return
 
-    log.debug(f"Case feedback daily report sent to {assignee_email}.")
+    for report, sent in zip(reports, results, strict=True):
+        if sent:
+            log.debug(f"{report['notification_text']} sent to {report['recipient']}.")
+        else:
+            log.error(
+                f"Error in sending {report['notification_text']} email to {report['recipient']}."
+            )
@@ -8,7 +8,11 @@ from dispatch.decorators import scheduled_project_task, timer
 from dispatch.project.models import Project
 from dispatch.scheduler import scheduler
 
-from .messaging import send_incident_feedback_daily_report, send_case_feedback_daily_report
+from .messaging import (
+    create_case_feedback_daily_report,
+    create_incident_feedback_daily_report,
+    send_feedback_daily_reports,
+)
 from .service import (
     get_all_incident_last_x_hours_by_project_id,
     get_all_case_last_x_hours_by_project_id,
@@ -43,6 +47,8 @@ def feedback_report_daily(db_session: Session, project: Project):
     Fetches all incident and case feedback provided in the last 24 hours
     and sends a daily report to the commanders and assignees who handled the incidents/cases.
     """
+    reports = []
+
     incident_feedback = get_all_incident_last_x_hours_by_project_id(
         db_session=db_session, project_id=project.id
     )
@@ -50,7 +56,11 @@ def feedback_report_daily(db_session: Session, project: Project):
     if incident_feedback:
         grouped_incident_feedback = group_feedback_by_commander(incident_feedback)
         for commander_email, feedback in grouped_incident_feedback.items():
-            send_incident_feedback_daily_report(commander_email, feedback, project.id, db_session)
+            reports.append(
+                create_incident_feedback_daily_report(
+                    commander_email, feedback, project.owner_email
+                )
+            )
 
     case_feedback = get_all_case_last_x_hours_by_project_id(
         db_session=db_session, project_id=project.id
@@ -59,4 +69,9 @@ def feedback_report_daily(db_session: Session, project: Project):
     if case_feedback:
         grouped_case_feedback = group_feedback_by_assignee(case_feedback)
         for assignee_email, feedback in grouped_case_feedback.items():
-            send_case_feedback_daily_report(assignee_email, feedback, project.id, db_session)
+            reports.append(
+                create_case_feedback_daily_report(assignee_email, feedback, project.owner_email)
+            )
+
+    if reports:
+        send_feedback_daily_reports(reports, project.id, db_session)
@@ -1,14 +1,18 @@
+import hashlib
 import json
 import logging
 import math
+import threading
 from calendar import monthrange
 from datetime import date
-from itertools import groupby
 
 import pandas as pd
-from sqlalchemy import and_
+from cachetools import TTLCache
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import distinct, func, select
 from statsmodels.tsa.api import ExponentialSmoothing
 
+from dispatch.config import INCIDENT_FORECAST_CACHE_TTL
 from dispatch.database.service import apply_filter_specific_joins, apply_filters
 from dispatch.incident.type.models import IncidentType
 
@@ -17,24 +21,30 @@ from .models import Incident
 log = logging.getLogger(__name__)
 
 
-def month_grouper(item):
-    """Determines the last day of a given month."""
-    key = date(
-        item.reported_at.year,
-        item.reported_at.month,
-        monthrange(item.reported_at.year, item.reported_at.month)[-1],
-    )
-    return key
+# (incidents version, forecast) by (organization slug, filter spec hash, month)
+_forecasts = TTLCache(maxsize=1024, ttl=INCIDENT_FORECAST_CACHE_TTL)
+_forecasts_lock = threading.Lock()
+
 
+def get_month_range(relative):
+    today = date.today()
+    relative_month = today - relativedelta(months=relative)
+    _, month_end_day = monthrange(relative_month.year, relative_month.month)
+    month_start = relative_month.replace(day=1)
+    month_end = relative_month.replace(day=month_end_day)
+    return month_start, month_end
 
-def create_incident_metric_query(
+
+def get_monthly_incident_counts(
     db_session,
     end_date: date,
-    start_date: date = None,
     filter_spec: list[dict] | str | None = None,
-):
-    """Fetches eligible incidents."""
-    query = db_session.query(Incident)
+) -> dict[date, int]:
+    """Counts the eligible incidents of each month up to the end date's month.
+
+    Returns the counts by the last day of the month, for months with incidents only.
+    """
+    query = db_session.query(Incident.id)
 
     if filter_spec:
         if isinstance(filter_spec, str):
@@ -42,27 +52,35 @@ def create_incident_metric_query(
         query = apply_filter_specific_joins(Incident, filter_spec, query)
         query = apply_filters(query, filter_spec)
 
-    if start_date:
-        query = query.filter(
-            and_(Incident.reported_at <= end_date, Incident.reported_at >= start_date)
+    # exclude incident types
+    query = query.filter(
+        Incident.incident_type_id.in_(
+            select(IncidentType.id).where(IncidentType.exclude_from_metrics.isnot(True))
         )
-    else:
-        query = query.filter(Incident.reported_at <= end_date)
+    )
 
-    # exclude incident types
-    query = query.filter(IncidentType.exclude_from_metrics.isnot(True))
-    return query.all()
+    month = func.date_trunc("month", Incident.reported_at)
+    query = (
+        query.filter(Incident.reported_at < end_date.replace(day=1) + relativedelta(months=1))
+        .with_entities(month, func.count(distinct(Incident.id)))
+        .group_by(month)
+    )
+
+    return {date(m.year, m.month, monthrange(m.year, m.month)[-1]): count for m, count in query}
 
 
-def make_forecast(incidents: list[Incident]):
-    """Makes an incident forecast."""
-    incidents_sorted = sorted(incidents, key=month_grouper)
+def get_incidents_version(db_session) -> tuple:
+    """Returns a value that changes whenever incidents are created, updated or deleted."""
+    return tuple(db_session.query(func.count(Incident.id), func.max(Incident.updated_at)).one())
 
+
+def make_forecast(monthly_counts: dict[date, int]):
+    """Makes an incident forecast from the incident counts by month."""
     dataframe_dict = {"ds": [], "y": []}
 
-    for last_day, items in groupby(incidents_sorted, month_grouper):
+    for last_day, count in sorted(monthly_counts.items()):
         dataframe_dict["ds"].append(str(last_day))
-        dataframe_dict["y"].append(len(list(items)))
+        dataframe_dict["y"].append(count)
 
     dataframe = pd.DataFrame.from_dict(dataframe_dict)
 
@@ -100,3 +118,79 @@ def make_forecast(incidents: list[Incident]):
         return categories, predicted_counts
     else:
         return [], []
+
+
+def get_incident_forecast(
+    db_session, organization_slug: str, filter_spec: list[dict] | str | None = None
+) -> dict:
+    """Returns the predicted and actual incident counts of the last months and the next ones.
+
+    The incident counts are fetched once and the forecast is cached per organization,
+    filter spec and month, until incidents are created, updated or deleted by any process.
+    """
+    filter_spec_hash = hashlib.sha256(
+        (
+            filter_spec
+            if isinstance(filter_spec, str)
+            else json.dumps(filter_spec, sort_keys=True, default=str)
+        ).encode("utf-8")
+    ).hexdigest()
+    key = (organization_slug, filter_spec_hash, date.today().strftime("%Y-%m"))
+    version = get_incidents_version(db_session)
+    with _forecasts_lock:
+        cached = _forecasts.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    _, end_date = get_month_range(1)
+    monthly_counts = get_monthly_incident_counts(
+        db_session=db_session, end_date=end_date, filter_spec=filter_spec
+    )
+
+    categories = []
+    predicted = []
+    actual = []
+
+    for i in reversed(range(1, 5)):
+        _, end_date = get_month_range(i)
+        counts = {month: count for month, count in monthly_counts.items() if month <= end_date}
+        predicted_months, predicted_counts = make_forecast(monthly_counts=counts)
+
+        if i == 1:
+            categories = categories + predicted_months
+            predicted = predicted + predicted_counts
+        # get only first predicted month for completed months
+        elif predicted_months and predicted_counts:
+            categories.append(predicted_months[0])
+            predicted.append(predicted_counts[0])
+
+        # get actual month counts
+        actual.append(monthly_counts.get(end_date, 0))
+
+    if not (len(predicted)):
+        forecast = {
+            "categories": categories,
+            "series": [
+                {"name": "Predicted", "data": []},
+                {"name": "Actual", "data": []},
+            ],
+        }
+    else:
+        forecast = {
+            "categories": categories,
+            "series": [
+                {"name": "Predicted", "data": predicted},
+                {"name": "Actual", "data": actual[1:]},
+            ],
+        }
+
+    with _forecasts_lock:
+        _forecasts[key] = (version, forecast)
+    return forecast
+
+
+def invalidate_incident_forecasts(organization_slug: str | None = None) -> None:
+    """Drops the cached forecasts of an organization, or of all organizations."""
+    with _forecasts_lock:
+        for key in [key for key in _forecasts if organization_slug in (None, key[0])]:
+            _forecasts.pop(key, None)
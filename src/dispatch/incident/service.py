@@ -209,6 +209,11 @@ def create(*, db_session: Session, incident_in: IncidentCreate) -> Incident:
     db_session.add(incident)
     db_session.commit()
 
+    # the new incident changes the incident forecasts
+    from .metrics import invalidate_incident_forecasts
+
+    invalidate_incident_forecasts(project.organization.slug)
+
     reporter_name = incident_in.reporter.individual.name if incident_in.reporter else ""
 
     event_service.log_incident_event(
@@ -420,6 +425,11 @@ def update(*, db_session: Session, incident: Incident, incident_in: IncidentUpda
 
     db_session.commit()
 
+    # the incident type, status or report time may change the incident forecasts
+    from .metrics import invalidate_incident_forecasts
+
+    invalidate_incident_forecasts(incident.project.organization.slug)
+
     return incident
 
 
@@ -427,3 +437,8 @@ def delete(*, db_session: Session, incident_id: int):
     """Deletes an existing incident."""
     db_session.query(Incident).filter(Incident.id == incident_id).delete()
     db_session.commit()
+
+    # the organization of the incident is not known here, deletes are rare
+    from .metrics import invalidate_incident_forecasts
+
+    invalidate_incident_forecasts()
@@ -1,9 +1,6 @@
-import calendar
-import json
 import logging
-from datetime import date, datetime
+from datetime import datetime
 from typing import Annotated
-from dateutil.relativedelta import relativedelta
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from sqlalchemy.exc import IntegrityError
 from starlette.requests import Request
@@ -17,7 +14,7 @@ from dispatch.auth.permissions import (
     PermissionsDependency,
 )
 from dispatch.auth.service import CurrentUser
-from dispatch.common.utils.views import create_pydantic_include
+from dispatch.common.utils.views import create_pagination_response
 from dispatch.database.core import DbSession
 from dispatch.database.service import CommonParameters, search_filter_sort_paginate
 from dispatch.event import flows as event_flows
@@ -41,7 +38,7 @@ from .flows import (
     incident_subscribe_participant_flow,
     incident_update_flow,
 )
-from .metrics import create_incident_metric_query, make_forecast
+from . import metrics
 from .models import (
     Incident,
     IncidentCreate,
@@ -81,20 +78,10 @@ def get_incidents(
     pagination = search_filter_sort_paginate(model="Incident", **common)
 
     if expand:
-        return json.loads(IncidentExpandedPagination(**pagination).json())
-
+        return create_pagination_response(IncidentExpandedPagination, pagination)
     if include:
-        # only allow two levels for now
-        include_sets = create_pydantic_include(include)
-
-        include_fields = {
-            "items": {"__all__": include_sets},
-            "itemsPerPage": ...,
-            "page": ...,
-            "total": ...,
-        }
-        return json.loads(IncidentExpandedPagination(**pagination).json(include=include_fields))
-    return json.loads(IncidentPagination(**pagination).json())
+        return create_pagination_response(IncidentExpandedPagination, pagination, include)
+    return create_pagination_response(IncidentPagination, pagination)
 
 
 @router.get(
@@ -447,75 +434,18 @@ def delete_custom_event(
     )
 
 
-def get_month_range(relative):
-    today = date.today()
-    relative_month = today - relativedelta(months=relative)
-    _, month_end_day = calendar.monthrange(relative_month.year, relative_month.month)
-    month_start = relative_month.replace(day=1)
-    month_end = relative_month.replace(day=month_end_day)
-    return month_start, month_end
-
-
 @router.get("/metric/forecast", summary="Gets incident forecast data.")
 def get_incident_forecast(
     db_session: DbSession,
+    organization: OrganizationSlug,
     common: CommonParameters,
 ):
     """Gets incident forecast data."""
-    categories = []
-    predicted = []
-    actual = []
-
-    for i in reversed(range(1, 5)):
-        start_date, end_date = get_month_range(i)
-
-        if i == 1:
-            incidents = create_incident_metric_query(
-                db_session=db_session,
-                filter_spec=common["filter_spec"],
-                end_date=end_date,
-            )
-            predicted_months, predicted_counts = make_forecast(incidents=incidents)
-            categories = categories + predicted_months
-            predicted = predicted + predicted_counts
-
-        else:
-            incidents = create_incident_metric_query(
-                db_session=db_session, filter_spec=common["filter_spec"], end_date=end_date
-            )
-
-            # get only first predicted month for completed months
-            predicted_months, predicted_counts = make_forecast(incidents=incidents)
-            if predicted_months and predicted_counts:
-                categories.append(predicted_months[0])
-                predicted.append(predicted_counts[0])
-
-        # get actual month counts
-        incidents = create_incident_metric_query(
-            db_session=db_session,
-            filter_spec=common["filter_spec"],
-            end_date=end_date,
-            start_date=start_date,
-        )
-
-        actual.append(len(incidents))
-
-    if not (len(predicted)):
-        return {
-            "categories": categories,
-            "series": [
-                {"name": "Predicted", "data": []},
-                {"name": "Actual", "data": []},
-            ],
-        }
-
-    return {
-        "categories": categories,
-        "series": [
-            {"name": "Predicted", "data": predicted},
-            {"name": "Actual", "data": actual[1:]},
-        ],
-    }
+    return metrics.get_incident_forecast(
+        db_session=db_session,
+        organization_slug=organization,
+        filter_spec=common["filter_spec"],
+    )
 
 
 @router.get(
@@ -2,9 +2,10 @@ from datetime import datetime, timedelta, timezone
 import logging
 import math
 
+from sqlalchemy import and_, insert, or_, select, update as sql_update
 from sqlalchemy.orm import Session
 
-from dispatch.cost_model.models import CostModelActivity
+from dispatch.cost_model.models import CostModel, CostModelActivity
 from dispatch.incident import service as incident_service
 from dispatch.incident.enums import IncidentStatus
 from dispatch.incident.models import Incident
@@ -12,11 +13,12 @@ from dispatch.incident.type.models import IncidentType
 from dispatch.incident_cost_type import service as incident_cost_type_service
 from dispatch.incident_cost_type.models import IncidentCostTypeRead
 from dispatch.participant import service as participant_service
-from dispatch.participant.models import ParticipantRead
+from dispatch.participant.models import Participant, ParticipantRead
 from dispatch.participant_activity import service as participant_activity_service
 from dispatch.participant_activity.models import ParticipantActivityCreate
 from dispatch.participant_role.models import ParticipantRoleType, ParticipantRole
 from dispatch.plugin import service as plugin_service
+from dispatch.project.models import Project
 
 from .models import IncidentCost, IncidentCostCreate, IncidentCostUpdate
 
@@ -320,39 +322,66 @@ def get_participant_role_time_seconds(
     Returns:
         float: The time spent by the participant in the incident role in seconds.
     """
-    if participant_role.renounced_at and participant_role.renounced_at < start_at:
+    return calculate_participant_role_time_seconds(
+        role=participant_role.role,
+        assumed_at=participant_role.assumed_at,
+        renounced_at=participant_role.renounced_at,
+        activity=participant_role.activity,
+        incident_status=incident.status,
+        incident_stable_at=incident.stable_at,
+        start_at=start_at,
+    )
+
+
+def calculate_participant_role_time_seconds(
+    *,
+    role: str,
+    assumed_at: datetime,
+    renounced_at: datetime | None,
+    activity: int | None,
+    incident_status: str,
+    incident_stable_at: datetime | None,
+    start_at: datetime,
+    now: datetime | None = None,
+) -> float:
+    """Calculates the time spent in an incident role starting from a given time.
+
+    See `get_participant_role_time_seconds`. Takes the plain column values, so the time of many
+    roles can be calculated from a single query.
+    """
+    if renounced_at and renounced_at < start_at:
         # skip calculating already-recorded activity
         return 0
 
-    if participant_role.role == ParticipantRoleType.observer:
+    if role == ParticipantRoleType.observer:
         # skip calculating cost for participants with the observer role
         return 0
 
-    if participant_role.activity == 0:
+    if activity == 0:
         # skip calculating cost for roles that have no activity
         return 0
 
-    participant_role_assumed_at = participant_role.assumed_at
+    participant_role_assumed_at = assumed_at
 
     # we set the renounced_at default time to the current time
-    participant_role_renounced_at = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+    participant_role_renounced_at = now or datetime.now(tz=timezone.utc).replace(tzinfo=None)
 
-    if incident.status == IncidentStatus.active:
-        if participant_role.renounced_at:
+    if incident_status == IncidentStatus.active:
+        if renounced_at:
             # the participant left the conversation or got assigned another role
             # we use the role's renounced_at time
-            participant_role_renounced_at = participant_role.renounced_at
+            participant_role_renounced_at = renounced_at
     else:
         # we set the renounced_at default time to the stable_at time if the stable_at time exists
-        if incident.stable_at:
-            participant_role_renounced_at = incident.stable_at
+        if incident_stable_at:
+            participant_role_renounced_at = incident_stable_at
 
-        if participant_role.renounced_at:
+        if renounced_at:
             # the participant left the conversation or got assigned another role
-            if participant_role.renounced_at < participant_role_renounced_at:
+            if renounced_at < participant_role_renounced_at:
                 # we use the role's renounced_at time if it happened before the
                 # incident was marked as stable or closed
-                participant_role_renounced_at = participant_role.renounced_at
+                participant_role_renounced_at = renounced_at
 
     # the time the participant has spent in the incident role since the last incident cost update
     participant_role_time = participant_role_renounced_at - max(
@@ -374,11 +403,7 @@ def get_participant_role_time_seconds(
 
     # we make the assumption that participants spend more or less time based on their role
     # and we adjust the time spent based on that
-    return (
-        participant_role_time_hours
-        * SECONDS_IN_HOUR
-        * get_engagement_multiplier(participant_role.role)
-    )
+    return participant_role_time_hours * SECONDS_IN_HOUR * get_engagement_multiplier(role)
 
 
 def get_total_participant_roles_time_seconds(incident: Incident, start_at: datetime) -> int:
@@ -521,3 +546,203 @@ def update_incident_response_cost(
         db_session.commit()
 
     return incident_response_cost.amount
+
+
+def get_outdated_incident_response_costs(
+    *, db_session: Session, project_id: int, incident_cost_type_id: int
+):
+    """Returns the incidents whose response cost may have changed since it was last updated.
+
+    That is, incidents without a response cost, active incidents, and incidents that were
+    marked as stable after their response cost was last updated. Time spent in the roles of
+    any other incident ends before the response cost was last updated, so it cannot change.
+    """
+    return db_session.execute(
+        select(
+            Incident.id.label("incident_id"),
+            Incident.status,
+            Incident.stable_at,
+            Incident.created_at,
+            IncidentCost.id.label("incident_cost_id"),
+            IncidentCost.amount,
+            IncidentCost.updated_at,
+            CostModel.enabled.label("cost_model_enabled"),
+        )
+        .join(IncidentType, IncidentType.id == Incident.incident_type_id)
+        .outerjoin(CostModel, CostModel.id == IncidentType.cost_model_id)
+        .outerjoin(
+            IncidentCost,
+            and_(
+                IncidentCost.incident_id == Incident.id,
+                IncidentCost.incident_cost_type_id == incident_cost_type_id,
+            ),
+        )
+        .where(Incident.project_id == project_id)
+        .where(
+            or_(
+                IncidentCost.id.is_(None),
+                Incident.status == IncidentStatus.active,
+                Incident.stable_at.is_(None),
+                IncidentCost.updated_at <= Incident.stable_at,
+            )
+        )
+    ).all()
+
+
+def get_participant_roles_by_incident_id(
+    *, db_session: Session, incident_ids: list[int]
+) -> dict[int, list]:
+    """Returns the participant roles of the given incidents that may incur a response cost."""
+    rows = db_session.execute(
+        select(
+            Participant.incident_id,
+            ParticipantRole.role,
+            ParticipantRole.assumed_at,
+            ParticipantRole.renounced_at,
+            ParticipantRole.activity,
+        )
+        .join(Participant, Participant.id == ParticipantRole.participant_id)
+        .where(Participant.incident_id.in_(incident_ids))
+        .where(ParticipantRole.role != ParticipantRoleType.observer)
+        .where(or_(ParticipantRole.activity.is_(None), ParticipantRole.activity != 0))
+    )
+
+    participant_roles = {}
+    for row in rows:
+        participant_roles.setdefault(row.incident_id, []).append(row)
+    return participant_roles
+
+
+def update_incidents_response_cost(
+    *, db_session: Session, project: Project, incident_cost_type_id: int
+) -> int:
+    """Updates the response cost of all incidents of a project whose cost may have changed.
+
+    Incidents using the classic cost model are calculated from a single query of their
+    participant roles, and their response costs are created and updated in bulk. Incidents
+    with a cost model fetch their activity from plugins, and are updated one at a time. An
+    incident whose cost can't be calculated or saved is logged and skipped.
+
+    Returns:
+        int: The number of incident response costs created or updated.
+    """
+    now = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+    incidents = get_outdated_incident_response_costs(
+        db_session=db_session, project_id=project.id, incident_cost_type_id=incident_cost_type_id
+    )
+
+    classic_incidents = [i for i in incidents if not i.cost_model_enabled]
+    participant_roles = get_participant_roles_by_incident_id(
+        db_session=db_session, incident_ids=[i.incident_id for i in classic_incidents]
+    )
+    hourly_rate = get_hourly_rate(project)
+
+    incident_costs_in = []
+    incident_costs_update = []
+    for incident in classic_incidents:
+        try:
+            amount = _calculate_classic_response_cost(
+                incident=incident,
+                participant_roles=participant_roles.get(incident.incident_id, []),
+                hourly_rate=hourly_rate,
+                now=now,
+            )
+        except Exception as e:
+            # we shouldn't fail to update all incidents when one fails
+            log.exception(
+                f"Unable to calculate the response cost of incident {incident.incident_id}: {e}"
+            )
+            continue
+
+        if not incident.incident_cost_id:
+            incident_costs_in.append(
+                {
+                    "amount": amount,
+                    "incident_id": incident.incident_id,
+                    "incident_cost_type_id": incident_cost_type_id,
+                    "project_id": project.id,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+        elif incident.amount is None or float(incident.amount) != amount:
+            incident_costs_update.append(
+                {"id": incident.incident_cost_id, "amount": amount, "updated_at": now}
+            )
+
+    updated = _write_incident_cost_rows(db_session, insert(IncidentCost), incident_costs_in)
+    updated += _write_incident_cost_rows(
+        db_session, sql_update(IncidentCost), incident_costs_update
+    )
+    db_session.commit()
+
+    for incident in incidents:
+        if not incident.cost_model_enabled:
+            continue
+        try:
+            update_incident_response_cost(incident_id=incident.incident_id, db_session=db_session)
+            updated += 1
+        except Exception as e:
+            # we shouldn't fail to update all incidents when one fails
+            log.exception(e)
+            db_session.rollback()
+
+    return updated
+
+
+def _calculate_classic_response_cost(
+    *, incident, participant_roles: list, hourly_rate: int, now: datetime
+) -> float:
+    """Returns the response cost of an incident using the classic cost model."""
+    # activity before the last response cost update was already accounted for
+    start_at = incident.created_at
+    if incident.incident_cost_id and incident.updated_at < now:
+        start_at = incident.updated_at
+
+    total_response_time_seconds = sum(
+        calculate_participant_role_time_seconds(
+            role=participant_role.role,
+            assumed_at=participant_role.assumed_at,
+            renounced_at=participant_role.renounced_at,
+            activity=participant_role.activity,
+            incident_status=incident.status,
+            incident_stable_at=incident.stable_at,
+            start_at=start_at,
+            now=now,
+        )
+        for participant_role in participant_roles
+    )
+    return round(
+        float(incident.amount or 0)
+        + calculate_response_cost(
+            hourly_rate=hourly_rate, total_response_time_seconds=total_response_time_seconds
+        ),
+        2,
+    )
+
+
+def _write_incident_cost_rows(db_session: Session, stmt, rows: list[dict]) -> int:
+    """Executes an incident cost insert or update for rows, and returns the number written.
+
+    The rows are written in bulk, falling back to one row at a time if the bulk statement fails.
+    """
+    if not rows:
+        return 0
+
+    try:
+        with db_session.begin_nested():
+            db_session.execute(stmt, rows)
+        return len(rows)
+    except Exception as e:
+        # a single bad row fails the whole statement, so the rows are written one by one
+        log.warning(f"Unable to write incident response costs in bulk, writing one by one: {e}")
+
+    written = 0
+    for row in rows:
+        try:
+            with db_session.begin_nested():
+                db_session.execute(stmt, [row])
+            written += 1
+        except Exception as e:
+            log.exception(f"Unable to write incident response cost {row}: {e}")
+    return written
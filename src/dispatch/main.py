@@ -11,21 +11,23 @@ from pydantic import ValidationError
 from sentry_asgi import SentryMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from sqlalchemy import inspect
-from sqlalchemy.orm import scoped_session, sessionmaker
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
 from starlette.responses import FileResponse, Response, StreamingResponse
-from starlette.routing import compile_path
 from starlette.staticfiles import StaticFiles
 
 from .api import api_router
 from .common.utils.cli import install_plugin_events, install_plugins
+from .common.utils.routing import PathParamsMatcher
 from .config import (
     STATIC_DIR,
 )
-from .database.core import engine
+from .database.core import (
+    get_organization_schema,
+    get_organization_sessionmaker,
+    schema_registry,
+)
 from .database.logging import SessionTracker
 from .extensions import configure_extensions
 from .logging import configure_logging
@@ -84,15 +86,13 @@ api = FastAPI(
 api.add_middleware(GZipMiddleware, minimum_size=1000)
 
 
-def get_path_params_from_request(request: Request) -> str:
-    path_params = {}
-    for r in api_router.routes:
-        path_regex, path_format, param_converters = compile_path(r.path)
-        path = request["path"].removeprefix("/api/v1")  # remove the /api/v1 for matching
-        match = path_regex.match(path)
-        if match:
-            path_params = match.groupdict()
-    return path_params
+# built once all routes have been added to the api router, see below
+path_params_matcher: PathParamsMatcher | None = None
+
+
+def get_path_params_from_request(request: Request) -> dict[str, str]:
+    path = request["path"].removeprefix("/api/v1")  # remove the /api/v1 for matching
+    return path_params_matcher.match(path)
 
 
 def get_path_template(request: Request) -> str:
@@ -116,7 +116,6 @@ async def db_session_middleware(request: Request, call_next):
     # we create a per-request id such that we can ensure that our session is scoped for a particular request.
     # see: https://github.com/tiangolo/fastapi/issues/726
     ctx_token = _request_id_ctx_var.set(request_id)
-    session = None
 
     try:
         path_params = get_path_params_from_request(request)
@@ -124,25 +123,17 @@ async def db_session_middleware(request: Request, call_next):
         # if this call is organization specific set the correct search path
         organization_slug = path_params.get("organization", "default")
         request.state.organization = organization_slug
-        schema = f"dispatch_organization_{organization_slug}"
+        schema = get_organization_schema(organization_slug)
 
         # validate slug exists
-        schema_names = inspect(engine).get_schema_names()
-        if schema not in schema_names:
+        if not schema_registry.exists(schema):
             return JSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={"detail": [{"msg": f"Unknown database schema name: {schema}"}]},
             )
 
-        # add correct schema mapping depending on the request
-        schema_engine = engine.execution_options(
-            schema_translate_map={
-                None: schema,
-            }
-        )
-
-        session = scoped_session(sessionmaker(bind=schema_engine), scopefunc=get_request_id)
-        request.state.db = session()
+        # we reuse a session factory bound to the organization's schema
+        request.state.db = get_organization_sessionmaker(organization_slug)()
 
         # we track the session
         request.state.db._dispatch_session_id = SessionTracker.track_session(
@@ -180,8 +171,6 @@ async def db_session_middleware(request: Request, call_next):
             # Close the session
             try:
                 request.state.db.close()
-                if session is not None:
-                    session.remove()  # Remove the session from the registry
             except Exception as close_error:
                 logging.error(f"Error closing database session: {close_error}")
 
@@ -258,6 +247,9 @@ install_plugins()
 # we add all the plugin event API routes to the API router
 install_plugin_events(api_router)
 
+# we precompile the routes used to extract path params in the db session middleware
+path_params_matcher = PathParamsMatcher(api_router.routes)
+
 # we add all API routes to the Web API framework
 api.include_router(api_router)
 
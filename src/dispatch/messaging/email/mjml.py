@@ -0,0 +1,214 @@
+"""Renders MJML to HTML with long-lived node processes.
+
+Starting the mjml cli for every email costs far more than the rendering itself, so a small
+pool of node processes is kept running, each rendering one document at a time over stdin and
+stdout. Rendered HTML is cached by the MJML source, as the same email is often sent to many
+recipients. If node processes can't be started, the mjml cli is used instead.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import queue
+import subprocess
+import tempfile
+import threading
+
+from cachetools import LRUCache
+
+from dispatch.config import MJML_PATH, MJML_WORKERS
+
+log = logging.getLogger(__name__)
+
+RENDERER_SCRIPT = os.path.join(os.path.dirname(os.path.realpath(__file__)), "mjml_renderer.js")
+
+# seconds a node process is given to render a document before it is considered hung
+RENDER_TIMEOUT = 30
+
+
+class MjmlException(Exception):
+    pass
+
+
+class MjmlRendererExited(MjmlException):
+    pass
+
+
+class MjmlRendererTimeout(MjmlException):
+    pass
+
+
+class _MjmlWorker(object):
+    """A node process rendering MJML documents, one at a time.
+
+    The responses are read by a thread, so that a hung process can't block its caller.
+    """
+
+    def __init__(self, args: list[str] | None = None, timeout: float = RENDER_TIMEOUT):
+        self.rendered = 0
+        self.timeout = timeout
+        self.process = subprocess.Popen(
+            args or ["node", RENDERER_SCRIPT, os.path.join(MJML_PATH, "..", "mjml")],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+        )
+        self.lines = queue.Queue()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        for line in self.process.stdout:
+            self.lines.put(line)
+        self.lines.put(None)
+
+    def render(self, mjml: str) -> str:
+        try:
+            self.process.stdin.write(json.dumps({"mjml": mjml}) + "\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, ValueError) as e:
+            raise MjmlRendererExited("MJML renderer process exited.") from e
+
+        try:
+            line = self.lines.get(timeout=self.timeout)
+        except queue.Empty as e:
+            raise MjmlRendererTimeout(
+                f"MJML renderer process did not respond within {self.timeout} seconds."
+            ) from e
+        if not line:
+            raise MjmlRendererExited("MJML renderer process exited.")
+
+        self.rendered += 1
+        response = json.loads(line)
+        if response["errors"]:
+            log.error("\n".join(response["errors"]))
+            raise MjmlException("MJML template processing failed.")
+        return response["html"]
+
+    def close(self):
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except Exception:
+            self.process.kill()
+
+    def kill(self):
+        self.process.kill()
+        self.process.wait()
+
+
+class MjmlRenderer(object):
+    """Renders MJML documents with a pool of node processes, started on demand."""
+
+    def __init__(self, workers: int = 2, cache_size: int = 256, timeout: float = RENDER_TIMEOUT):
+        self.workers = workers
+        self.timeout = timeout
+        self.started = 0
+        self.idle = queue.LifoQueue()
+        self.cache = LRUCache(maxsize=cache_size)
+        self.lock = threading.Lock()
+        self.disabled = False
+
+    def _checkout(self) -> _MjmlWorker | None:
+        """Returns an idle worker, starting one if the pool isn't full, or None if disabled."""
+        while not self.disabled:
+            try:
+                return self.idle.get_nowait()
+            except queue.Empty:
+                pass
+
+            with self.lock:
+                start = self.started < self.workers
+                if start:
+                    self.started += 1
+
+            if not start:
+                # workers that exit are discarded, so we wait for one to be returned or discarded
+                try:
+                    return self.idle.get(timeout=1)
+                except queue.Empty:
+                    continue
+
+            try:
+                return _MjmlWorker(timeout=self.timeout)
+            except OSError as e:
+                log.warning(f"Unable to start the MJML renderer, using the mjml cli instead: {e}")
+                with self.lock:
+                    self.started -= 1
+                self.disabled = True
+        return None
+
+    def _discard(self, worker: _MjmlWorker, kill: bool = False) -> None:
+        if kill:
+            worker.kill()
+        else:
+            worker.close()
+        with self.lock:
+            self.started -= 1
+
+    def render(self, mjml: str) -> str:
+        """Renders an MJML document to HTML."""
+        key = hashlib.sha256(mjml.encode("utf-8")).digest()
+        with self.lock:
+            html = self.cache.get(key)
+        if html is not None:
+            return html
+
+        worker = self._checkout()
+        if worker is None:
+            html = render_with_cli(mjml)
+        else:
+            try:
+                html = worker.render(mjml)
+                self.idle.put(worker)
+            except MjmlRendererTimeout as e:
+                log.warning(f"{e} Using the mjml cli instead.")
+                self._discard(worker, kill=True)
+                html = render_with_cli(mjml)
+            except MjmlRendererExited:
+                self._discard(worker)
+                if not worker.rendered:
+                    # the renderer can't run here, e.g. the mjml package is missing
+                    log.warning("MJML renderer exited on start, using the mjml cli instead.")
+                    self.disabled = True
+                html = render_with_cli(mjml)
+            except MjmlException:
+                self.idle.put(worker)
+                raise
+            except Exception:
+                self._discard(worker)
+                raise
+
+        if self.cache.maxsize:
+            with self.lock:
+                self.cache[key] = html
+        return html
+
+    def close(self) -> None:
+        """Stops the node processes that are idle."""
+        while True:
+            try:
+                self._discard(self.idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+def render_with_cli(mjml: str) -> str:
+    """Uses the mjml cli to create html."""
+    with tempfile.NamedTemporaryFile("w+") as fp:
+        fp.write(mjml)
+        fp.flush()
+        process = subprocess.run(
+            ["./mjml", fp.name, "-s"],
+            cwd=MJML_PATH,
+            capture_output=True,
+            timeout=RENDER_TIMEOUT,
+        )
+        if process.stderr:
+            log.error(process.stderr.decode("utf-8"))
+            raise MjmlException("MJML template processing failed.")
+        return process.stdout.decode("utf-8")
+
+
+renderer = MjmlRenderer(workers=MJML_WORKERS)
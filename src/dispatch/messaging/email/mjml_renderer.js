@@ -0,0 +1,19 @@
+// Renders MJML documents for dispatch.messaging.email.mjml.
+// Reads one JSON request per line on stdin and writes one JSON response per line on stdout.
+// usage: node mjml_renderer.js <path to the mjml package>
+const readline = require("readline");
+const mjml2html = require(process.argv[2]);
+
+const lines = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+
+lines.on("line", (line) => {
+  let response;
+  try {
+    const { mjml } = JSON.parse(line);
+    const { html, errors } = mjml2html(mjml, { validationLevel: "soft" });
+    response = { html, errors: errors.map((error) => error.formattedMessage) };
+  } catch (error) {
+    response = { html: null, errors: [String(error)] };
+  }
+  process.stdout.write(JSON.stringify(response) + "\n");
+});
@@ -1,11 +1,7 @@
 import logging
 import os
-import subprocess
-import tempfile
 
 import jinja2.exceptions
-from dispatch.config import MJML_PATH
-
 
 from dispatch.messaging.strings import (
     EVERGREEN_REMINDER_DESCRIPTION,
@@ -17,6 +13,7 @@ from dispatch.messaging.strings import (
     render_message_template,
 )
 
+from . import mjml
 from .filters import env
 
 log = logging.getLogger(__name__)
@@ -106,17 +103,5 @@ def create_message_body(
 
 
 def render_html(template):
-    """Uses the mjml cli to create html."""
-
-    with tempfile.NamedTemporaryFile("w+") as fp:
-        fp.write(template)
-        fp.flush()
-        process = subprocess.run(
-            ["./mjml", fp.name, "-s"],
-            cwd=MJML_PATH,
-            capture_output=True,
-        )
-        if process.stderr:
-            log.error(process.stderr.decode("utf-8"))
-            raise Exception("MJML template processing failed.")
-        return process.stdout.decode("utf-8")
+    """Renders the mjml template to html."""
+    return mjml.renderer.render(template)
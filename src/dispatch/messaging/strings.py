@@ -1,5 +1,6 @@
-import copy
+from functools import lru_cache
 
+from jinja2 import Template
 
 from dispatch.messaging.email.filters import env
 from dispatch.conversation.enums import ConversationButtonActions
@@ -1243,19 +1244,34 @@ ONCALL_SHIFT_FEEDBACK_RECEIVED = [
 ]
 
 
+@lru_cache(maxsize=4096)
+def compile_message_template(source: str) -> Template:
+    """Compiles a message template string, once for each distinct string."""
+    return env.from_string(source)
+
+
 def render_message_template(message_template: list[dict], **kwargs):
-    """Renders the jinja data included in the template itself."""
+    """Renders the jinja data included in the template itself.
+
+    Template strings are compiled once and cached, and the rendered blocks are new dicts, so
+    the template itself is left untouched.
+    """
+
+    def render(source: str) -> str:
+        return compile_message_template(source).render(**kwargs)
+
     data = []
-    new_copy = copy.deepcopy(message_template)
-    for d in new_copy:
+    for block in message_template:
+        d = dict(block)
+
         if d.get("header"):
-            d["header"] = env.from_string(d["header"]).render(**kwargs)
+            d["header"] = render(d["header"])
 
         if d.get("title"):
-            d["title"] = env.from_string(d["title"]).render(**kwargs)
+            d["title"] = render(d["title"])
 
         if d.get("title_link"):
-            d["title_link"] = env.from_string(d["title_link"]).render(**kwargs)
+            d["title_link"] = render(d["title_link"])
 
             if d["title_link"] == "None":  # skip blocks with no content
                 continue
@@ -1265,7 +1281,7 @@ def render_message_template(message_template: list[dict], **kwargs):
                 continue
 
         if d.get("text"):
-            d["text"] = env.from_string(d["text"]).render(**kwargs)
+            d["text"] = render(d["text"])
 
             # NOTE: we truncate the string to 2500 characters
             # to prevent hitting limits on SaaS integrations (e.g. Slack)
@@ -1273,28 +1289,37 @@ def render_message_template(message_template: list[dict], **kwargs):
 
         # render a new button array given the template
         if d.get("buttons"):
+            buttons = []
             for button in d["buttons"]:
-                button["button_text"] = env.from_string(button["button_text"]).render(**kwargs)
-                button["button_value"] = env.from_string(button["button_value"]).render(**kwargs)
+                button = dict(button)
+                button["button_text"] = render(button["button_text"])
+                button["button_value"] = render(button["button_value"])
 
                 if button.get("button_action"):
-                    button["button_action"] = env.from_string(button["button_action"]).render(
-                        **kwargs
-                    )
+                    button["button_action"] = render(button["button_action"])
 
                 if button.get("button_url"):
-                    button["button_url"] = env.from_string(button["button_url"]).render(**kwargs)
+                    button["button_url"] = render(button["button_url"])
+                buttons.append(button)
+            d["buttons"] = buttons
 
         # render drop-down list
         if select := d.get("select"):
+            select = dict(select)
             if placeholder := select.get("placeholder"):
-                select["placeholder"] = env.from_string(placeholder).render(**kwargs)
+                select["placeholder"] = render(placeholder)
 
-            select["select_action"] = env.from_string(select["select_action"]).render(**kwargs)
+            select["select_action"] = render(select["select_action"])
 
-            for option in select["options"]:
-                option["option_text"] = env.from_string(option["option_text"]).render(**kwargs)
-                option["option_value"] = env.from_string(option["option_value"]).render(**kwargs)
+            select["options"] = [
+                {
+                    **option,
+                    "option_text": render(option["option_text"]),
+                    "option_value": render(option["option_value"]),
+                }
+                for option in select["options"]
+            ]
+            d["select"] = select
 
         if d.get("visibility_mapping"):
             d["text"] = d["visibility_mapping"][kwargs["visibility"]]
@@ -1303,10 +1328,10 @@ def render_message_template(message_template: list[dict], **kwargs):
             d["text"] = d["status_mapping"][kwargs["status"]]
 
         if d.get("datetime"):
-            d["datetime"] = env.from_string(d["datetime"]).render(**kwargs)
+            d["datetime"] = render(d["datetime"])
 
         if d.get("context"):
-            d["context"] = env.from_string(d["context"]).render(**kwargs)
+            d["context"] = render(d["context"])
 
         data.append(d)
 
@@ -1,16 +1,54 @@
+import atexit
 import logging
+import os
+import queue
+import threading
+from collections import defaultdict
 
 from dispatch.plugins.base import plugins
 
-from .config import METRIC_PROVIDERS
+from .config import METRIC_FLUSH_INTERVAL, METRIC_PROVIDERS, METRIC_QUEUE_SIZE
 
 log = logging.getLogger(__file__)
 
 
+def _metric_key(name, tags):
+    """Returns a hashable key for a metric name and its tags."""
+    return name, tuple(sorted(tags.items())) if tags else ()
+
+
+class MetricBatch(object):
+    """Metrics coalesced per (name, tags) over a flush interval."""
+
+    def __init__(self):
+        self.counters = defaultdict(int)
+        self.gauges = {}
+        self.timers = defaultdict(list)
+
+    def __len__(self):
+        return len(self.counters) + len(self.gauges) + len(self.timers)
+
+    def add(self, kind, name, value, tags):
+        key = _metric_key(name, tags)
+        if kind == "counter":
+            self.counters[key] += 1 if value is None else value
+        elif kind == "gauge":
+            self.gauges[key] = value
+        elif kind == "timer":
+            self.timers[key].append(value)
+
+
 class Metrics(object):
+    """Buffers metrics in memory and hands them to the metric plugins from a background thread.
+
+    Emitting a metric only puts it on a bounded queue, metrics that do not fit are dropped
+    and accounted for. Every `flush_interval` seconds the queued metrics are coalesced per
+    (name, tags) and sent in a single batch to each of the configured providers.
+    """
+
     _providers = []
 
-    def __init__(self):
+    def __init__(self, flush_interval=METRIC_FLUSH_INTERVAL, queue_size=METRIC_QUEUE_SIZE):
         if not METRIC_PROVIDERS:
             log.info(
                 "No metric providers defined via METRIC_PROVIDERS env var. Metrics will not be sent."
@@ -18,29 +56,104 @@ class Metrics(object):
         else:
             self._providers = METRIC_PROVIDERS
 
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._resolved_providers = None
+        self._flusher = None
+        self._flusher_pid = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
     def gauge(self, name, value, tags=None):
-        for provider in self._providers:
-            log.debug(
-                f"Sending gauge metric {name} to provider {provider}. Value: {value} Tags: {tags}"
-            )
-            p = plugins.get(provider)
-            p.gauge(name, value, tags=tags)
+        self._put("gauge", name, value, tags)
 
     def counter(self, name, value=None, tags=None):
-        for provider in self._providers:
-            log.debug(
-                f"Sending counter metric {name} to provider {provider}. Value: {value} Tags: {tags}"
-            )
-            p = plugins.get(provider)
-            p.counter(name, value=value, tags=tags)
+        self._put("counter", name, value, tags)
 
     def timer(self, name, value, tags=None):
-        for provider in self._providers:
-            log.debug(
-                f"Sending timer metric {name} to provider {provider}. Value: {value} Tags: {tags}"
+        self._put("timer", name, value, tags)
+
+    def _put(self, kind, name, value, tags):
+        if not self._providers:
+            return
+
+        self._ensure_flusher()
+        try:
+            self._queue.put_nowait((kind, name, value, dict(tags) if tags else None))
+        except queue.Full:
+            self.dropped += 1
+
+    def _ensure_flusher(self):
+        """Starts the flusher thread, once per process."""
+        if self._flusher_pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+
+            self._stopped.clear()
+            self._flusher = threading.Thread(
+                target=self._run, name="dispatch-metrics-flusher", daemon=True
             )
-            p = plugins.get(provider)
-            p.timer(name, value, tags=tags)
+            self._flusher.start()
+            self._flusher_pid = os.getpid()
+
+    def _run(self):
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+
+    def resolve_providers(self):
+        """Resolves the configured provider slugs to their plugins."""
+        if self._resolved_providers is None:
+            resolved = []
+            for provider in self._providers:
+                try:
+                    resolved.append(plugins.get(provider))
+                except KeyError:
+                    log.warning(f"Metric provider {provider} is not installed. Skipping.")
+            self._resolved_providers = resolved
+        return self._resolved_providers
+
+    def drain(self):
+        """Removes all queued metrics and returns them coalesced into a batch."""
+        batch = MetricBatch()
+        while True:
+            try:
+                kind, name, value, tags = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.add(kind, name, value, tags)
+
+        dropped, self.dropped = self.dropped, 0
+        if dropped:
+            log.warning(f"Dropped {dropped} metrics, the metric queue is full.")
+            batch.add("counter", "metrics.dropped.counter", dropped, None)
+
+        return batch
+
+    def flush(self):
+        """Sends all queued metrics to the providers."""
+        batch = self.drain()
+        if not len(batch):
+            return
+
+        for p in self.resolve_providers():
+            log.debug(f"Sending {len(batch)} metrics to provider {p.slug}.")
+            try:
+                p.send_batch(batch)
+            except Exception as e:
+                log.exception(f"Failed to send metrics to provider {p.slug}: {e}")
+
+    def shutdown(self):
+        """Stops the flusher thread and sends any queued metrics."""
+        self._stopped.set()
+        if self._flusher_pid == os.getpid() and self._flusher is not None:
+            self._flusher.join(timeout=self.flush_interval)
+        self._flusher_pid = None
+        self.flush()
 
 
 provider = Metrics()
+atexit.register(provider.shutdown)
@@ -1,4 +1,7 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any
 
 from sqlalchemy.orm import Session
 from schedule import every
@@ -13,6 +16,7 @@ from dispatch.messaging.strings import (
 )
 from dispatch.plugin import service as plugin_service
 from dispatch.plugin.models import Plugin
+from dispatch.plugins.bases import MonitorPlugin
 from dispatch.project.models import Project
 from dispatch.scheduler import scheduler
 from dispatch.monitor.models import MonitorUpdate
@@ -23,6 +27,28 @@ from dispatch.monitor.flows import send_monitor_notification
 log = logging.getLogger(__name__)
 
 MONITOR_SYNC_INTERVAL = 30  # seconds
+MONITOR_SYNC_WORKERS = 10
+
+
+def get_monitor_status(
+    plugin_class: type[MonitorPlugin],
+    configuration: Any,
+    project_id: int,
+    weblink: str,
+    last_modified: datetime,
+):
+    """Fetches the status of a monitor, logging errors instead of raising them.
+
+    Plugin objects are thread local, so a plugin object is bound to the configuration here.
+    """
+    log.debug(f"Processing monitor. Monitor: {weblink}")
+    try:
+        plugin = plugin_class()
+        plugin.configuration = configuration
+        plugin.project_id = project_id
+        return plugin.get_match_status(weblink=weblink, last_modified=last_modified)
+    except Exception as e:
+        log.exception(f"Unable to fetch monitor status. Monitor: {weblink}. Error: {e}")
 
 
 def run_monitors(
@@ -32,49 +58,68 @@ def run_monitors(
     incidents: list[Incident],
     notify: bool = False,
 ):
-    """Performs monitor run."""
-    for incident in incidents:
-        for monitor in incident.monitors:
-            # once an instance is complete we don't update it any more
-            if not monitor.enabled:
-                continue
-
-            log.debug(f"Processing monitor. Monitor: {monitor.weblink}")
-            monitor_status = monitor_plugin.instance.get_match_status(
-                weblink=monitor.weblink,
-                last_modified=monitor.updated_at,
-            )
+    """Performs monitor run.
+
+    The status of all enabled monitors is fetched concurrently, the updates are then saved
+    one by one.
+    """
+    # once an instance is complete we don't update it any more
+    monitors = [
+        (incident, monitor)
+        for incident in incidents
+        for monitor in incident.monitors
+        if monitor.enabled
+    ]
+    if not monitors:
+        return
 
-            log.debug(f"Retrieved data from plugin. Data: {monitor_status}")
-            if not monitor_status:
-                continue
-
-            monitor_status_old = monitor.status
-            if monitor_status["state"] == monitor.status["state"]:
-                continue
-
-            monitor_service.update(
-                db_session=db_session,
-                monitor=monitor,
-                monitor_in=MonitorUpdate(
-                    id=monitor.id,
-                    weblink=monitor.weblink,
-                    enabled=monitor.enabled,
-                    status=monitor_status,
+    # the session's objects are only used from this thread
+    instance = monitor_plugin.instance
+    plugin_class, configuration = type(instance), instance.configuration
+    weblinks = [monitor.weblink for _, monitor in monitors]
+    last_modified = [monitor.updated_at for _, monitor in monitors]
+    with ThreadPoolExecutor(max_workers=MONITOR_SYNC_WORKERS) as executor:
+        statuses = list(
+            executor.map(
+                lambda weblink, updated_at: get_monitor_status(
+                    plugin_class, configuration, project.id, weblink, updated_at
                 ),
+                weblinks,
+                last_modified,
             )
+        )
+
+    for (incident, monitor), monitor_status in zip(monitors, statuses, strict=True):
+        log.debug(f"Retrieved data from plugin. Data: {monitor_status}")
+        if not monitor_status:
+            continue
+
+        monitor_status_old = monitor.status
+        if monitor_status["state"] == monitor.status["state"]:
+            continue
+
+        monitor_service.update(
+            db_session=db_session,
+            monitor=monitor,
+            monitor_in=MonitorUpdate(
+                id=monitor.id,
+                weblink=monitor.weblink,
+                enabled=monitor.enabled,
+                status=monitor_status,
+            ),
+        )
 
-            if notify:
-                send_monitor_notification(
-                    project.id,
-                    incident.conversation.channel_id,
-                    INCIDENT_MONITOR_UPDATE_NOTIFICATION,
-                    db_session,
-                    monitor_state_old=monitor_status_old["state"],
-                    monitor_state_new=monitor.status["state"],
-                    weblink=monitor.weblink,
-                    monitor_creator_name=resolve_attr(monitor, "creator.individual.name"),
-                )
+        if notify:
+            send_monitor_notification(
+                project.id,
+                incident.conversation.channel_id,
+                INCIDENT_MONITOR_UPDATE_NOTIFICATION,
+                db_session,
+                monitor_state_old=monitor_status_old["state"],
+                monitor_state_new=monitor.status["state"],
+                weblink=monitor.weblink,
+                monitor_creator_name=resolve_attr(monitor, "creator.individual.name"),
+            )
 
 
 @scheduler.add(every(MONITOR_SYNC_INTERVAL).seconds, name="sync-active-stable-monitors")
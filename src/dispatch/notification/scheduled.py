@@ -0,0 +1,38 @@
+"""
+.. module: dispatch.notification.scheduled
+    :platform: Unix
+    :copyright: (c) 2019 by Netflix Inc., see AUTHORS for more
+    :license: Apache, see LICENSE for more details.
+"""
+
+import logging
+
+from schedule import every
+from sqlalchemy.orm import Session
+
+from dispatch.decorators import scheduled_project_task, timer
+from dispatch.plugin import service as plugin_service
+from dispatch.project.models import Project
+from dispatch.scheduler import scheduler
+
+log = logging.getLogger(__name__)
+
+
+@scheduler.add(every(5).minutes, name="reconcile-email-bounces")
+@timer
+@scheduled_project_task
+def reconcile_email_bounces(db_session: Session, project: Project):
+    """Reports the emails sent that bounced.
+
+    Projects often share a mailbox, and each bounce is only returned to the first project that
+    reconciles it, so bounces are reported without a project.
+    """
+    email_plugin = plugin_service.get_active_instance(
+        db_session=db_session, project_id=project.id, plugin_type="email"
+    )
+
+    if not email_plugin:
+        return
+
+    for recipient in email_plugin.instance.reconcile_bounces():
+        log.error(f"Email to {recipient} bounced.")
@@ -2,7 +2,12 @@ from pydantic import ValidationError
 from sqlalchemy.sql.expression import true
 
 from dispatch.auth.models import DispatchUser, DispatchUserOrganization
-from dispatch.database.core import engine
+from dispatch.database.core import (
+    engine,
+    get_organization_engine,
+    get_organization_sessionmaker,
+    schema_registry,
+)
 from dispatch.database.manage import init_schema
 from dispatch.enums import UserRoles
 
@@ -151,6 +156,11 @@ def delete(*, db_session, organization_id: int):
     db_session.delete(organization)
     db_session.commit()
 
+    # we drop any cached state for the organization's schema
+    schema_registry.invalidate()
+    get_organization_sessionmaker.cache_clear()
+    get_organization_engine.cache_clear()
+
 
 def add_user(
     *,
@@ -149,6 +149,18 @@ def get_by_case_id_and_conversation_id(
     )
 
 
+def get_all_by_case_id_and_conversation_ids(
+    *, db_session: Session, case_id: int, user_conversation_ids: list[str]
+) -> list[Participant | None]:
+    """Get all participants of a case by their user_conversation ids."""
+    return (
+        db_session.query(Participant)
+        .filter(Participant.case_id == case_id)
+        .filter(Participant.user_conversation_id.in_(user_conversation_ids))
+        .all()
+    )
+
+
 def get_all(*, db_session: Session) -> list[Participant | None]:
     """Returns all participants."""
     return db_session.query(Participant).all()
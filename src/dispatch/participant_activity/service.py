@@ -27,6 +27,20 @@ def get_all_incident_participant_activities_from_last_update(
     )
 
 
+def get_all_case_participant_activities_from_last_update(
+    db_session: SessionLocal,
+    case_id: int,
+) -> list[ParticipantActivityRead]:
+    """Fetches the most recent recorded participant case activities for each participant for a given case."""
+    return (
+        db_session.query(ParticipantActivity)
+        .distinct(ParticipantActivity.participant_id)
+        .filter(ParticipantActivity.case_id == case_id)
+        .order_by(ParticipantActivity.participant_id, ParticipantActivity.ended_at.desc())
+        .all()
+    )
+
+
 def create(*, db_session: SessionLocal, activity_in: ParticipantActivityCreate):
     """Creates a new record for a participant's activity."""
     incident_id = activity_in.incident.id if activity_in.incident else None
@@ -144,6 +158,60 @@ def create_or_update(db_session: SessionLocal, activity_in: ParticipantActivityC
     return delta
 
 
+def create_or_update_case_activities(
+    *,
+    db_session: SessionLocal,
+    case_id: int,
+    activities: list[tuple[int, int, datetime, datetime]],
+) -> list[ParticipantActivity]:
+    """Creates or updates the participant activities of a case in bulk.
+
+    Activities are (participant id, plugin event id, started at, ended at) tuples. They are
+    merged in order of their start time, following the same rules as `create_or_update`:
+    an activity overlapping the participant's previous activity extends it if both belong to
+    the same plugin event, or cuts it short otherwise. All changes are saved with a single
+    commit. Returns the activities created or updated.
+    """
+    last_activities = {
+        activity.participant_id: activity
+        for activity in get_all_case_participant_activities_from_last_update(
+            db_session=db_session, case_id=case_id
+        )
+    }
+
+    changed = {}
+    for participant_id, plugin_event_id, started_at, ended_at in sorted(
+        activities, key=lambda a: a[2]
+    ):
+        prev_activity = last_activities.get(participant_id)
+
+        # There's continuous participant activity.
+        if prev_activity and started_at < prev_activity.ended_at:
+            # Continuation of current plugin event.
+            if plugin_event_id == prev_activity.plugin_event_id:
+                prev_activity.ended_at = max(prev_activity.ended_at, ended_at)
+                changed[prev_activity] = True
+                continue
+
+            # New activity is associated with a different plugin event.
+            prev_activity.ended_at = started_at
+            changed[prev_activity] = True
+
+        activity = ParticipantActivity(
+            plugin_event_id=plugin_event_id,
+            started_at=started_at,
+            ended_at=ended_at,
+            participant_id=participant_id,
+            case_id=case_id,
+        )
+        db_session.add(activity)
+        last_activities[participant_id] = activity
+        changed[activity] = True
+
+    db_session.commit()
+    return list(changed)
+
+
 def get_participant_incident_activities_by_individual_contact(
     db_session: SessionLocal, individual_contact_id: int
 ) -> list[ParticipantActivity]:
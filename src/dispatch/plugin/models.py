@@ -1,6 +1,8 @@
 import logging
 import json
+import threading
 
+from cachetools import LRUCache
 from pydantic import SecretStr
 from pydantic.json import pydantic_encoder
 
@@ -20,6 +22,13 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# parsed plugin configurations keyed by (plugin instance id, plugin slug)
+_configuration_cache = LRUCache(maxsize=1024)
+_configuration_cache_lock = threading.Lock()
+
+# plugin attributes are thread local (see IPlugin), so bound plugin objects are cached per thread
+_bound_plugins = threading.local()
+
 
 def show_secrets_encoder(obj):
     if isinstance(obj, SecretStr):
@@ -100,16 +109,46 @@ class PluginInstance(Base, ProjectMixin):
 
     @property
     def instance(self):
-        """Fetches a plugin instance that matches this record."""
+        """Fetches a plugin object bound to this record's configuration and project."""
         try:
             plugin = plugins.get(self.plugin.slug)
-            plugin.configuration = self.configuration
-            plugin.project_id = self.project_id
-            return plugin
+            bound_plugin = self._get_bound_plugin(plugin)
+            if bound_plugin is None:
+                bound_plugin = plugin.__class__()
+                bound_plugin.configuration = self.configuration
+                bound_plugin.project_id = self.project_id
+                self._set_bound_plugin(bound_plugin)
+            return bound_plugin
         except Exception as e:
             logger.warning(f"Error trying to load plugin with slug {self.slug}: {e}")
             return self.plugin
 
+    def _get_bound_plugin(self, plugin):
+        """Returns the plugin object cached for this record in the current thread, if still valid."""
+        cache = getattr(_bound_plugins, "cache", None)
+        if cache is None or self.id is None:
+            return None
+
+        cached = cache.get(self.id)
+        if cached is None:
+            return None
+
+        configuration, project_id, bound_plugin = cached
+        if (
+            configuration == self._configuration
+            and project_id == self.project_id
+            and type(bound_plugin) is type(plugin)
+        ):
+            return bound_plugin
+        return None
+
+    def _set_bound_plugin(self, bound_plugin):
+        if self.id is None:
+            return
+        if not hasattr(_bound_plugins, "cache"):
+            _bound_plugins.cache = {}
+        _bound_plugins.cache[self.id] = (self._configuration, self.project_id, bound_plugin)
+
     @property
     def broken(self):
         try:
@@ -138,7 +177,21 @@ class PluginInstance(Base, ProjectMixin):
         try:
             if self._configuration:
                 plugin = plugins.get(self.plugin.slug)
-                return plugin.configuration_schema.parse_raw(self._configuration)
+                schema = plugin.configuration_schema
+
+                key = (self.id, self.plugin.slug)
+                if self.id is not None:
+                    with _configuration_cache_lock:
+                        cached = _configuration_cache.get(key)
+                    if cached and cached[0] == self._configuration and cached[1] is schema:
+                        return cached[2]
+
+                configuration = schema.parse_raw(self._configuration)
+
+                if self.id is not None:
+                    with _configuration_cache_lock:
+                        _configuration_cache[key] = (self._configuration, schema, configuration)
+                return configuration
         except Exception as e:
             logger.warning(
                 f"Error trying to load plugin {self.plugin.title} {self.plugin.description} with error {e}"
@@ -15,27 +15,70 @@ logger = logging.getLogger(__name__)
 
 # inspired by https://github.com/getsentry/sentry
 class PluginManager(InstanceManager):
+    def __init__(self, class_list=None, instances=True):
+        self._index_source = None
+        self._slug_index = {}
+        self._type_index = {}
+        super(PluginManager, self).__init__(class_list=class_list, instances=instances)
+
     def __iter__(self):
         return iter(self.all())
 
     def __len__(self):
         return sum(1 for i in self.all())
 
+    def _build_index(self):
+        """Indexes plugin instances by slug and by (version, type).
+
+        The index is rebuilt whenever the underlying instance cache changes, i.e. when
+        plugins are registered or unregistered.
+        """
+        instances = super(PluginManager, self).all()
+        if instances is self._index_source:
+            return
+
+        type_index = {}
+        for plugin in sorted(instances, key=lambda x: x.get_title()):
+            for key in (
+                (None, None),
+                (None, plugin.type),
+                (plugin.__version__, None),
+                (plugin.__version__, plugin.type),
+            ):
+                type_index.setdefault(key, []).append(plugin)
+
+        # version 1 plugins take precedence over version 2 plugins with the same slug
+        slug_index = {}
+        for version in (1, 2):
+            for plugin in type_index.get((version, None), []):
+                slug_index.setdefault(plugin.slug, plugin)
+
+        self._type_index = type_index
+        self._slug_index = slug_index
+        self._index_source = instances
+
+    def add(self, class_path):
+        self._index_source = None
+        super(PluginManager, self).add(class_path)
+
+    def remove(self, class_path):
+        self._index_source = None
+        super(PluginManager, self).remove(class_path)
+
+    def update(self, class_list):
+        self._index_source = None
+        super(PluginManager, self).update(class_list)
+
     def all(self, version=1, plugin_type=None):
-        for plugin in sorted(super(PluginManager, self).all(), key=lambda x: x.get_title()):
-            if not plugin.type == plugin_type and plugin_type:
-                continue
-            if version is not None and plugin.__version__ != version:
-                continue
-            yield plugin
+        self._build_index()
+        yield from self._type_index.get((version, plugin_type or None), [])
 
     def get(self, slug):
-        for plugin in self.all(version=1):
-            if plugin.slug == slug:
-                return plugin
-        for plugin in self.all(version=2):
-            if plugin.slug == slug:
-                return plugin
+        self._build_index()
+        plugin = self._slug_index.get(slug)
+        if plugin is not None:
+            return plugin
+
         logger.error(
             f"Unable to find slug: {slug} in self.all version 1: {self.all(version=1)} or version 2: {self.all(version=2)}"
         )
@@ -6,11 +6,30 @@
 .. moduleauthor:: Kevin Glisson <kglisson@netflix.com>
 """
 
+import logging
+
 from dispatch.plugins.base import Plugin
 
+log = logging.getLogger(__name__)
+
 
 class EmailPlugin(Plugin):
     type = "email"
 
     def send(self, items, **kwargs):
         raise NotImplementedError
+
+    def send_batch(self, messages: list[dict], **kwargs) -> list[bool]:
+        """Sends several messages, each holding the arguments of `send`."""
+        results = []
+        for message in messages:
+            try:
+                results.append(self.send(**message) is not False)
+            except Exception as e:
+                log.error(f"Unable to send email message to {message.get('recipient')}: {e}")
+                results.append(False)
+        return results
+
+    def reconcile_bounces(self, **kwargs) -> list[str]:
+        """Returns the recipients of the messages sent that bounced."""
+        return []
@@ -20,3 +20,16 @@ class MetricPlugin(Plugin):
 
     def timer(self, name, value, tags=None):
         raise NotImplementedError
+
+    def send_batch(self, batch):
+        """Sends metrics coalesced per (name, tags) over a flush interval.
+
+        Plugins able to submit many metrics in a single request should override this.
+        """
+        for (name, tags), value in batch.counters.items():
+            self.counter(name, value=value, tags=dict(tags))
+        for (name, tags), value in batch.gauges.items():
+            self.gauge(name, value, tags=dict(tags))
+        for (name, tags), values in batch.timers.items():
+            for value in values:
+                self.timer(name, value, tags=dict(tags))
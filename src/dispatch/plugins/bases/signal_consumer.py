@@ -12,5 +12,5 @@ from dispatch.plugins.base import Plugin
 class SignalConsumerPlugin(Plugin):
     type = "signal-consumer"
 
-    def consume(self, **kwargs):
+    def consume(self, db_session, project, stats=None, **kwargs):
         raise NotImplementedError
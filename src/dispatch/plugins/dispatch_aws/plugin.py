@@ -13,9 +13,7 @@ import zlib
 from typing import TypedDict
 
 import boto3
-from psycopg2.errors import UniqueViolation
 from pydantic import ValidationError
-from sqlalchemy.exc import IntegrityError, ResourceClosedError
 from sqlalchemy.orm import Session
 
 from dispatch.metrics import provider as metrics_provider
@@ -23,6 +21,7 @@ from dispatch.plugins.bases import SignalConsumerPlugin
 from dispatch.plugins.dispatch_aws.config import AWSSQSConfiguration
 from dispatch.project.models import Project
 from dispatch.signal import service as signal_service
+from dispatch.signal.consumer import ConsumerStats
 from dispatch.signal.models import SignalInstanceCreate
 
 from . import __version__
@@ -37,6 +36,31 @@ def decompress_json(compressed_str: str) -> str:
     return decompressed.decode("utf-8")
 
 
+def parse_signal_instance(message: dict, project: Project) -> SignalInstanceCreate | None:
+    """Parses the signal instance carried by an SQS message, None if it is not valid."""
+    try:
+        message_body = json.loads(message["Body"])
+        message_body_message = message_body.get("Message")
+        message_attributes = message_body.get("MessageAttributes", {})
+
+        if message_attributes.get("compressed", {}).get("Value") == "zlib":
+            # Message is compressed, decompress it
+            message_body_message = decompress_json(message_body_message)
+
+        signal_data = json.loads(message_body_message)
+    except Exception as e:
+        log.exception(f"Unable to extract signal data from SQS message: {e}")
+        return None
+
+    try:
+        return SignalInstanceCreate(project=project, raw=signal_data, **signal_data)
+    except ValidationError as e:
+        log.warning(
+            f"Received a signal instance that does not conform to the SignalInstanceCreate pydantic model. Skipping creation: {e}"
+        )
+        return None
+
+
 class SqsEntries(TypedDict):
     Id: str
     ReceiptHandle: str
@@ -54,12 +78,15 @@ class AWSSQSSignalConsumerPlugin(SignalConsumerPlugin):
     def __init__(self):
         self.configuration_schema = AWSSQSConfiguration
 
-    def consume(self, db_session: Session, project: Project) -> None:
+    def consume(
+        self, db_session: Session, project: Project, stats: ConsumerStats | None = None
+    ) -> None:
         client = boto3.client("sqs", region_name=self.configuration.region)
         queue_url: str = client.get_queue_url(
             QueueName=self.configuration.queue_name,
             QueueOwnerAWSAccountId=self.configuration.queue_owner,
         )["QueueUrl"]
+        definition_cache = signal_service.SignalDefinitionCache()
 
         while True:
             response = client.receive_message(
@@ -72,84 +99,63 @@ class AWSSQSSignalConsumerPlugin(SignalConsumerPlugin):
                 log.info("No messages received from SQS.")
                 continue
 
-            entries: list[SqsEntries] = []
+            # the whole batch is validated, then stored with a single insert
+            messages = []
+            signal_instances_in = []
             for message in response["Messages"]:
-                try:
-                    message_body = json.loads(message["Body"])
-                    message_body_message = message_body.get("Message")
-                    message_attributes = message_body.get("MessageAttributes", {})
-
-                    if message_attributes.get("compressed", {}).get("Value") == "zlib":
-                        # Message is compressed, decompress it
-                        message_body_message = decompress_json(message_body_message)
-
-                    signal_data = json.loads(message_body_message)
-                except Exception as e:
-                    log.exception(f"Unable to extract signal data from SQS message: {e}")
+                signal_instance_in = parse_signal_instance(message, project)
+                if signal_instance_in:
+                    messages.append(message)
+                    signal_instances_in.append(signal_instance_in)
+
+            try:
+                ids, created = signal_service.create_instances(
+                    db_session=db_session,
+                    project=project,
+                    signal_instances_in=signal_instances_in,
+                    definition_cache=definition_cache,
+                )
+            except Exception as e:
+                log.exception(
+                    f"Encountered an error when trying to create signal instances. The plugin will retry again as the messages haven't been deleted from the SQS queue. Error: {e}"
+                )
+                db_session.rollback()
+                ids, created = [None] * len(messages), set()
+
+            # messages of signal instances that are stored, or already were, are deleted
+            entries: list[SqsEntries] = []
+            for message, signal_instance_in, signal_instance_id in zip(
+                messages, signal_instances_in, ids, strict=True
+            ):
+                if signal_instance_id is None:
                     continue
 
-                try:
-                    signal_instance_in = SignalInstanceCreate(
-                        project=project, raw=signal_data, **signal_data
-                    )
-                except ValidationError as e:
-                    log.warning(
-                        f"Received a signal instance that does not conform to the SignalInstanceCreate pydantic model. Skipping creation: {e}"
-                    )
-                    continue
+                entries.append(
+                    {"Id": message["MessageId"], "ReceiptHandle": message["ReceiptHandle"]}
+                )
 
-                # if the signal has an existing uuid we check if it already exists
-                if signal_instance_in.raw and signal_instance_in.raw.get("id"):
-                    if signal_service.get_signal_instance(
-                        db_session=db_session, signal_instance_id=signal_instance_in.raw["id"]
-                    ):
-                        log.info(
-                            f"Received a signal that already exists in the database. Skipping signal instance creation: {signal_instance_in.raw['id']}"
-                        )
-                        continue
-
-                try:
-                    with db_session.begin_nested():
-                        signal_instance = signal_service.create_signal_instance(
-                            db_session=db_session,
-                            signal_instance_in=signal_instance_in,
-                        )
-                except IntegrityError as e:
-                    if isinstance(e.orig, UniqueViolation):
-                        log.info(
-                            f"Received a signal that already exists in the database. Skipping signal instance creation: {e}"
-                        )
-                    else:
-                        log.exception(
-                            f"Encountered an integrity error when trying to create a signal instance: {e}"
-                        )
-                    continue
-                except ResourceClosedError as e:
-                    log.warning(
-                        f"Encountered an error when trying to create a signal instance. The plugin will retry again as the message hasn't been deleted from the SQS queue. Signal name/variant: {signal_instance_in.raw['name'] if signal_instance_in.raw and signal_instance_in.raw['name'] else signal_instance_in.raw['variant']}. Error: {e}"
+                if signal_instance_id not in created:
+                    log.info(
+                        f"Received a signal that already exists in the database. Skipping signal instance creation: {signal_instance_id}"
                     )
-                    db_session.rollback()
                     continue
-                except Exception as e:
-                    log.exception(
-                        f"Encountered an error when trying to create a signal instance. Signal name/variant: {signal_instance_in.raw['name'] if signal_instance_in.raw and signal_instance_in.raw['name'] else signal_instance_in.raw['variant']}. Error: {e}"
-                    )
-                    db_session.rollback()
-                    continue
-                else:
-                    metrics_provider.counter(
-                        "aws-sqs-signal-consumer.signal.received",
-                        tags={
-                            "signalName": signal_instance.signal.name,
-                            "externalId": signal_instance.signal.external_id,
-                        },
-                    )
-                    log.debug(
-                        f"Received a signal with name {signal_instance.signal.name} and id {signal_instance.signal.id}"
-                    )
-                    entries.append(
-                        {"Id": message["MessageId"], "ReceiptHandle": message["ReceiptHandle"]}
-                    )
+
+                _, signal_name, signal_external_id = definition_cache.get_signal(
+                    db_session=db_session,
+                    project_id=project.id,
+                    external_id=signal_instance_in.external_id,
+                )
+                metrics_provider.counter(
+                    "aws-sqs-signal-consumer.signal.received",
+                    tags={
+                        "signalName": signal_name,
+                        "externalId": signal_external_id,
+                    },
+                )
+                log.debug(f"Received a signal with name {signal_name} and id {signal_instance_id}")
 
             if entries:
                 client.delete_message_batch(QueueUrl=queue_url, Entries=entries)
+
+            if stats:
+                stats.record(received=len(created), errors=len(response["Messages"]) - len(entries))
@@ -6,8 +6,10 @@
 """
 
 import base64
+import hashlib
 import json
 import logging
+import threading
 import time
 from uuid import UUID
 from typing import Literal
@@ -29,6 +31,8 @@ from dispatch.config import (
     DISPATCH_AUTHENTICATION_PROVIDER_AWS_ALB_PUBLIC_KEY_CACHE_SECONDS,
     DISPATCH_AUTHENTICATION_PROVIDER_HEADER_NAME,
     DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS,
+    DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS_CACHE_SECONDS,
+    DISPATCH_AUTHENTICATION_PROVIDER_PKCE_TOKEN_CACHE_SECONDS,
     DISPATCH_JWT_AUDIENCE,
     DISPATCH_JWT_EMAIL_OVERRIDE,
     DISPATCH_JWT_SECRET,
@@ -98,6 +102,56 @@ class BasicAuthProviderPlugin(AuthenticationProviderPlugin):
         return data["email"]
 
 
+class JWKSCache(object):
+    """Caches the keys of a JSON Web Key Set by key id.
+
+    The key set is fetched again once it is older than `ttl` seconds, or when a token refers
+    to a key id it does not have, at most once every `min_refresh_interval` seconds. If the
+    key set cannot be fetched, the keys fetched last keep being used.
+    """
+
+    def __init__(self, url: str, ttl: int, min_refresh_interval: int = 30):
+        self.url = url
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self._keys = {}
+        self._fetched_at = None
+        self._refreshed_at = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> None:
+        self._refreshed_at = time.monotonic()
+        try:
+            keys = requests.get(self.url, timeout=10).json()["keys"]
+        except Exception as e:
+            log.warning(f"Unable to fetch the JSON Web Key Set from {self.url}: {e}")
+            return
+        self._keys = {key["kid"]: key for key in keys}
+        self._fetched_at = time.monotonic()
+
+    def get_key(self, kid: str) -> dict | None:
+        with self._lock:
+            now = time.monotonic()
+            stale = self._fetched_at is None or now - self._fetched_at > self.ttl
+            if (stale or kid not in self._keys) and (
+                self._refreshed_at is None or now - self._refreshed_at > self.min_refresh_interval
+            ):
+                self.refresh()
+            return self._keys.get(kid)
+
+
+pkce_jwks_cache = JWKSCache(
+    DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS,
+    ttl=DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS_CACHE_SECONDS,
+)
+
+# (email, expiration) of verified tokens, keyed by the tokens' hash
+pkce_verified_tokens = TTLCache(
+    maxsize=10000, ttl=DISPATCH_AUTHENTICATION_PROVIDER_PKCE_TOKEN_CACHE_SECONDS
+)
+pkce_verified_tokens_lock = threading.Lock()
+
+
 class PKCEAuthProviderPlugin(AuthenticationProviderPlugin):
     title = "Dispatch Plugin - PKCE Authentication Provider"
     slug = "dispatch-auth-provider-pkce"
@@ -122,14 +176,23 @@ class PKCEAuthProviderPlugin(AuthenticationProviderPlugin):
 
         token = authorization.split()[1]
 
+        # tokens verified recently are not verified again until they expire
+        token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        with pkce_verified_tokens_lock:
+            verified = pkce_verified_tokens.get(token_hash)
+        if verified:
+            email, exp = verified
+            if exp is None or exp > time.time():
+                return email
+
         # Parse out the Key information. Add padding just in case
         key_info = json.loads(base64.b64decode(token.split(".")[0] + "=========").decode("utf-8"))
 
-        # Grab all possible keys to account for key rotation and find the right key
-        keys = requests.get(DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS).json()["keys"]
-        for potential_key in keys:
-            if potential_key["kid"] == key_info["kid"]:
-                key = potential_key
+        # The key set is cached, and refreshed on key rotation
+        key = pkce_jwks_cache.get_key(key_info["kid"])
+        if not key:
+            log.debug(f"No JSON Web Key found for kid {key_info['kid']}")
+            raise credentials_exception
 
         try:
             jwt_opts = {}
@@ -146,9 +209,13 @@ class PKCEAuthProviderPlugin(AuthenticationProviderPlugin):
 
         # Support overriding where email is returned in the id token
         if DISPATCH_JWT_EMAIL_OVERRIDE:
-            return data[DISPATCH_JWT_EMAIL_OVERRIDE]
+            email = data[DISPATCH_JWT_EMAIL_OVERRIDE]
         else:
-            return data["email"]
+            email = data["email"]
+
+        with pkce_verified_tokens_lock:
+            pkce_verified_tokens[token_hash] = (email, data.get("exp"))
+        return email
 
 
 class HeaderAuthProviderPlugin(AuthenticationProviderPlugin):
@@ -5,13 +5,19 @@
     :license: Apache, see LICENSE for more details.
 """
 
+import logging
 import platform
 import re
 from re import Pattern
 import sys
+import threading
+import time
 import requests
-from datetime import datetime
-from tenacity import TryAgain, retry, stop_after_attempt, wait_fixed
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from cachetools import LRUCache
+from requests.adapters import HTTPAdapter
 
 from . import __version__
 from dispatch.config import BaseConfigurationModel
@@ -20,10 +26,67 @@ from dispatch.plugins import dispatch_github as github_plugin
 from dispatch.plugins.bases.monitor import MonitorPlugin
 
 
+log = logging.getLogger(__name__)
+
+# the most requests sent concurrently, keep-alive connections are pooled up to this size
+MAX_CONNECTIONS = 10
+
+# unchanged matches are polled less and less often, up to this interval (seconds)
+MAX_UNCHANGED_INTERVAL = 120
+
+
 class GithubConfiguration(BaseConfigurationModel):
     pass
 
 
+@dataclass
+class MatchState:
+    """The last response for a match, used for conditional requests."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    checked_at: float = 0
+    unchanged: int = 0
+
+    def is_due(self, now: float) -> bool:
+        """Whether the match should be polled, backing off while it is unchanged."""
+        if not self.unchanged:
+            return True
+        interval = min(15 * 2 ** (self.unchanged - 1), MAX_UNCHANGED_INTERVAL)
+        return now - self.checked_at >= interval
+
+
+class RateLimit(object):
+    """Tracks the Github rate limit across all requests of the process."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset_at = 0.0
+
+    def is_limited(self, now: float) -> bool:
+        with self.lock:
+            return now < self.reset_at
+
+    def update(self, response: requests.Response, now: float):
+        """Stops requests until the limit resets once it is exhausted."""
+        reset_at = None
+        if response.headers.get("Retry-After"):
+            reset_at = now + int(response.headers["Retry-After"])
+        elif response.headers.get("X-RateLimit-Remaining") == "0":
+            reset_at = float(response.headers.get("X-RateLimit-Reset", now + 60))
+
+        if reset_at:
+            with self.lock:
+                self.reset_at = max(self.reset_at, reset_at)
+
+
+def create_session() -> requests.Session:
+    session = requests.Session()
+    session.headers.update({"User-Agent": create_ua_string()})
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONNECTIONS))
+    return session
+
+
 def create_ua_string():
     client_name = __name__.split(".")[0]
     client_version = __version__  # Version is returned from _version.py
@@ -43,6 +106,14 @@ def create_ua_string():
     return " ".join(ua_string)
 
 
+session = create_session()
+rate_limit = RateLimit()
+
+# match states by request url
+_match_states = LRUCache(maxsize=10000)
+_match_states_lock = threading.Lock()
+
+
 # NOTE we don't yet support enterprise github
 @apply(counter, exclude=["__init__"])
 @apply(timer, exclude=["__init__"])
@@ -65,9 +136,12 @@ class GithubMonitorPlugin(MonitorPlugin):
         ]
         return [re.compile(r) for r in matchers]
 
-    @retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
     def get_match_status(self, weblink: str, last_modified: datetime = None, **kwargs) -> dict:
-        """Fetches the match and attempts to determine current status."""
+        """Fetches the match and attempts to determine current status.
+
+        Returns nothing when the match did not change, was polled recently without changes or
+        the Github rate limit is exhausted.
+        """
         # determine what kind of link we have
         base_url = "https://api.github.com/repos"
 
@@ -85,20 +159,46 @@ class GithubMonitorPlugin(MonitorPlugin):
 
         request_url = f"{base_url}/{match_data['organization']}/{match_data['repo']}/{match_data['type']}/{match_data['id']}"
 
+        now = time.time()
+        if rate_limit.is_limited(now):
+            log.debug(f"Github rate limit exhausted. Not fetching {request_url}.")
+            return
+
+        with _match_states_lock:
+            state = _match_states.get(request_url) or MatchState()
+        if not state.is_due(now):
+            return
+
         # use conditional requests to avoid rate limits
         # https://docs.github.com/en/rest/overview/resources-in-the-rest-api#conditional-requests
-        headers = {"User-Agent": create_ua_string()}
-        if last_modified:
-            headers.update({"If-Modified-Since": str(last_modified)})
-
-        resp = requests.get(request_url, headers=headers)
+        headers = {}
+        if state.etag:
+            headers["If-None-Match"] = state.etag
+        if state.last_modified:
+            headers["If-Modified-Since"] = state.last_modified
+        elif last_modified:
+            headers["If-Modified-Since"] = format_datetime(
+                last_modified.replace(tzinfo=last_modified.tzinfo or timezone.utc), usegmt=True
+            )
+
+        resp = session.get(request_url, headers=headers, timeout=10)
+        rate_limit.update(resp, now)
 
         if resp.status_code == 304:
             # no updates
+            state = MatchState(
+                state.etag, state.last_modified, checked_at=now, unchanged=state.unchanged + 1
+            )
+        elif resp.status_code == 200:
+            state = MatchState(
+                resp.headers.get("ETag"), resp.headers.get("Last-Modified"), checked_at=now
+            )
+        else:
+            log.warning(f"Unable to fetch {request_url}. Status code: {resp.status_code}")
             return
 
-        if resp.status_code == 403:
-            raise TryAgain
+        with _match_states_lock:
+            _match_states[request_url] = state
 
         if resp.status_code == 200:
             data = resp.json()
@@ -1,9 +1,13 @@
+import hashlib
 import json
 import socket
-import tempfile
+import threading
+from functools import lru_cache
 
+from cachetools import LRUCache
 from google.oauth2 import service_account
 import googleapiclient.discovery
+from googleapiclient.discovery_cache import get_static_doc
 
 from .config import GoogleConfiguration
 
@@ -11,12 +15,40 @@ TIMEOUT = 300
 
 socket.setdefaulttimeout(TIMEOUT)
 
+# delegated credentials by configuration hash and scopes, shared by all threads
+_credentials = LRUCache(maxsize=64)
+_credentials_lock = threading.Lock()
 
-def get_service(
-    config: GoogleConfiguration, service_name: str, version: str, scopes: list
-) -> googleapiclient.discovery.Resource:
-    """Formats specified credentials for Google clients."""
-    data = {
+# service clients are not thread safe, so each thread keeps its own
+_services = threading.local()
+
+
+def get_configuration_hash(config: GoogleConfiguration) -> str:
+    """Hashes the parts of a configuration used to build service clients."""
+    data = [
+        config.service_account_project_id,
+        config.service_account_private_key_id,
+        config.service_account_private_key.get_secret_value(),
+        config.service_account_client_email,
+        config.service_account_client_id,
+        config.service_account_delegated_account,
+        config.developer_key.get_secret_value(),
+    ]
+    return hashlib.sha256(json.dumps(data).encode()).hexdigest()
+
+
+def get_credentials(config: GoogleConfiguration, scopes: list) -> service_account.Credentials:
+    """Returns delegated service account credentials, built in memory once per configuration.
+
+    The credentials refresh their token when it expires.
+    """
+    key = (get_configuration_hash(config), tuple(scopes))
+    with _credentials_lock:
+        credentials = _credentials.get(key)
+    if credentials:
+        return credentials
+
+    info = {
         "type": "service_account",
         "project_id": config.service_account_project_id,
         "private_key_id": config.service_account_private_key_id,
@@ -25,21 +57,51 @@ def get_service(
         "client_id": config.service_account_client_id,
         "token_uri": "https://oauth2.googleapis.com/token",
     }
+    credentials = service_account.Credentials.from_service_account_info(
+        info, scopes=scopes
+    ).with_subject(config.service_account_delegated_account)
 
-    with tempfile.NamedTemporaryFile() as service_account_file:
-        service_account_file.write(json.dumps(data).encode())
-        service_account_file.seek(0)
+    with _credentials_lock:
+        _credentials[key] = credentials
+    return credentials
 
-        credentials = service_account.Credentials.from_service_account_file(
-            service_account_file.name, scopes=scopes
-        )
 
-        delegated_credentials = credentials.with_subject(config.service_account_delegated_account)
+@lru_cache
+def get_discovery_document(service_name: str, version: str) -> dict | None:
+    """Returns the discovery document shipped with the Google API client, if any."""
+    document = get_static_doc(service_name, version)
+    return json.loads(document) if document else None
 
-        return googleapiclient.discovery.build(
+
+def get_service(
+    config: GoogleConfiguration, service_name: str, version: str, scopes: list
+) -> googleapiclient.discovery.Resource:
+    """Returns a Google client, reused by the current thread for the same configuration."""
+    services = getattr(_services, "services", None)
+    if services is None:
+        services = _services.services = LRUCache(maxsize=64)
+
+    key = (get_configuration_hash(config), service_name, version, tuple(scopes))
+    service = services.get(key)
+    if service:
+        return service
+
+    credentials = get_credentials(config, scopes)
+    document = get_discovery_document(service_name, version)
+    if document:
+        service = googleapiclient.discovery.build_from_document(
+            document,
+            credentials=credentials,
+            developerKey=config.developer_key.get_secret_value(),
+        )
+    else:
+        service = googleapiclient.discovery.build(
             service_name,
             version,
-            credentials=delegated_credentials,
+            credentials=credentials,
             cache_discovery=False,
             developerKey=config.developer_key.get_secret_value(),
         )
+
+    services[key] = service
+    return service
@@ -10,7 +10,9 @@ import time
 from email.mime.text import MIMEText
 import base64
 import logging
+import threading
 
+from cachetools import TTLCache
 from tenacity import retry, stop_after_attempt
 
 from dispatch.decorators import apply, counter, timer
@@ -28,27 +30,103 @@ from dispatch.messaging.email.utils import create_message_body, create_multi_mes
 log = logging.getLogger(__name__)
 
 
+# Gmail allows up to 100 requests per batch, but recommends no more than 50
+BATCH_SIZE = 50
+
+# bounces arrive from the mailer daemon in the thread of the bounced message
+BOUNCE_QUERY = "from:mailer-daemon@googlemail.com"
+
+# bounces received within this window (seconds) are reconciled, it spans several passes of
+# the reconciliation task so that no bounce is missed between them
+BOUNCE_WINDOW = 15 * 60
+
+# ids of the bounces already reported
+_reported_bounces = TTLCache(maxsize=10000, ttl=2 * BOUNCE_WINDOW)
+_reported_bounces_lock = threading.Lock()
+
+
 @retry(stop=stop_after_attempt(3))
-def send_message(service, message: dict) -> bool:
-    """Sends an email message."""
-    sent_message_thread_id = (
-        service.users().messages().send(userId="me", body=message).execute()["threadId"]
-    )
+def send_message(service, message: dict) -> str:
+    """Sends an email message and returns the id of its thread."""
+    return service.users().messages().send(userId="me", body=message).execute()["threadId"]
+
+
+def send_messages(service, messages: list[dict]) -> list[str | None]:
+    """Sends email messages using batch requests.
+
+    Returns the thread id of each message, or None if it could not be sent.
+    """
+    thread_ids = [None] * len(messages)
+    failed = []
+
+    def callback(request_id, response, exception):
+        if exception:
+            failed.append(int(request_id))
+        else:
+            thread_ids[int(request_id)] = response["threadId"]
+
+    for offset in range(0, len(messages), BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=callback)
+        for i, message in enumerate(messages[offset : offset + BATCH_SIZE], start=offset):
+            batch.add(service.users().messages().send(userId="me", body=message), request_id=str(i))
+        batch.execute()
 
-    # wait for a bounce
-    time.sleep(1)
+    # requests in a batch can fail individually (e.g. rate limits), we retry them one by one
+    for i in failed:
+        try:
+            thread_ids[i] = send_message(service, messages[i])
+        except Exception as e:
+            log.error(f"Unable to send email message: {e}")
 
-    messages = (
+    return thread_ids
+
+
+def list_bounces(service, after: int) -> dict[str, str]:
+    """Lists the bounces received after the given timestamp.
+
+    Returns the thread id of each bounce by bounce message id.
+    """
+    bounces = {}
+    request = (
         service.users()
         .messages()
-        .list(userId="me", q="from=mailer-daemon@googlemail.com", maxResults=10)
-        .execute()
-    ).get("messages", [])
+        .list(userId="me", q=f"{BOUNCE_QUERY} after:{after}", maxResults=500)
+    )
+    while request is not None:
+        response = request.execute()
+        bounces.update({m["id"]: m["threadId"] for m in response.get("messages", [])})
+        request = service.users().messages().list_next(request, response)
+    return bounces
+
+
+def get_sent_recipients(service, thread_ids: list[str]) -> dict[str, list[str]]:
+    """Returns the recipients of the messages sent in each thread, using batch requests."""
+    recipients = {}
 
-    for message in messages:
-        if message["threadId"] == sent_message_thread_id:
-            return False
-    return True
+    def callback(request_id, response, exception):
+        if exception:
+            log.warning(f"Unable to fetch email thread {request_id}: {exception}")
+            return
+        recipients[request_id] = [
+            header["value"]
+            for message in response.get("messages", [])
+            if "SENT" in message.get("labelIds", [])
+            for header in message["payload"].get("headers", [])
+            if header["name"].lower() == "to"
+        ]
+
+    for offset in range(0, len(thread_ids), BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=callback)
+        for thread_id in thread_ids[offset : offset + BATCH_SIZE]:
+            batch.add(
+                service.users()
+                .threads()
+                .get(userId="me", id=thread_id, format="metadata", metadataHeaders=["To"]),
+                request_id=thread_id,
+            )
+        batch.execute()
+
+    return recipients
 
 
 def create_html_message(sender: str, recipient: str, cc: str, subject: str, body: str) -> dict:
@@ -77,7 +155,7 @@ class GoogleGmailEmailPlugin(EmailPlugin):
         self.configuration_schema = GoogleConfiguration
         self.scopes = ["https://mail.google.com/"]
 
-    def send(
+    def _create_message(
         self,
         recipient: str,
         notification_text: str,
@@ -85,11 +163,8 @@ class GoogleGmailEmailPlugin(EmailPlugin):
         notification_type: MessageType,
         items: list | None = None,
         **kwargs,
-    ):
-        """Sends an html email based on the type."""
-        # TODO allow for bulk sending (kglisson)
-        client = get_service(self.configuration, "gmail", "v1", self.scopes)
-
+    ) -> dict:
+        """Creates an html email based on the type."""
         subject = notification_text
 
         if kwargs.get("name"):
@@ -111,11 +186,72 @@ class GoogleGmailEmailPlugin(EmailPlugin):
                 notification_template, notification_type, items, self.project_id, **kwargs
             )
 
-        html_message = create_html_message(
+        return create_html_message(
             self.configuration.service_account_delegated_account,
             recipient,
             cc,
             subject,
             message_body,
         )
-        return send_message(client, html_message)
+
+    def send(
+        self,
+        recipient: str,
+        notification_text: str,
+        notification_template: dict,
+        notification_type: MessageType,
+        items: list | None = None,
+        **kwargs,
+    ):
+        """Sends an html email based on the type.
+
+        Bounces are not waited for, they are reported by `reconcile_bounces`.
+        """
+        client = get_service(self.configuration, "gmail", "v1", self.scopes)
+        html_message = self._create_message(
+            recipient, notification_text, notification_template, notification_type, items, **kwargs
+        )
+        send_message(client, html_message)
+        return True
+
+    def send_batch(self, messages: list[dict], **kwargs) -> list[bool]:
+        """Sends html emails using Gmail batch requests.
+
+        Each message holds the arguments of `send`.
+        """
+        client = get_service(self.configuration, "gmail", "v1", self.scopes)
+        html_messages = [self._create_message(**message) for message in messages]
+
+        return [thread_id is not None for thread_id in send_messages(client, html_messages)]
+
+    def reconcile_bounces(self, **kwargs) -> list[str]:
+        """Returns the recipients of the messages that bounced since the last reconciliation.
+
+        The bounces received recently are listed at once and matched to the messages sent in
+        their threads, so bounces are reported whichever process sent the message. Each bounce
+        is returned once per mailbox, whichever project shares it.
+        """
+        client = get_service(self.configuration, "gmail", "v1", self.scopes)
+        bounces = list_bounces(client, int(time.time()) - BOUNCE_WINDOW)
+
+        sender = self.configuration.service_account_delegated_account
+        with _reported_bounces_lock:
+            bounces = {
+                bounce_id: thread_id
+                for bounce_id, thread_id in bounces.items()
+                if (sender, bounce_id) not in _reported_bounces
+            }
+        if not bounces:
+            return []
+
+        recipients = get_sent_recipients(client, sorted(set(bounces.values())))
+
+        bounced = []
+        with _reported_bounces_lock:
+            for bounce_id, thread_id in bounces.items():
+                # threads that could not be fetched are retried on the next pass
+                if thread_id not in recipients:
+                    continue
+                _reported_bounces[(sender, bounce_id)] = thread_id
+                bounced.extend(recipients[thread_id])
+        return bounced
@@ -7,6 +7,7 @@ from sqlalchemy.orm.session import Session
 
 from dispatch.auth import service as user_service
 from dispatch.auth.models import DispatchUser, UserRegister
+from dispatch.conversation import index as conversation_index
 from dispatch.conversation import service as conversation_service
 from dispatch.database.core import get_session, get_organization_session, refetch_db_session
 from dispatch.decorators import timer
@@ -34,35 +35,64 @@ log = logging.getLogger(__file__)
 Subject = NamedTuple("Subject", subject=SubjectMetadata, db_session=Session)
 
 
+def resolve_context_from_organization(
+    slug: str, channel_id: str, thread_id: str = None
+) -> Subject | None:
+    """Attempts to resolve a conversation within a single organization."""
+    with get_organization_session(slug) as scoped_db_session:
+        conversation = conversation_service.get_by_channel_id_ignoring_channel_type(
+            db_session=scoped_db_session, channel_id=channel_id, thread_id=thread_id
+        )
+
+        if conversation:
+            if conversation.incident:
+                subject = SubjectMetadata(
+                    type=IncidentSubjects.incident,
+                    id=conversation.incident_id,
+                    organization_slug=slug,
+                    project_id=conversation.incident.project_id,
+                )
+            else:
+                subject = SubjectMetadata(
+                    type=CaseSubjects.case,
+                    id=conversation.case_id,
+                    organization_slug=slug,
+                    project_id=conversation.case.project_id,
+                )
+            return Subject(subject, db_session=scoped_db_session)
+
+
 @timer
-def resolve_context_from_conversation(channel_id: str, thread_id: str = None) -> Subject | None:
-    """Attempts to resolve a conversation based on the channel id and thread_id."""
-    organization_slugs = []
+def resolve_context_from_conversation(
+    channel_id: str, thread_id: str = None, cache_misses: bool = True
+) -> Subject | None:
+    """Attempts to resolve a conversation based on the channel id and thread_id.
+
+    Conversations that could not be resolved are briefly remembered, unless `cache_misses`
+    is false, e.g. for events of channels that may have just been created.
+    """
+    if cache_misses and conversation_index.is_unresolved(channel_id, thread_id):
+        return None
+
+    # we first try the organization this conversation was last resolved to
+    if slug := conversation_index.get_organization_slug(channel_id, thread_id):
+        if subject := resolve_context_from_organization(slug, channel_id, thread_id):
+            return subject
+        conversation_index.remove(channel_id, thread_id)
+
     with get_session() as db_session:
         organization_slugs = [o.slug for o in organization_service.get_all(db_session=db_session)]
+        organization_slugs = conversation_index.find_organization_slugs(
+            db_session=db_session, channel_id=channel_id, organization_slugs=organization_slugs
+        )
 
     for slug in organization_slugs:
-        with get_organization_session(slug) as scoped_db_session:
-            conversation = conversation_service.get_by_channel_id_ignoring_channel_type(
-                db_session=scoped_db_session, channel_id=channel_id, thread_id=thread_id
-            )
+        if subject := resolve_context_from_organization(slug, channel_id, thread_id):
+            conversation_index.add(channel_id, thread_id, organization_slug=slug)
+            return subject
 
-            if conversation:
-                if conversation.incident:
-                    subject = SubjectMetadata(
-                        type=IncidentSubjects.incident,
-                        id=conversation.incident_id,
-                        organization_slug=slug,
-                        project_id=conversation.incident.project_id,
-                    )
-                else:
-                    subject = SubjectMetadata(
-                        type=CaseSubjects.case,
-                        id=conversation.case_id,
-                        organization_slug=slug,
-                        project_id=conversation.case.project_id,
-                    )
-                return Subject(subject, db_session=scoped_db_session)
+    if cache_misses:
+        conversation_index.add_unresolved(channel_id, thread_id)
 
 
 def select_context_middleware(payload: dict, context: BoltContext, next: Callable) -> None:
@@ -151,8 +181,11 @@ def message_context_middleware(
     if is_bot(request):
         return context.ack()
 
+    # members join channels as they are created, possibly before the conversation is stored
     if subject := resolve_context_from_conversation(
-        channel_id=context.channel_id, thread_id=payload.get("thread_ts")
+        channel_id=context.channel_id,
+        thread_id=payload.get("thread_ts"),
+        cache_misses=payload.get("type") != "member_joined_channel",
     ):
         context.update(subject._asdict())
     else:
@@ -33,18 +33,29 @@ Adding other objects::
     q = s.build_query('star wars', sort=True).limit(10)
     s.search(query=q)
 
+
+Ranked, paginated search::
+
+    s = CompositeSearch(session, [User, Comment, Blog], filters={Blog: published_filter})
+    results, cursor = s.search_page('star wars', limit=20, limit_per_type=10)
+    more_results, cursor = s.search_page('star wars', limit=20, limit_per_type=10, cursor=cursor)
+
 """
 
 from collections import defaultdict
+from sqlalchemy import cast, desc, func, select, tuple_, union_all
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
 from sqlalchemy.sql.expression import literal
 
-from . import inspect_search_vectors, search
+from . import inspect_search_vectors, search, search_manager
 
 
 class CompositeSearch(object):
-    def __init__(self, session, model_classes):
+    def __init__(self, session, model_classes, filters=None):
         self.session = session
         self.model_classes = model_classes
+        # model class -> function adding filters (e.g. permissions) to the model's query
+        self.filters = filters or {}
 
     def union_query(self):
         qs = None
@@ -62,6 +73,66 @@ class CompositeSearch(object):
                 qs = qs.union(q)
         return qs
 
+    def filter_query(self, model_class, query):
+        if model_class in self.filters:
+            return self.filters[model_class](query)
+        return query
+
+    def ranked_union_query(self, search_query, limit_per_type=None, regconfig=None):
+        """Returns the (id, type, rank) of the matching objects of all the models.
+
+        Each model's matches are filtered in SQL, and limited to the `limit_per_type` best
+        ranked when given.
+        """
+        if regconfig is None:
+            regconfig = search_manager.options["regconfig"]
+
+        selects = []
+        for model_class in self.model_classes:
+            vector = inspect_search_vectors(model_class)[0]
+            # ranks are compared as double precision so cursors round trip exactly
+            rank = cast(func.ts_rank_cd(vector, func.tsq_parse(search_query)), DOUBLE_PRECISION)
+            q = self.session.query(
+                model_class.id.label("id"),
+                literal(model_class.__name__).label("type"),
+                rank.label("rank"),
+            ).filter(vector.op("@@")(func.tsq_parse(regconfig, search_query)))
+            q = self.filter_query(model_class, q)
+            if limit_per_type:
+                q = q.order_by(desc(rank), desc(model_class.id)).limit(limit_per_type)
+            selects.append(select(q.subquery()))
+        return union_all(*selects).subquery()
+
+    def search_page(self, search_query, limit=None, limit_per_type=None, cursor=None):
+        """Returns a page of objects by type, best ranked first, and the cursor of the next page.
+
+        Only the objects of the page are loaded. The cursor is None on the last page.
+        """
+        ranked = self.ranked_union_query(search_query, limit_per_type=limit_per_type)
+        order = (ranked.c.rank, ranked.c.type, ranked.c.id)
+        q = self.session.query(*order).order_by(*[desc(c) for c in order])
+        if cursor:
+            q = q.filter(tuple_(*order) < tuple_(*cursor))
+        if limit:
+            q = q.limit(limit + 1)
+
+        search_result = list(q)
+        next_cursor = None
+        if limit and len(search_result) > limit:
+            search_result = search_result[:limit]
+            last = search_result[-1]
+            next_cursor = (last.rank, last.type, last.id)
+
+        objects_by_model = self.split_search_result(search_result)
+        objects_by_type = self.load_search_objects(objects_by_model)
+
+        objects = defaultdict(list)
+        for x in search_result:
+            # objects deleted since the search are skipped
+            if x.id in objects_by_type[x.type]:
+                objects[x.type].append(objects_by_type[x.type][x.id])
+        return objects, next_cursor
+
     def build_query(self, search_query, vector=None, regconfig=None, sort=False):
         qs = self.union_query()
         return search(qs, search_query, vector, regconfig, sort)
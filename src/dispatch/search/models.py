@@ -47,3 +47,4 @@ class SearchResponse(DispatchBase):
     """Model for a search response."""
     query: str | None = None
     results: ContentResponse
+    cursor: str | None = None
@@ -1,3 +1,21 @@
+import base64
+import json
+
+
+def encode_cursor(cursor: tuple) -> str:
+    """Encodes a search cursor into an opaque string."""
+    return base64.urlsafe_b64encode(json.dumps(cursor).encode("utf-8")).decode("utf-8")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """Decodes a search cursor encoded by `encode_cursor`, raises ValueError if invalid."""
+    try:
+        rank, type, id = json.loads(base64.urlsafe_b64decode(cursor.encode("utf-8")))
+    except Exception as e:
+        raise ValueError(f"Invalid search cursor: {cursor}") from e
+    return float(rank), str(type), int(id)
+
+
 def create_filter_expression(filters: dict, model: str) -> list[dict]:
     """Python implementation of @/search/utils/createFilterExpression"""
 
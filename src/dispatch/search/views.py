@@ -1,16 +1,17 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, status
 from fastapi.params import Query
 from starlette.responses import JSONResponse
 
+from dispatch.config import SEARCH_LIMIT_PER_TYPE
 from dispatch.database.core import get_class_by_tablename
 from dispatch.database.service import composite_search
 from dispatch.database.service import CommonParameters
-from dispatch.enums import SearchTypes, UserRoles
-from dispatch.enums import Visibility
+from dispatch.enums import SearchTypes
 
 from .models import (
     SearchResponse,
 )
+from .utils import decode_cursor, encode_cursor
 
 router = APIRouter()
 
@@ -19,40 +20,42 @@ router = APIRouter()
 def search(
     common: CommonParameters,
     type: list[SearchTypes] = Query(..., alias="type[]"),
+    limit: int = Query(None, gt=0),
+    limit_per_type: int = Query(SEARCH_LIMIT_PER_TYPE, alias="limitPerType", gt=0),
+    cursor: str = Query(None),
 ):
-    """Perform a search."""
+    """Perform a search.
+
+    Returns the best ranked results of each type, at most `limit` at a time. The next
+    results are fetched by passing back the returned cursor.
+    """
+    next_cursor = None
     if common["query_str"]:
         models = [get_class_by_tablename(t) for t in type]
-        results = composite_search(
+        try:
+            cursor = decode_cursor(cursor) if cursor else None
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=[{"msg": "Invalid search cursor."}],
+            ) from None
+
+        results, next_cursor = composite_search(
             db_session=common["db_session"],
             query_str=common["query_str"],
             models=models,
             current_user=common["current_user"],
+            limit=limit,
+            limit_per_type=limit_per_type,
+            cursor=cursor,
         )
-        # add a filter for restricted incidents
-        admin_projects = []
-        for p in common["current_user"].projects:
-            if p.role == UserRoles.admin:
-                admin_projects.append(p)
-
-        filtered_incidents = []
-        current_user_email = common["current_user"].email
-        for incident in results["Incident"]:
-            participant_emails: list[str] = [
-                participant.individual.email
-                for participant in incident.participants
-                if participant.individual
-            ]
-            if (
-                incident.project in admin_projects
-                or current_user_email in participant_emails
-                or incident.visibility == Visibility.open
-            ):
-                filtered_incidents.append(incident)
-
-        results["Incident"] = filtered_incidents
-
     else:
         results = []
 
-    return SearchResponse(**{"query": common["query_str"], "results": results}).dict(by_alias=False)
+    return SearchResponse(
+        **{
+            "query": common["query_str"],
+            "results": results,
+            "cursor": encode_cursor(next_cursor) if next_cursor else None,
+        }
+    ).dict(by_alias=False)
@@ -0,0 +1,218 @@
+"""
+.. module: dispatch.signal.consumer
+    :platform: Unix
+    :copyright: (c) 2019 by Netflix Inc., see AUTHORS for more
+    :license: Apache, see LICENSE for more details.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+
+from dispatch.database.core import get_organization_session, get_session
+from dispatch.metrics import provider as metrics_provider
+from dispatch.organization.service import get_all as get_all_organizations
+from dispatch.plugin import service as plugin_service
+from dispatch.project import service as project_service
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ConsumerKey:
+    """Identifies a signal consumer: a signal-consumer plugin instance of a project."""
+
+    organization_slug: str
+    project_id: int
+    plugin_instance_id: int
+    plugin_slug: str
+
+    @property
+    def tags(self) -> dict:
+        return {
+            "organization": self.organization_slug,
+            "project": str(self.project_id),
+            "plugin": self.plugin_slug,
+        }
+
+    def __str__(self) -> str:
+        return (
+            f"{self.plugin_slug} "
+            f"(organization: {self.organization_slug}, project: {self.project_id})"
+        )
+
+
+@dataclass
+class ConsumerStats:
+    """Throughput and error counters of a signal consumer."""
+
+    key: ConsumerKey
+    received: int = 0
+    errors: int = 0
+    restarts: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, received: int = 0, errors: int = 0) -> None:
+        """Records signals received and errors encountered by the consumer."""
+        with self._lock:
+            self.received += received
+            self.errors += errors
+        if received:
+            metrics_provider.counter("signal.consumer.received", received, tags=self.key.tags)
+        if errors:
+            metrics_provider.counter("signal.consumer.error", errors, tags=self.key.tags)
+
+
+class _Consumer(object):
+    """A supervised consumer thread and its restart state."""
+
+    def __init__(self, key: ConsumerKey):
+        self.key = key
+        self.stats = ConsumerStats(key=key)
+        self.thread = None
+        self.started_at = None
+        self.restart_at = 0.0
+        self.backoff = 0.0
+
+
+class SignalConsumerSupervisor(object):
+    """Runs every active signal-consumer plugin instance in its own thread.
+
+    Each consumer gets its own database session. Consumers that die are restarted with an
+    exponential backoff, which is reset once a consumer has stayed up for `max_backoff`
+    seconds. The set of consumers is refreshed periodically, so new projects and plugin
+    instances are picked up without restarting the process.
+    """
+
+    def __init__(
+        self,
+        min_backoff: float = 1,
+        max_backoff: float = 300,
+        monitor_interval: float = 5,
+        refresh_interval: float = 300,
+    ):
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.monitor_interval = monitor_interval
+        self.refresh_interval = refresh_interval
+        self.stopped = threading.Event()
+        self.consumers: dict[ConsumerKey, _Consumer] = {}
+
+    def discover(self) -> list[ConsumerKey]:
+        """Returns the active signal-consumer plugin instances of all projects."""
+        keys = []
+        with get_session() as db_session:
+            organization_slugs = [o.slug for o in get_all_organizations(db_session=db_session)]
+
+        for organization_slug in organization_slugs:
+            try:
+                with get_organization_session(organization_slug) as db_session:
+                    for project in project_service.get_all(db_session=db_session):
+                        plugin_instances = plugin_service.get_active_instances(
+                            db_session=db_session,
+                            plugin_type="signal-consumer",
+                            project_id=project.id,
+                        )
+                        if not plugin_instances:
+                            log.warning(
+                                f"No signals consumed. No signal-consumer plugins enabled. Project: {project.name}. Organization: {organization_slug}"
+                            )
+                        for plugin_instance in plugin_instances:
+                            keys.append(
+                                ConsumerKey(
+                                    organization_slug=organization_slug,
+                                    project_id=project.id,
+                                    plugin_instance_id=plugin_instance.id,
+                                    plugin_slug=plugin_instance.plugin.slug,
+                                )
+                            )
+            except Exception as e:
+                log.exception(
+                    f"Error fetching signal consumers for organization {organization_slug}: {e}"
+                )
+        return keys
+
+    def refresh(self) -> None:
+        """Supervises new plugin instances and forgets stopped, no longer active ones."""
+        keys = set(self.discover())
+        for key in keys:
+            if key not in self.consumers:
+                log.info(f"Supervising signal consumer {key}")
+                self.consumers[key] = _Consumer(key)
+
+        for key, consumer in list(self.consumers.items()):
+            if key not in keys and (consumer.thread is None or not consumer.thread.is_alive()):
+                log.info(f"No longer supervising signal consumer {key}")
+                del self.consumers[key]
+
+    def run(self) -> None:
+        """Supervises the consumers until the supervisor is stopped."""
+        refreshed_at = None
+        while not self.stopped.is_set():
+            now = time.monotonic()
+            if refreshed_at is None or now - refreshed_at > self.refresh_interval:
+                try:
+                    self.refresh()
+                except Exception as e:
+                    log.exception(f"Error refreshing signal consumers: {e}")
+                refreshed_at = now
+
+            for consumer in self.consumers.values():
+                self.supervise(consumer, now)
+
+            self.stopped.wait(self.monitor_interval)
+
+    def stop(self) -> None:
+        """Stops supervising. Consumer threads are daemons and end with the process."""
+        self.stopped.set()
+
+    def supervise(self, consumer: _Consumer, now: float) -> None:
+        """Starts a consumer that is not running, once its backoff has elapsed."""
+        if consumer.thread is not None:
+            if consumer.thread.is_alive():
+                if now - consumer.started_at > self.max_backoff:
+                    consumer.backoff = 0.0
+                return
+
+            # the consumer died, it is restarted after a backoff
+            consumer.thread = None
+            consumer.backoff = min(max(consumer.backoff * 2, self.min_backoff), self.max_backoff)
+            consumer.restart_at = now + consumer.backoff
+            consumer.stats.restarts += 1
+            metrics_provider.counter("signal.consumer.restart", tags=consumer.key.tags)
+            log.warning(
+                f"Signal consumer {consumer.key} stopped. Restarting in {consumer.backoff} seconds. Stats: {consumer.stats}"
+            )
+
+        if now < consumer.restart_at:
+            return
+
+        consumer.started_at = now
+        consumer.thread = threading.Thread(
+            target=self.consume,
+            args=(consumer,),
+            name=f"signal-consumer-{consumer.key.plugin_instance_id}",
+            daemon=True,
+        )
+        consumer.thread.start()
+
+    def consume(self, consumer: _Consumer) -> None:
+        """Runs a consumer's plugin with a session of its own."""
+        key = consumer.key
+        try:
+            with get_organization_session(key.organization_slug) as db_session:
+                project = project_service.get(db_session=db_session, project_id=key.project_id)
+                plugin_instance = plugin_service.get_instance(
+                    db_session=db_session, plugin_instance_id=key.plugin_instance_id
+                )
+                if not project or not plugin_instance or not plugin_instance.enabled:
+                    log.warning(f"Signal consumer {key} is no longer enabled.")
+                    return
+
+                plugin_instance.instance.consume(
+                    db_session=db_session, project=project, stats=consumer.stats
+                )
+        except Exception as e:
+            consumer.stats.record(errors=1)
+            log.exception(f"Error consuming signals with {key}: {e}")
@@ -0,0 +1,172 @@
+"""
+.. module: dispatch.signal.processor
+    :platform: Unix
+    :copyright: (c) 2019 by Netflix Inc., see AUTHORS for more
+    :license: Apache, see LICENSE for more details.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+
+from dispatch.database.core import engine, get_organization_session, get_session
+from dispatch.metrics import provider as metrics_provider
+from dispatch.organization.service import get_all as get_all_organizations
+
+from . import flows as signal_flows
+from . import service as signal_service
+
+log = logging.getLogger(__name__)
+
+
+class SignalProcessor(object):
+    """Processes unprocessed signal instances with a pool of worker threads.
+
+    Workers claim batches of signal instances (see `claim_unprocessed_signal_instances`),
+    so several workers, processes or nodes can share the backlog. Each worker visits the
+    organizations in turn, claiming at most one batch per organization per round, and backs
+    off exponentially when a whole round finds nothing to do.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = 1,
+        batch_size: int = 50,
+        idle_sleep: float = 1,
+        max_idle_sleep: float = 30,
+        organization_refresh_interval: float = 300,
+    ):
+        self.num_workers = num_workers
+        self.batch_size = batch_size
+        self.idle_sleep = idle_sleep
+        self.max_idle_sleep = max_idle_sleep
+        self.organization_refresh_interval = organization_refresh_interval
+        self.stopped = threading.Event()
+        self._organization_slugs = []
+        self._organizations_refreshed_at = None
+        self._lock = threading.Lock()
+
+    def get_organization_slugs(self) -> list[str]:
+        """Returns the organization slugs, refreshed periodically."""
+        with self._lock:
+            refreshed_at = self._organizations_refreshed_at
+            if (
+                refreshed_at is None
+                or time.monotonic() - refreshed_at > self.organization_refresh_interval
+            ):
+                with get_session() as db_session:
+                    self._organization_slugs = [
+                        o.slug for o in get_all_organizations(db_session=db_session)
+                    ]
+                self._organizations_refreshed_at = time.monotonic()
+            return self._organization_slugs
+
+    def run(self) -> None:
+        """Starts the workers and blocks until the processor is stopped."""
+        workers = [
+            threading.Thread(target=self.work, args=(i,), name=f"signal-processor-{i}")
+            for i in range(self.num_workers)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    def stop(self) -> None:
+        """Stops the workers once they finish their current batch."""
+        self.stopped.set()
+
+    def work(self, worker_id: int) -> None:
+        """Runs a worker until the processor is stopped."""
+        # advisory locks belong to a connection, so each worker claims through its own, shared
+        # by all organizations
+        claim_session = None
+        sleep = self.idle_sleep
+        offset = worker_id
+
+        try:
+            while not self.stopped.is_set():
+                try:
+                    organization_slugs = self.get_organization_slugs()
+                except Exception as e:
+                    log.exception(f"Error fetching organizations: {e}")
+                    organization_slugs = []
+
+                processed = 0
+                # workers start their rounds at different organizations
+                for i in range(len(organization_slugs)):
+                    if self.stopped.is_set():
+                        break
+
+                    slug = organization_slugs[(offset + i) % len(organization_slugs)]
+                    try:
+                        if claim_session is None:
+                            claim_session = Session(bind=engine.connect())
+                        processed += self.process_batch(slug, claim_session)
+                    except Exception as e:
+                        log.exception(f"Error processing signals for organization {slug}: {e}")
+                        if claim_session is not None:
+                            self._close_claim_session(claim_session)
+                            claim_session = None
+                offset += 1
+
+                if processed:
+                    sleep = self.idle_sleep
+                else:
+                    self.stopped.wait(sleep)
+                    sleep = min(sleep * 2, self.max_idle_sleep)
+        finally:
+            if claim_session is not None:
+                self._close_claim_session(claim_session)
+
+    def process_batch(self, organization_slug: str, claim_session: Session) -> int:
+        """Claims and processes a batch of signal instances, returns the number processed."""
+        claimed = signal_service.claim_unprocessed_signal_instances(
+            claim_session, organization_slug, limit=self.batch_size
+        )
+        if not claimed:
+            return 0
+
+        tags = {"organization": organization_slug}
+        oldest = min(created_at for _, created_at in claimed)
+        lag = datetime.now(timezone.utc).replace(tzinfo=None) - oldest
+        metrics_provider.gauge("signal.processor.lag", lag.total_seconds(), tags=tags)
+
+        with get_organization_session(organization_slug) as db_session:
+            for signal_instance_id, _ in claimed:
+                start = time.perf_counter()
+                try:
+                    signal_flows.signal_instance_create_flow(
+                        db_session=db_session,
+                        signal_instance_id=signal_instance_id,
+                    )
+                    db_session.commit()
+                    metrics_provider.counter("signal.processor.processed", tags=tags)
+                except Exception as e:
+                    log.exception(f"Error processing signal instance {signal_instance_id}: {e}")
+                    db_session.rollback()
+                    metrics_provider.counter("signal.processor.error", tags=tags)
+                finally:
+                    metrics_provider.timer(
+                        "signal.processor.elapsed", time.perf_counter() - start, tags=tags
+                    )
+                    signal_service.release_signal_instance(
+                        claim_session, organization_slug, signal_instance_id
+                    )
+
+        return len(claimed)
+
+    @staticmethod
+    def _close_claim_session(claim_session: Session) -> None:
+        """Closes a claim session and discards its connection, releasing any advisory locks left."""
+        try:
+            connection = claim_session.get_bind()
+            claim_session.close()
+            # advisory locks would survive the connection being returned to the pool
+            connection.invalidate()
+            connection.close()
+        except Exception as e:
+            log.warning(f"Error closing signal processor claim session: {e}")
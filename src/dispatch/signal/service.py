@@ -1,21 +1,36 @@
 import json
 import logging
 import uuid
+from cachetools import TTLCache
 from datetime import datetime, timedelta, timezone
 from collections import defaultdict
 from fastapi import HTTPException, status
 from pydantic import ValidationError
-from sqlalchemy import asc, desc, or_, func, and_, select, cast
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    String,
+    and_,
+    asc,
+    cast,
+    column,
+    desc,
+    func,
+    literal_column,
+    or_,
+    select,
+    table,
+)
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.orm.query import Query
 from sqlalchemy.sql.expression import true
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, OID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from dispatch.auth.models import DispatchUser
 from dispatch.case.models import Case
 from dispatch.case.priority import service as case_priority_service
 from dispatch.case.type import service as case_type_service
 from dispatch.case.type.models import CaseType
+from dispatch.database.core import get_organization_schema
 from dispatch.database.service import apply_filter_specific_joins, apply_filters
 from dispatch.entity.models import Entity
 from dispatch.entity_type import service as entity_type_service
@@ -23,6 +38,7 @@ from dispatch.entity_type.models import EntityType
 from dispatch.event import service as event_service
 from dispatch.individual import service as individual_service
 from dispatch.project import service as project_service
+from dispatch.project.models import Project
 from dispatch.service import service as service_service
 from dispatch.tag import service as tag_service
 from dispatch.workflow import service as workflow_service
@@ -722,6 +738,206 @@ def create_instance(
     return signal_instance
 
 
+class SignalDefinitionCache(object):
+    """Caches the ids of the definitions signal instances refer to, per project.
+
+    Used by consumers ingesting signal instances in bulk, so that signal definitions,
+    case priorities, case types and oncall services are not looked up for every instance.
+    Entries expire after `ttl` seconds so changes to the definitions are picked up.
+    """
+
+    def __init__(self, ttl: float = 300, maxsize: int = 1024):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def _get(self, key, resolve):
+        if key not in self._cache:
+            self._cache[key] = resolve()
+        return self._cache[key]
+
+    def get_signal(self, *, db_session: Session, project_id: int, external_id: str | None):
+        """Returns the (id, name, external_id) of the signal definition, or of the default."""
+
+        def resolve():
+            signal_definition = None
+            if external_id:
+                signal_definition = (
+                    db_session.query(Signal).filter(Signal.external_id == external_id).one_or_none()
+                )
+            if not signal_definition:
+                signal_definition = get_default(db_session=db_session, project_id=project_id)
+            if not signal_definition:
+                return None
+            return signal_definition.id, signal_definition.name, signal_definition.external_id
+
+        return self._get(("signal", project_id, external_id), resolve)
+
+    def get_case_priority_id(self, *, db_session: Session, project_id: int, case_priority_in):
+        return self._get(
+            ("case_priority", project_id, case_priority_in.name),
+            lambda: case_priority_service.get_by_name_or_default(
+                db_session=db_session, project_id=project_id, case_priority_in=case_priority_in
+            ).id,
+        )
+
+    def get_case_type_id(self, *, db_session: Session, project_id: int, case_type_in):
+        return self._get(
+            ("case_type", project_id, case_type_in.name),
+            lambda: case_type_service.get_by_name_or_default(
+                db_session=db_session, project_id=project_id, case_type_in=case_type_in
+            ).id,
+        )
+
+    def get_oncall_service_id(self, *, db_session: Session, project_id: int, name: str):
+        def resolve():
+            oncall_service = service_service.get_by_name(
+                db_session=db_session, project_id=project_id, name=name
+            )
+            return oncall_service.id if oncall_service else None
+
+        return self._get(("oncall_service", project_id, name), resolve)
+
+
+def create_instances(
+    *,
+    db_session: Session,
+    project: Project,
+    signal_instances_in: list[SignalInstanceCreate],
+    definition_cache: SignalDefinitionCache,
+) -> tuple[list[str | None], set[str]]:
+    """Creates signal instances in bulk.
+
+    Existing signal instances are looked up with a single query and new ones are inserted
+    with a single multi-row insert, skipping any inserted concurrently. If the insert fails,
+    the rows are inserted one by one so that only the bad ones are left out. Returns the id
+    of each signal instance, or None if it could not be created, and the set of ids created.
+    """
+    ids = []
+    rows = {}
+    for signal_instance_in in signal_instances_in:
+        try:
+            signal_instance_id, row = _build_instance_row(
+                db_session=db_session,
+                project=project,
+                signal_instance_in=signal_instance_in,
+                definition_cache=definition_cache,
+            )
+        except Exception as e:
+            log.exception(f"Unable to create signal instance: {e}")
+            ids.append(None)
+            continue
+        ids.append(signal_instance_id)
+        rows.setdefault(signal_instance_id, row)
+
+    if not rows:
+        return ids, set()
+
+    existing = {
+        str(id)
+        for (id,) in db_session.query(SignalInstance.id).filter(
+            SignalInstance.id.in_(list(rows.keys()))
+        )
+    }
+    new_rows = [row for id, row in rows.items() if id not in existing]
+
+    created = set()
+    if new_rows:
+        try:
+            with db_session.begin_nested():
+                created = _insert_instance_rows(db_session, new_rows)
+        except Exception as e:
+            # a single bad row fails the whole insert, so the rows are inserted one by one
+            log.warning(f"Unable to insert signal instances in bulk, inserting one by one: {e}")
+            failed = set()
+            for row in new_rows:
+                try:
+                    with db_session.begin_nested():
+                        created |= _insert_instance_rows(db_session, [row])
+                except Exception as e:
+                    log.exception(f"Unable to create signal instance {row['id']}: {e}")
+                    failed.add(row["id"])
+            ids = [None if id in failed else id for id in ids]
+    db_session.commit()
+    return ids, created
+
+
+def _insert_instance_rows(db_session: Session, rows: list[dict]) -> set[str]:
+    """Inserts signal instance rows, skipping existing ones, and returns the ids inserted."""
+    stmt = (
+        pg_insert(SignalInstance)
+        .on_conflict_do_nothing(index_elements=[SignalInstance.id])
+        .returning(SignalInstance.id)
+    )
+    return {str(id) for id in db_session.scalars(stmt, rows)}
+
+
+def _build_instance_row(
+    *,
+    db_session: Session,
+    project: Project,
+    signal_instance_in: SignalInstanceCreate,
+    definition_cache: SignalDefinitionCache,
+) -> tuple[str, dict]:
+    """Returns the id and the column values of a signal instance to be inserted."""
+    raw = signal_instance_in.raw.copy()
+    id = str(raw.get("id") or uuid.uuid4())
+    if not is_valid_uuid(id):
+        raise ValueError(f"Invalid signal id format. Expecting UUIDv4 format. Signal id: {id}")
+
+    if not signal_instance_in.external_id:
+        msg = "A detection external id must be provided in order to get the signal definition."
+        raise SignalNotIdentifiedException(msg)
+
+    signal = definition_cache.get_signal(
+        db_session=db_session, project_id=project.id, external_id=signal_instance_in.external_id
+    )
+    if not signal:
+        msg = (
+            "No signal definition could be found by external id "
+            f"{signal_instance_in.external_id}, and no default exists."
+        )
+        raise SignalNotDefinedException(msg)
+
+    row = {
+        "id": id,
+        "project_id": project.id,
+        "signal_id": signal[0],
+        "canary": signal_instance_in.canary,
+        "conversation_target": signal_instance_in.conversation_target,
+        "filter_action": signal_instance_in.filter_action,
+        "case_priority_id": None,
+        "case_type_id": None,
+        "oncall_service_id": None,
+        # every row of a multi-row insert sets the same columns
+        "created_at": signal_instance_in.created_at or datetime.now(timezone.utc),
+    }
+
+    if signal_instance_in.case_priority:
+        row["case_priority_id"] = definition_cache.get_case_priority_id(
+            db_session=db_session,
+            project_id=project.id,
+            case_priority_in=signal_instance_in.case_priority,
+        )
+
+    if signal_instance_in.case_type:
+        row["case_type_id"] = definition_cache.get_case_type_id(
+            db_session=db_session,
+            project_id=project.id,
+            case_type_in=signal_instance_in.case_type,
+        )
+
+    if signal_instance_in.oncall_service:
+        raw.pop("oncall_service", None)
+        row["oncall_service_id"] = definition_cache.get_oncall_service_id(
+            db_session=db_session,
+            project_id=project.id,
+            name=signal_instance_in.oncall_service.name,
+        )
+
+    # we round trip the raw data to json-ify date strings
+    row["raw"] = json.loads(json.dumps(raw))
+    return id, row
+
+
 def update_instance(
     *, db_session: Session, signal_instance_in: SignalInstanceCreate
 ) -> SignalInstance:
@@ -920,6 +1136,108 @@ def get_unprocessed_signal_instance_ids(session: Session) -> list[int]:
     )
 
 
+# namespace for the advisory locks held while a signal instance is being processed
+SIGNAL_INSTANCE_LOCK_NAMESPACE = "signal-instance"
+
+pg_locks = table(
+    "pg_locks",
+    column("locktype"),
+    column("database"),
+    column("classid"),
+    column("objid"),
+    column("objsubid"),
+    schema="pg_catalog",
+)
+
+
+def get_signal_instance_lock_keys(organization_slug: str, signal_instance_id) -> tuple:
+    """Returns the two keys of the advisory lock of a signal instance.
+
+    The first key is qualified with the organization, as all organizations share a database.
+    """
+    return (
+        func.hashtext(f"{SIGNAL_INSTANCE_LOCK_NAMESPACE}:{organization_slug}"),
+        func.hashtext(cast(signal_instance_id, String)),
+    )
+
+
+def claim_unprocessed_signal_instances(
+    session: Session, organization_slug: str, limit: int = 50
+) -> list[tuple[uuid.UUID, datetime]]:
+    """Claims unprocessed signal instances so that concurrent processors skip them.
+
+    Each instance is claimed with a session level advisory lock, which, unlike a row lock,
+    outlives the commits made while processing the instance. Instances already claimed are
+    excluded before the limit is applied, so concurrent processors claim different batches.
+    The session must be bound to a single connection and every claimed instance must be
+    released with `release_signal_instance`.
+
+    Args:
+        session (Session): A database session bound to a single connection.
+        organization_slug (str): The organization of the signal instances.
+        limit (int): The maximum number of signal instances to claim.
+
+    Returns:
+        list[tuple[uuid.UUID, datetime]]: The ids and creation times of the claimed instances.
+    """
+    namespace_key, instance_key = get_signal_instance_lock_keys(
+        organization_slug, SignalInstance.id
+    )
+    claimed_elsewhere = (
+        select(pg_locks.c.objid)
+        .where(pg_locks.c.locktype == "advisory")
+        .where(
+            pg_locks.c.database
+            == select(literal_column("oid"))
+            .select_from(table("pg_database", schema="pg_catalog"))
+            .where(literal_column("datname") == func.current_database())
+            .scalar_subquery()
+        )
+        .where(pg_locks.c.objsubid == 2)
+        .where(pg_locks.c.classid == cast(namespace_key, OID))
+        .where(pg_locks.c.objid == cast(instance_key, OID))
+    )
+    candidates = (
+        select(SignalInstance.id, SignalInstance.created_at)
+        .filter(SignalInstance.filter_action == None)  # noqa
+        .filter(SignalInstance.case_id == None)  # noqa
+        .filter(~claimed_elsewhere.exists())
+        .order_by(SignalInstance.created_at.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .subquery()
+    )
+    # the limit keeps the advisory locks from being taken on rows outside the batch
+    claimed = session.execute(
+        select(candidates.c.id, candidates.c.created_at)
+        .where(
+            func.pg_try_advisory_lock(
+                *get_signal_instance_lock_keys(organization_slug, candidates.c.id)
+            )
+        )
+        .order_by(candidates.c.created_at.asc()),
+        execution_options={
+            "schema_translate_map": {None: get_organization_schema(organization_slug)}
+        },
+    ).all()
+    session.commit()
+    return [(row.id, row.created_at) for row in claimed]
+
+
+def release_signal_instance(
+    session: Session, organization_slug: str, signal_instance_id: uuid.UUID
+) -> None:
+    """Releases a signal instance claimed with `claim_unprocessed_signal_instances`."""
+    session.execute(
+        select(
+            func.pg_advisory_unlock(
+                *get_signal_instance_lock_keys(organization_slug, str(signal_instance_id))
+            )
+        )
+    )
+    session.commit()
+
+
 def get_instances_in_case(db_session: Session, case_id: int) -> Query:
     """
     Retrieves signal instances associated with a given case.
@@ -986,6 +1304,56 @@ def get_cases_for_signal_by_resolution_reason(
     )
 
 
+def get_recent_cases_for_signal(
+    db_session: Session, signal_id: int, exclude_case_id: int = None, limit: int = 10
+) -> list[Case]:
+    """
+    Retrieves the most recent cases associated with a given signal for every resolution reason.
+
+    Args:
+        db_session (Session): The database session.
+        signal_id (int): The ID of the signal.
+        exclude_case_id (int, optional): The ID of a case to leave out.
+        limit (int, optional): The maximum number of cases to retrieve per resolution reason.
+
+    Returns:
+        list[Case]: The cases, with their conversations loaded. The most recent case of every
+            resolution reason comes first, then the second most recent, and so on.
+    """
+    case_ids = select(SignalInstance.case_id).where(SignalInstance.signal_id == signal_id)
+    ranked_cases = (
+        select(
+            Case.id,
+            func.row_number()
+            .over(partition_by=Case.resolution_reason, order_by=desc(Case.created_at))
+            .label("rank"),
+        )
+        .where(Case.id.in_(case_ids))
+        .where(Case.resolution_reason.isnot(None))
+        .where(Case.id != exclude_case_id)
+        .subquery()
+    )
+    return (
+        db_session.query(Case)
+        .options(selectinload(Case.conversation))
+        .join(ranked_cases, ranked_cases.c.id == Case.id)
+        .filter(ranked_cases.c.rank <= limit)
+        .order_by(ranked_cases.c.rank, Case.resolution_reason)
+        .all()
+    )
+
+
+def get_first_instance_raw_by_case_id(db_session: Session, case_ids: list[int]) -> dict[int, dict]:
+    """Returns the raw data of the first signal instance of each of the given cases."""
+    rows = (
+        db_session.query(SignalInstance.case_id, SignalInstance.raw)
+        .filter(SignalInstance.case_id.in_(case_ids))
+        .distinct(SignalInstance.case_id)
+        .order_by(SignalInstance.case_id, asc(SignalInstance.created_at))
+    )
+    return dict(rows)
+
+
 def get_signal_stats(
     *,
     db_session: Session,
@@ -15,6 +15,7 @@ from sqlalchemy.exc import IntegrityError
 
 from dispatch.auth.permissions import PermissionsDependency, SensitiveProjectActionPermission
 from dispatch.auth.service import CurrentUser
+from dispatch.common.utils.views import create_pagination_response
 from dispatch.database.core import DbSession
 from dispatch.database.service import CommonParameters, search_filter_sort_paginate
 from dispatch.models import OrganizationSlug, PrimaryKey
@@ -64,7 +65,8 @@ log = logging.getLogger(__name__)
 @router.get("/instances", response_model=SignalInstancePagination)
 def get_signal_instances(common: CommonParameters):
     """Gets all signal instances."""
-    return search_filter_sort_paginate(model="SignalInstance", **common)
+    pagination = search_filter_sort_paginate(model="SignalInstance", **common)
+    return create_pagination_response(SignalInstancePagination, pagination)
 
 
 @router.post("/instances", response_model=SignalInstanceRead)
@@ -279,7 +281,8 @@ def delete_filter(db_session: DbSession, signal_filter_id: PrimaryKey):
 @router.get("", response_model=SignalPagination)
 def get_signals(common: CommonParameters):
     """Gets all signal definitions."""
-    return search_filter_sort_paginate(model="Signal", **common)
+    pagination = search_filter_sort_paginate(model="Signal", **common)
+    return create_pagination_response(SignalPagination, pagination)
 
 
 @router.get("/stats", response_model=SignalStats)
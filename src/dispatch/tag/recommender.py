@@ -6,134 +6,161 @@
 """
 
 import logging
-from collections import defaultdict
-from typing import Any
+import os
+import pickle
 import tempfile
-import pandas as pd
-from pandas.core.frame import DataFrame
+import threading
+from datetime import datetime
+from typing import Any
 
+import numpy as np
+from scipy import sparse
 from sqlalchemy.orm import Session
 
-from dispatch.tag import service as tag_service
+from dispatch.tag.models import Tag
 
 log = logging.getLogger(__name__)
 
 
-def save_model(dataframe: DataFrame, organization_slug: str, project_slug: str, model_name: str):
-    """Saves a correlation dataframe to disk."""
-    file_name = f"{tempfile.gettempdir()}/{organization_slug}-{project_slug}-{model_name}.pkl"
-    dataframe.to_pickle(file_name)
-
-
-def load_model(organization_slug: str, project_slug: str, model_name: str):
-    """Loads a correlation dataframe from disk."""
-    file_name = f"{tempfile.gettempdir()}/{organization_slug}-{project_slug}-{model_name}.pkl"
-    return pd.read_pickle(file_name)
-
-
-def correlation(df, tag_a, tag_b):
-    """Determine the probability of correlation/association."""
-    # Find all rows where a AND b == True
-    a_and_b = df[(df[tag_a]) & (df[tag_b])]
-
-    # Find all rows where a == True AND b != True
-    a_not_b = df[(df[tag_a]) & ~(df[tag_b])]
-    # Find all rows where b == True AND a != True
-    b_not_a = df[(df[tag_b]) & ~(df[tag_a])]
-
-    # Calculate the number of positive and possible outcomes using the shape attribute
-    possible_outcomes = (
-        a_and_b.shape[0] + a_not_b.shape[0] + b_not_a.shape[0]
-    )  # shape[0] returns the number of rows
-    positive_outcomes = a_and_b.shape[0]
-
-    # Calculate the final correlation coefficient
-    r = positive_outcomes / possible_outcomes
-
-    return r
-
-
-def correlate_with_every_tag(df, tag_a):
-    """Create correlations between every tag."""
+class TagModel(object):
+    """Tag co-occurrence counts over a set of items.
+
+    `counts[a, b]` is the number of items tagged with both the tags at index a and b, so the
+    diagonal holds the number of items tagged with each tag. The tags of every item are kept
+    so that the counts can be updated when an item's tags change, along with the time up to
+    which the items were updated.
+    """
+
+    version = 1
+
+    def __init__(
+        self,
+        tag_ids: list[int],
+        item_tags: dict[int, frozenset[int]],
+        counts,
+        updated_at: datetime | None = None,
+    ):
+        self.tag_ids = tag_ids
+        self.tag_index = {tag_id: i for i, tag_id in enumerate(tag_ids)}
+        self.item_tags = item_tags
+        self.counts = counts
+        self.updated_at = updated_at
+
+    @classmethod
+    def build(cls, items: list[Any]) -> "TagModel":
+        """Builds the model from items with tags."""
+        item_tags = {i.id: frozenset(t.id for t in i.tags) for i in items}
+        tag_ids = sorted({tag_id for tags in item_tags.values() for tag_id in tags})
+        tag_index = {tag_id: i for i, tag_id in enumerate(tag_ids)}
+
+        # item x tag incidence matrix
+        rows, columns = [], []
+        for row, tags in enumerate(item_tags.values()):
+            for tag_id in tags:
+                rows.append(row)
+                columns.append(tag_index[tag_id])
+        incidence = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int64), (rows, columns)),
+            shape=(len(item_tags), len(tag_ids)),
+        )
 
-    unique_tags = list(df.columns)
-    # Loop through every tag and store the correlation in a list
-    correlation_list = []
-    for tag_b in unique_tags:
-        correlation_list.append(correlation(df, tag_a, tag_b))
-    return correlation_list
+        return cls(tag_ids, item_tags, (incidence.T @ incidence).tocsr())
 
+    def _tag_vector(self, tag_ids: frozenset[int]):
+        vector = np.zeros(len(self.tag_ids), dtype=np.int64)
+        vector[[self.tag_index[tag_id] for tag_id in tag_ids]] = 1
+        return sparse.csr_matrix(vector)
 
-def get_unique_tags(items: list[Any]):
-    """Get unique tags."""
-    unique_tags = {}
-    for i in items:
-        for t in i.tags:
-            unique_tags[t.id] = t.id
-    return unique_tags
+    def update(self, item_id: int, tag_ids: list[int]) -> "TagModel":
+        """Returns a model with the counts updated for the current tags of an item.
 
+        The model itself is left untouched, as it may be in use by other threads.
+        """
+        old_tags = self.item_tags.get(item_id, frozenset())
+        new_tags = frozenset(tag_ids)
+        if old_tags == new_tags:
+            return self
 
-def create_correlation_dataframe(dataframe):
-    """Create the correlation dataframe based on the boolean dataframe."""
-    unique_tags = list(dataframe.columns)
+        model = TagModel(
+            self.tag_ids + sorted(new_tags - self.tag_index.keys()),
+            {**self.item_tags, item_id: new_tags},
+            self.counts.copy(),
+            self.updated_at,
+        )
+        model.counts.resize((len(model.tag_ids), len(model.tag_ids)))
 
-    correlation_matrix_dict = {}
+        old_vector = model._tag_vector(old_tags)
+        new_vector = model._tag_vector(new_tags)
+        model.counts = (
+            model.counts + new_vector.T @ new_vector - old_vector.T @ old_vector
+        ).tocsr()
+        model.counts.eliminate_zeros()
+        return model
 
-    for tag_a in unique_tags:
-        correlation_matrix_dict[tag_a] = correlate_with_every_tag(dataframe, tag_a)
+    def correlations(self, tag_id: int) -> np.ndarray:
+        """Returns how strongly each tag is associated with the given tag.
 
-    correlated_dataframe = pd.DataFrame(correlation_matrix_dict)
-    correlated_dataframe["index"] = unique_tags
-    return correlated_dataframe.set_index("index")
+        The association is the number of items with both tags over the number of items
+        with either tag.
+        """
+        i = self.tag_index[tag_id]
+        both = self.counts.getrow(i).toarray().ravel().astype(float)
+        totals = self.counts.diagonal().astype(float)
+        either = totals[i] + totals - both
+        return np.divide(both, either, out=np.zeros_like(both), where=either > 0)
 
+    def recommend(self, tag_id: int, recommendations: int) -> list[int]:
+        """Returns the ids of the tags most associated with the given tag."""
+        if tag_id not in self.tag_index:
+            return []
 
-def create_boolean_dataframe(items: list[Any]):
-    """Create a boolean dataframe with tag and item data."""
-    unique_tags = get_unique_tags(items)
-    boolean_df = pd.DataFrame(columns=unique_tags.values())
+        correlations = self.correlations(tag_id)
+        correlations[self.tag_index[tag_id]] = -1
+        best = np.argsort(-correlations, kind="stable")[:recommendations]
+        return [self.tag_ids[i] for i in best if correlations[i] > 0]
 
-    data_dict = defaultdict(list)
-    for col in boolean_df:
-        for i in items:
-            tag_ids = [t.id for t in i.tags]
-            data_dict[col].append(col in tag_ids)
 
-    for col in boolean_df:
-        boolean_df[col] = data_dict[col]
+# (model file modification time, model) by model file
+_models = {}
+_models_lock = threading.Lock()
 
-    return boolean_df
 
+def get_model_file_name(organization_slug: str, project_slug: str, model_name: str) -> str:
+    return f"{tempfile.gettempdir()}/{organization_slug}-{project_slug}-{model_name}.pkl"
 
-def find_correlations(dataframe, tag):
-    """Find all correlations for the given tag."""
-    # Setup empty list
-    correlations = []
-    columns = []
 
-    # Loop through all column at the row with the tag as its index
-    for i, corr in enumerate(dataframe.loc[tag, :]):
-        # Find the column
-        col = dataframe.columns[i]
+def save_model(model: TagModel, organization_slug: str, project_slug: str, model_name: str):
+    """Saves a tag model to disk."""
+    file_name = get_model_file_name(organization_slug, project_slug, model_name)
 
-        # Append the correlation to the list
-        correlations.append(corr)
-        columns.append(col)
+    # written to a temporary file first so readers never see a partial model
+    fd, tmp_file_name = tempfile.mkstemp(dir=os.path.dirname(file_name))
+    with os.fdopen(fd, "wb") as f:
+        pickle.dump(model, f)
+    os.replace(tmp_file_name, file_name)
 
-    # Create a df out of the lists
-    results_df = pd.DataFrame({"tag": columns, "correlation": correlations})
+    with _models_lock:
+        _models[file_name] = (os.stat(file_name).st_mtime_ns, model)
 
-    return results_df
 
+def load_model(organization_slug: str, project_slug: str, model_name: str) -> TagModel:
+    """Loads a tag model, from memory unless the file on disk changed."""
+    file_name = get_model_file_name(organization_slug, project_slug, model_name)
+    mtime = os.stat(file_name).st_mtime_ns
 
-def find_highest_correlations(correlated_dataframe, recommendations):
-    """Find the correlations with the highest relevancy."""
-    # Sort the input df
-    corr_df_sorted = correlated_dataframe.sort_values(by=["correlation"], ascending=False)
+    with _models_lock:
+        cached = _models.get(file_name)
+    if cached and cached[0] == mtime:
+        return cached[1]
 
-    # Extract the relevant correlations
-    corr_df_sliced = corr_df_sorted.iloc[1 : recommendations + 1]  # noqa
+    with open(file_name, "rb") as f:
+        model = pickle.load(f)
+    if not isinstance(model, TagModel) or model.version != TagModel.version:
+        raise FileNotFoundError(f"Tag model file {file_name} is outdated.")
 
-    return corr_df_sliced
+    with _models_lock:
+        _models[file_name] = (mtime, model)
+    return model
 
 
 def get_recommendations(
@@ -146,28 +173,21 @@ def get_recommendations(
 ):
     """Get recommendations based on current tag."""
     try:
-        correlation_dataframe = load_model(organization_slug, project_slug, model_name)
+        model = load_model(organization_slug, project_slug, model_name)
     except FileNotFoundError:
         log.warning(
-            f"Unable to recommend tag(s). No correlation dataframe file found for project name {project_slug} and model name {model_name}."
+            f"Unable to recommend tag(s). No tag model file found for project name {project_slug} and model name {model_name}."
         )
         return []
 
-    recommendations_dataframe = pd.DataFrame()
+    recommended_tag_ids = []
     for tag_id in tag_ids:
-        correlated_dataframe = find_correlations(correlation_dataframe, tag_id)
-        recommendations_dataframe = pd.concat(
-            [
-                recommendations_dataframe,
-                find_highest_correlations(correlated_dataframe, recommendations),
-            ],
-            ignore_index=True,
-        )
+        recommended_tag_ids.extend(model.recommend(int(tag_id), recommendations))
+    recommended_tag_ids = recommended_tag_ids[:recommendations]
 
     # convert back to tag objects
-    tags = []
-    for t in recommendations_dataframe["tag"][:recommendations]:
-        tags.append(tag_service.get(db_session=db_session, tag_id=int(t)))
+    tags_by_id = {t.id: t for t in db_session.query(Tag).filter(Tag.id.in_(recommended_tag_ids))}
+    tags = [tags_by_id[t] for t in recommended_tag_ids if t in tags_by_id]
 
     log.debug(
         f"Recommending the following tag(s) for model name {model_name}: {','.join([t.name for t in tags])}"
@@ -175,8 +195,32 @@ def get_recommendations(
     return tags
 
 
-def build_model(items: list[Any], organization_slug: str, project_slug: str, model_name: str):
-    """Builds the correlation dataframe for items."""
-    boolean_dataframe = create_boolean_dataframe(items)
-    correlation_dataframe = create_correlation_dataframe(boolean_dataframe)
-    save_model(correlation_dataframe, organization_slug, project_slug, model_name)
+def build_model(
+    items: list[Any],
+    organization_slug: str,
+    project_slug: str,
+    model_name: str,
+    updated_at: datetime | None = None,
+):
+    """Builds the tag model for items updated up to the given time."""
+    model = TagModel.build(items)
+    model.updated_at = updated_at
+    save_model(model, organization_slug, project_slug, model_name)
+
+
+def update_model(
+    items: list[Any],
+    updated_at: datetime,
+    organization_slug: str,
+    project_slug: str,
+    model_name: str,
+):
+    """Updates a tag model with the current tags of items updated up to the given time."""
+    model = load_model(organization_slug, project_slug, model_name)
+    for item in items:
+        model = model.update(item.id, [t.id for t in item.tags])
+
+    if model.updated_at != updated_at:
+        # the model loaded may be shared with other threads
+        model = TagModel(model.tag_ids, model.item_tags, model.counts, updated_at)
+    save_model(model, organization_slug, project_slug, model_name)
@@ -6,18 +6,20 @@
 """
 
 import logging
+from datetime import datetime, timezone
 from schedule import every
 from typing import NoReturn
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from dispatch.decorators import scheduled_project_task, timer
 from dispatch.incident import service as incident_service
+from dispatch.incident.models import Incident
 from dispatch.plugin import service as plugin_service
 from dispatch.project.models import Project
 from dispatch.scheduler import scheduler
 from dispatch.tag import service as tag_service
 from dispatch.tag.models import TagCreate
-from dispatch.tag.recommender import build_model
+from dispatch.tag.recommender import build_model, load_model, update_model
 
 log = logging.getLogger(__name__)
 
@@ -54,13 +56,48 @@ def sync_tags(db_session: Session, project: Project) -> NoReturn:
 @scheduled_project_task
 def build_tag_models(db_session: Session, project: Project) -> NoReturn:
     """Builds the incident tag recommendation models."""
-    incidents = incident_service.get_all(db_session=db_session, project_id=project.id).all()
+    # incidents updated while the model is built are picked up by the next update
+    updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    incidents = (
+        incident_service.get_all(db_session=db_session, project_id=project.id)
+        .options(selectinload(Incident.tags))
+        .all()
+    )
 
     log.debug(f"Building the incident tag recommendation models for project {project.name}...")
 
     try:
-        build_model(incidents, project.organization.slug, project.slug, "incident")
+        build_model(
+            incidents, project.organization.slug, project.slug, "incident", updated_at=updated_at
+        )
     except Exception as e:
         log.exception(e)
 
     log.debug("Successfully built the incident tag recommendation models.")
+
+
+@scheduler.add(every(10).minutes, name="update-tag-models")
+@timer
+@scheduled_project_task
+def update_tag_models(db_session: Session, project: Project) -> NoReturn:
+    """Updates the incident tag recommendation models with the incidents updated since."""
+    try:
+        model = load_model(project.organization.slug, project.slug, "incident")
+    except FileNotFoundError:
+        return
+
+    if model.updated_at is None:
+        return
+
+    updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    incidents = (
+        incident_service.get_all(db_session=db_session, project_id=project.id)
+        .filter(Incident.updated_at >= model.updated_at)
+        .options(selectinload(Incident.tags))
+        .all()
+    )
+
+    try:
+        update_model(incidents, updated_at, project.organization.slug, project.slug, "incident")
+    except Exception as e:
+        log.exception(e)
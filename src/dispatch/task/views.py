@@ -1,9 +1,8 @@
-import json
 from fastapi import APIRouter, HTTPException, Query, status
 
 
 from dispatch.auth.service import CurrentUser
-from dispatch.common.utils.views import create_pydantic_include
+from dispatch.common.utils.views import create_pagination_response
 from dispatch.database.core import DbSession
 from dispatch.database.service import CommonParameters, search_filter_sort_paginate
 from dispatch.models import PrimaryKey
@@ -27,20 +26,7 @@ router = APIRouter()
 def get_tasks(common: CommonParameters, include: list[str] = Query([], alias="include[]")):
     """Retrieve all tasks."""
     pagination = search_filter_sort_paginate(model="Task", **common)
-
-    if include:
-        # only allow two levels for now
-        include_sets = create_pydantic_include(include)
-
-        include_fields = {
-            "items": {"__all__": include_sets},
-            "itemsPerPage": ...,
-            "page": ...,
-            "total": ...,
-        }
-
-        return json.loads(TaskPagination(**pagination).json(include=include_fields))
-    return json.loads(TaskPagination(**pagination).json())
+    return create_pagination_response(TaskPagination, pagination, include)
 
 
 @router.post("", response_model=TaskRead, tags=["tasks"])
@@ -0,0 +1,93 @@
+def test_get_conversation_replies_binds_plugin_per_worker():
+    from dispatch.ai.service import get_conversation_replies
+    from dispatch.plugins.bases import ConversationPlugin
+
+    class TestConversationPlugin(ConversationPlugin):
+        title = "Test Conversation Replies"
+        slug = "test-conversation-replies"
+
+        def get_conversation_replies(self, conversation_id: str, thread_ts: str) -> list[str]:
+            # plugin attributes are thread local, so this fails unless bound in the worker
+            return [f"{self.configuration['token']}:{self.project_id}:{conversation_id}"]
+
+    conversations = {case_id: (f"channel-{case_id}", "ts") for case_id in range(20)}
+
+    replies = get_conversation_replies(
+        TestConversationPlugin, {"token": "secret"}, 1, conversations
+    )
+
+    assert replies == {case_id: [f"secret:1:channel-{case_id}"] for case_id in range(20)}
+
+
+class CharacterEncoding:
+    """Encodes every character as one token."""
+
+    def encode_ordinary_batch(self, texts):
+        return [list(text) for text in texts]
+
+    def decode(self, tokens):
+        return "".join(tokens)
+
+
+def test_prompt_builder_fits_without_tokenizing(monkeypatch):
+    from dispatch.ai import service
+
+    def get_encoding(model):
+        raise AssertionError("prompts fitting in bytes are not tokenized")
+
+    monkeypatch.setattr(service, "get_encoding", get_encoding)
+
+    prompt = service.PromptBuilder("test", token_limit=100).add("x" * 10).add_items(["a" * 10])
+    assert prompt.build() == f"{'x' * 10}\n{'a' * 10}"
+
+
+def test_prompt_builder_drops_least_relevant_items(monkeypatch):
+    from dispatch.ai import service
+
+    monkeypatch.setattr(service, "get_encoding", lambda model: CharacterEncoding())
+
+    builder = (
+        service.PromptBuilder("test", token_limit=40)
+        .add("x" * 10, priority=2)
+        .add_items(["a" * 10, "b" * 10, "c" * 10], priority=1)
+    )
+    assert builder.build() == "\n".join(["x" * 10, "a" * 10, "b" * 10])
+
+    # the items of less important sections are dropped first
+    builder = (
+        service.PromptBuilder("test", token_limit=40)
+        .add("x" * 10, priority=2)
+        .add_items(["a" * 10], priority=1)
+        .add_items(["b" * 10, "c" * 10], priority=0)
+    )
+    assert builder.build() == "\n".join(["x" * 10, "a" * 10, "b" * 10])
+
+    # sections left without items are skipped
+    builder = (
+        service.PromptBuilder("test", token_limit=20)
+        .add("x" * 10, priority=2)
+        .add_items(["a" * 10, "b" * 10, "c" * 10], priority=1)
+    )
+    assert builder.build() == "x" * 10
+
+
+def test_prompt_builder_truncates_least_important_texts(monkeypatch):
+    from dispatch.ai import service
+
+    monkeypatch.setattr(service, "get_encoding", lambda model: CharacterEncoding())
+
+    builder = (
+        service.PromptBuilder("test", token_limit=15)
+        .add("x" * 10, priority=2)
+        .add("y" * 10, priority=1)
+        .add_items(["a" * 10], priority=0)
+    )
+    assert builder.build() == "\n".join(["x" * 10, "y" * 4])
+
+    # texts truncated entirely are dropped with their line break
+    builder = (
+        service.PromptBuilder("test", token_limit=11)
+        .add("x" * 10, priority=2)
+        .add("y" * 10, priority=1)
+    )
+    assert builder.build() == "x" * 10
@@ -0,0 +1,32 @@
+from starlette.requests import Request
+
+
+def _request(session, organization):
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": f"/api/v1/{organization.slug}/incidents",
+            "headers": [],
+            "path_params": {"organization": organization.slug},
+        }
+    )
+    request.state.db = session
+    request.state.organization = organization.slug
+    return request
+
+
+def test_get_auth_context_is_memoized(session, organization, monkeypatch):
+    from dispatch.auth import service as auth_service
+
+    monkeypatch.setattr(auth_service, "DISPATCH_AUTHENTICATION_PROVIDER_SLUG", None)
+    monkeypatch.setattr(auth_service, "DISPATCH_AUTHENTICATION_DEFAULT_USER", "context@example.com")
+
+    request = _request(session, organization)
+    context = auth_service.get_auth_context(request=request)
+
+    assert context.user.email == "context@example.com"
+    assert context.organization.id == organization.id
+    assert context.role == context.user.get_organization_role(organization.slug)
+    assert auth_service.get_auth_context(request=request) is context
+    assert auth_service.get_current_user(request=request) is context.user
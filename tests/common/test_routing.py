@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+
+
+def make_routes(*paths):
+    return [SimpleNamespace(path=path) for path in paths]
+
+
+def test_path_params_matcher_organization():
+    from dispatch.common.utils.routing import PathParamsMatcher
+
+    matcher = PathParamsMatcher(
+        make_routes(
+            "/organizations/{organization_id}",
+            "/{organization}/incidents",
+            "/{organization}/incidents/{incident_id}",
+            "/healthcheck",
+        )
+    )
+
+    assert matcher.match("/default/incidents") == {"organization": "default"}
+    assert matcher.match("/default/incidents/1") == {"organization": "default", "incident_id": "1"}
+    assert matcher.match("/organizations/1") == {"organization_id": "1"}
+    assert matcher.match("/healthcheck") == {}
+    assert matcher.match("/default/unknown") == {}
+
+
+def test_path_params_matcher_last_route_wins():
+    from dispatch.common.utils.routing import PathParamsMatcher
+
+    matcher = PathParamsMatcher(
+        make_routes(
+            "/{organization}/signals/{signal_id}",
+            "/{organization}/signals/instances",
+        )
+    )
+
+    assert matcher.match("/default/signals/instances") == {"organization": "default"}
+    assert matcher.match("/default/signals/1") == {"organization": "default", "signal_id": "1"}
+
+
+def test_path_params_matcher_path_converter():
+    from dispatch.common.utils.routing import PathParamsMatcher
+
+    matcher = PathParamsMatcher(make_routes("/{organization}/files/{file_path:path}"))
+
+    assert matcher.match("/default/files/a/b") == {"organization": "default", "file_path": "a/b"}
@@ -0,0 +1,49 @@
+def test_find_organization_slugs(session, conversation):
+    from dispatch.conversation.index import find_organization_slugs
+
+    slugs = find_organization_slugs(
+        db_session=session, channel_id=conversation.channel_id, organization_slugs=["default"]
+    )
+    assert slugs == ["default"]
+
+    slugs = find_organization_slugs(
+        db_session=session, channel_id="unknown", organization_slugs=["default"]
+    )
+    assert slugs == []
+
+
+def test_index_add_and_remove():
+    from dispatch.conversation import index
+
+    index.add_unresolved("C123", "1.0")
+    assert index.is_unresolved("C123", "1.0")
+
+    index.add("C123", "1.0", organization_slug="default")
+    assert index.get_organization_slug("C123", "1.0") == "default"
+    assert not index.is_unresolved("C123", "1.0")
+
+    index.remove("C123", "1.0")
+    assert index.get_organization_slug("C123", "1.0") is None
+
+
+def test_index_unresolved_by_channel(monkeypatch):
+    from dispatch.conversation import index
+
+    now = [1000.0]
+    monkeypatch.setattr(index.time, "monotonic", lambda: now[0])
+
+    index.add_unresolved("C456")
+    index.add_unresolved("C456", "1.0")
+    assert index.is_unresolved("C456")
+    assert index.is_unresolved("C456", "1.0")
+    assert not index.is_unresolved("C456", "2.0")
+
+    # misses are re-checked once they expire
+    now[0] += index.CONVERSATION_INDEX_MISS_TTL
+    assert not index.is_unresolved("C456", "1.0")
+
+    # resolving any conversation of the channel forgets all its misses
+    index.add_unresolved("C456", "1.0")
+    index.add("C456", organization_slug="default")
+    assert not index.is_unresolved("C456", "1.0")
+    index.remove("C456")
@@ -0,0 +1,26 @@
+def test_schema_registry_exists(session):
+    from dispatch.database.core import SchemaRegistry
+
+    registry = SchemaRegistry(ttl=300)
+
+    assert registry.exists("dispatch_core")
+    assert registry.exists("dispatch_organization_default")
+    assert not registry.exists("dispatch_organization_unknown")
+
+
+def test_schema_registry_invalidate(session):
+    from dispatch.database.core import SchemaRegistry
+
+    registry = SchemaRegistry(ttl=300)
+    registry.exists("dispatch_core")
+    assert registry._refreshed_at is not None
+
+    registry.invalidate()
+    assert registry._refreshed_at is None
+
+
+def test_get_organization_sessionmaker_is_reused():
+    from dispatch.database.core import get_organization_sessionmaker
+
+    assert get_organization_sessionmaker("default") is get_organization_sessionmaker("default")
+    assert get_organization_sessionmaker("default") is not get_organization_sessionmaker("other")
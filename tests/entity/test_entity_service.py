@@ -322,3 +322,62 @@ def test_find_entities_multiple_entity_types(session, signal_instance, project):
     values = {getattr(e, "value", None) for e in entities if hasattr(e, "value") and isinstance(e.value, str)}
     assert "arn:aws:iam::123456789012:role/Test" in values
     assert "arn:aws:s3:::ap-northeast-3-123456789012-s3-server-access-logs" in values
+
+
+def test_find_entities_with_regex_only(session, signal_instance, project):
+    from dispatch.entity.service import find_entities
+
+    # The default SignalInstanceFactory raw has an IAM role ARN in its assets
+    entity_types = [
+        EntityType(
+            name="AWS Account ID",
+            jpath=None,
+            regular_expression=r"arn:aws:iam::(\d{12}):",
+            project=project,
+        ),
+    ]
+    entities = find_entities(session, signal_instance, entity_types)
+    assert [e.value for e in entities] == ["123456789012"]
+
+
+def test_find_entities_with_field_and_regex(session, signal_instance, project):
+    from dispatch.entity.service import find_entities
+
+    entity_types = [
+        EntityType(
+            name="S3 Bucket",
+            jpath="asset[*].id",
+            regular_expression=r"arn:aws:s3:::(.+)",
+            project=project,
+        ),
+    ]
+    entities = find_entities(session, signal_instance, entity_types)
+    assert [e.value for e in entities] == ["ap-northeast-3-123456789012-s3-server-access-logs"]
+
+
+def test_find_entities_bulk(session, signal_instance, entity_type):
+    from dispatch.entity.service import find_entities
+
+    entity_type.jpath = "asset[*].id"
+    entity_type.regular_expression = None
+    session.flush()
+
+    entities = find_entities(session, signal_instance, [entity_type])
+    assert len(entities) == 2
+
+    # the same entities are returned on a second extraction
+    assert {e.id for e in find_entities(session, signal_instance, [entity_type])} == {
+        e.id for e in entities
+    }
+
+
+def test_compile_entity_type_is_cached(entity_type):
+    from dispatch.entity.service import compile_entity_type
+
+    entity_type.jpath = "asset[0].id"
+    compiled = compile_entity_type(entity_type)
+    assert compile_entity_type(entity_type) is compiled
+
+    # a change to the expressions recompiles them
+    entity_type.jpath = "asset[1].id"
+    assert compile_entity_type(entity_type).jpath == "asset[1].id"
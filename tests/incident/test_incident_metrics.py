@@ -0,0 +1,49 @@
+def test_get_monthly_incident_counts(session, incident_type):
+    from datetime import date, datetime
+
+    from dispatch.incident.metrics import get_monthly_incident_counts
+    from tests.factories import IncidentFactory
+
+    for reported_at in (datetime(2001, 1, 5), datetime(2001, 1, 31, 23), datetime(2001, 3, 1)):
+        IncidentFactory(incident_type=incident_type, reported_at=reported_at)
+    session.flush()
+
+    counts = get_monthly_incident_counts(session, end_date=date(2001, 3, 15))
+    assert counts[date(2001, 1, 31)] == 2
+    assert counts[date(2001, 3, 31)] == 1
+    assert date(2001, 2, 28) not in counts
+
+    # months after the end date are left out
+    counts = get_monthly_incident_counts(session, end_date=date(2001, 2, 1))
+    assert date(2001, 3, 31) not in counts
+
+
+def test_get_incident_forecast_cache(session, incident, monkeypatch):
+    from dispatch.incident import metrics
+
+    calls = []
+
+    def get_monthly_incident_counts(**kwargs):
+        calls.append(kwargs)
+        return {}
+
+    monkeypatch.setattr(metrics, "get_monthly_incident_counts", get_monthly_incident_counts)
+    metrics.invalidate_incident_forecasts()
+
+    forecast = metrics.get_incident_forecast(session, "default")
+    assert metrics.get_incident_forecast(session, "default") == forecast
+    assert len(calls) == 1
+
+    # other filters are forecast separately
+    metrics.get_incident_forecast(session, "default", filter_spec=[{"field": "status"}])
+    assert len(calls) == 2
+
+    metrics.invalidate_incident_forecasts("default")
+    metrics.get_incident_forecast(session, "default")
+    assert len(calls) == 3
+
+    # updates made by any process change the incidents version
+    incident.title = "Forecast cache"
+    session.flush()
+    metrics.get_incident_forecast(session, "default")
+    assert len(calls) == 4
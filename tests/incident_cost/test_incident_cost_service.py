@@ -364,3 +364,124 @@ def test_update_incident_response_cost__fail(incident, session):
 
     # Validate that the incident cost was not created nor saved in the database.
     assert not get_by_incident_id(db_session=session, incident_id=incident.id)
+
+
+def test_update_incidents_response_cost(
+    incident, session, incident_cost_type, participant_role, participant
+):
+    """Tests that the response costs of all project incidents are created and updated in bulk."""
+    from datetime import timedelta, datetime, UTC
+
+    from dispatch.incident.enums import IncidentStatus
+    from dispatch.incident_cost.service import (
+        get_by_incident_id_and_incident_cost_type_id,
+        update_incidents_response_cost,
+    )
+    from dispatch.incident_cost_type import service as incident_cost_type_service
+
+    # Set up a default incident costs type.
+    for cost_type in incident_cost_type_service.get_all(db_session=session):
+        cost_type.default = False
+    incident_cost_type.default = True
+    incident_cost_type.project = incident.project
+
+    one_hour_ago = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=1)
+    incident.status = IncidentStatus.active
+    incident.created_at = one_hour_ago
+    incident.incident_type.cost_model = None
+
+    participant_role.participant = participant
+    participant_role.activity = 1
+    participant_role.assumed_at = one_hour_ago
+    participant_role.renounced_at = None
+    incident.participants.append(participant_role.participant)
+
+    session.add(incident)
+    session.commit()
+
+    # The response cost is created.
+    assert update_incidents_response_cost(
+        db_session=session, project=incident.project, incident_cost_type_id=incident_cost_type.id
+    )
+    incident_response_cost = get_by_incident_id_and_incident_cost_type_id(
+        db_session=session, incident_id=incident.id, incident_cost_type_id=incident_cost_type.id
+    )
+    assert incident_response_cost.amount > 0
+
+    # The response cost of a closed incident is not updated after it was marked as stable.
+    incident.status = IncidentStatus.closed
+    incident.stable_at = one_hour_ago
+    session.commit()
+
+    assert not update_incidents_response_cost(
+        db_session=session, project=incident.project, incident_cost_type_id=incident_cost_type.id
+    )
+
+
+def test_update_incidents_response_cost__calculation_fails(
+    incident, session, incident_cost_type, participant_role, participant, monkeypatch
+):
+    """Tests that an incident whose response cost can't be calculated doesn't fail the update."""
+    from datetime import timedelta, datetime, UTC
+
+    from dispatch.incident.enums import IncidentStatus
+    from dispatch.incident_cost import service as incident_cost_service
+
+    one_hour_ago = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=1)
+    incident.status = IncidentStatus.active
+    incident.created_at = one_hour_ago
+    incident.incident_type.cost_model = None
+    incident_cost_type.project = incident.project
+
+    participant_role.participant = participant
+    participant_role.assumed_at = one_hour_ago
+    participant_role.renounced_at = None
+    incident.participants.append(participant_role.participant)
+
+    session.add(incident)
+    session.commit()
+
+    def calculate_participant_role_time_seconds(**kwargs):
+        raise ValueError("bad participant role")
+
+    monkeypatch.setattr(
+        incident_cost_service,
+        "calculate_participant_role_time_seconds",
+        calculate_participant_role_time_seconds,
+    )
+
+    assert not incident_cost_service.update_incidents_response_cost(
+        db_session=session, project=incident.project, incident_cost_type_id=incident_cost_type.id
+    )
+    assert not incident_cost_service.get_by_incident_id_and_incident_cost_type_id(
+        db_session=session, incident_id=incident.id, incident_cost_type_id=incident_cost_type.id
+    )
+
+
+def test_write_incident_cost_rows__bad_row(incident, session, incident_cost_type):
+    """Tests that a row that can't be written doesn't prevent writing the others."""
+    from datetime import datetime, UTC
+
+    from sqlalchemy import insert
+
+    from dispatch.incident_cost.models import IncidentCost
+    from dispatch.incident_cost.service import (
+        _write_incident_cost_rows,
+        get_by_incident_id_and_incident_cost_type_id,
+    )
+
+    now = datetime.now(UTC).replace(tzinfo=None)
+    row = {
+        "amount": 10,
+        "incident_cost_type_id": incident_cost_type.id,
+        "project_id": incident.project.id,
+        "created_at": now,
+        "updated_at": now,
+    }
+    rows = [{**row, "incident_id": incident.id}, {**row, "incident_id": -1}]
+
+    assert _write_incident_cost_rows(session, insert(IncidentCost), rows) == 1
+    session.commit()
+    assert get_by_incident_id_and_incident_cost_type_id(
+        db_session=session, incident_id=incident.id, incident_cost_type_id=incident_cost_type.id
+    )
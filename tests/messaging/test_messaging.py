@@ -79,3 +79,30 @@ def test_generate_welcome_message__email_template(email_template):
     assert welcome_message
     assert welcome_message[0].get("title") == email_template.welcome_text
     assert welcome_message[0].get("text") == email_template.welcome_body
+
+
+def test_render_message_template__template_unchanged():
+    """Tests that rendering leaves the template as is, so it can be rendered again."""
+    from dispatch.messaging.email.utils import render_message_template
+
+    message_template = [
+        {
+            "text": "{{ body }}",
+            "buttons": [{"button_text": "{{ button }}", "button_value": "value"}],
+            "select": {
+                "select_action": "action",
+                "options": [{"option_text": "{{ option }}", "option_value": "value"}],
+            },
+        }
+    ]
+
+    for i in range(2):
+        kwargs = {"body": f"body {i}", "button": f"button {i}", "option": f"option {i}"}
+        rendered = render_message_template(message_template, **kwargs)
+
+        assert rendered[0]["text"] == kwargs["body"]
+        assert rendered[0]["buttons"][0]["button_text"] == kwargs["button"]
+        assert rendered[0]["select"]["options"][0]["option_text"] == kwargs["option"]
+
+    assert message_template[0]["text"] == "{{ body }}"
+    assert message_template[0]["buttons"][0]["button_text"] == "{{ button }}"
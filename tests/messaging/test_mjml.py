@@ -0,0 +1,170 @@
+import sys
+
+import pytest
+
+
+def fake_worker(renders=None, fail_start=False):
+    """Returns a fake _MjmlWorker class, recording the workers it creates."""
+
+    class FakeWorker:
+        created = []
+
+        def __init__(self, timeout=None):
+            if fail_start:
+                raise OSError("node not found")
+            self.rendered = 0
+            self.closed = False
+            self.killed = False
+            FakeWorker.created.append(self)
+
+        def render(self, mjml):
+            if renders is not None:
+                result = renders(self, mjml)
+                if isinstance(result, Exception):
+                    raise result
+                if result is not None:
+                    return result
+            self.rendered += 1
+            return f"<html>{mjml}</html>"
+
+        def close(self):
+            self.closed = True
+
+        def kill(self):
+            self.killed = True
+
+    return FakeWorker
+
+
+@pytest.fixture
+def cli(monkeypatch):
+    from dispatch.messaging.email import mjml
+
+    rendered = []
+
+    def render_with_cli(document):
+        rendered.append(document)
+        return f"<cli>{document}</cli>"
+
+    monkeypatch.setattr(mjml, "render_with_cli", render_with_cli)
+    return rendered
+
+
+def test_renderer_starts_workers_on_demand(monkeypatch, cli):
+    """Tests that workers are started when needed and reused once idle."""
+    from dispatch.messaging.email import mjml
+
+    worker = fake_worker()
+    monkeypatch.setattr(mjml, "_MjmlWorker", worker)
+    renderer = mjml.MjmlRenderer(workers=2)
+
+    assert renderer.render("a") == "<html>a</html>"
+    assert renderer.render("b") == "<html>b</html>"
+
+    assert len(worker.created) == 1
+    assert renderer.started == 1
+    assert not cli
+
+
+def test_renderer_caches_documents(monkeypatch, cli):
+    """Tests that a document is only rendered once."""
+    from dispatch.messaging.email import mjml
+
+    worker = fake_worker()
+    monkeypatch.setattr(mjml, "_MjmlWorker", worker)
+    renderer = mjml.MjmlRenderer(workers=1)
+
+    assert renderer.render("a") == renderer.render("a")
+    assert worker.created[0].rendered == 1
+
+
+def test_renderer_discards_exited_workers(monkeypatch, cli):
+    """Tests that a worker exiting after it has rendered is replaced, without disabling the pool."""
+    from dispatch.messaging.email import mjml
+
+    def renders(worker, document):
+        if document == "exit":
+            return mjml.MjmlRendererExited("exited")
+
+    worker = fake_worker(renders)
+    monkeypatch.setattr(mjml, "_MjmlWorker", worker)
+    renderer = mjml.MjmlRenderer(workers=1)
+
+    renderer.render("a")
+    assert renderer.render("exit") == "<cli>exit</cli>"
+    assert worker.created[0].closed
+    assert renderer.started == 0
+    assert not renderer.disabled
+
+    assert renderer.render("b") == "<html>b</html>"
+    assert len(worker.created) == 2
+
+
+def test_renderer_disabled_when_node_missing(monkeypatch, cli):
+    """Tests that the mjml cli is used when a worker can't be started."""
+    from dispatch.messaging.email import mjml
+
+    monkeypatch.setattr(mjml, "_MjmlWorker", fake_worker(fail_start=True))
+    renderer = mjml.MjmlRenderer(workers=1)
+
+    assert renderer.render("a") == "<cli>a</cli>"
+    assert renderer.disabled
+    assert renderer.started == 0
+    assert renderer.render("b") == "<cli>b</cli>"
+
+
+def test_renderer_disabled_when_worker_exits_on_start(monkeypatch, cli):
+    """Tests that the mjml cli is used when a worker exits before rendering anything."""
+    from dispatch.messaging.email import mjml
+
+    worker = fake_worker(lambda worker, document: mjml.MjmlRendererExited("exited"))
+    monkeypatch.setattr(mjml, "_MjmlWorker", worker)
+    renderer = mjml.MjmlRenderer(workers=1)
+
+    assert renderer.render("a") == "<cli>a</cli>"
+    assert renderer.disabled
+    assert renderer.render("b") == "<cli>b</cli>"
+    assert len(worker.created) == 1
+
+
+def test_renderer_kills_hung_workers(monkeypatch, cli):
+    """Tests that a worker that times out is killed and the document rendered with the mjml cli."""
+    from dispatch.messaging.email import mjml
+
+    def renders(worker, document):
+        if document == "hang":
+            return mjml.MjmlRendererTimeout("timed out")
+
+    worker = fake_worker(renders)
+    monkeypatch.setattr(mjml, "_MjmlWorker", worker)
+    renderer = mjml.MjmlRenderer(workers=1)
+
+    assert renderer.render("hang") == "<cli>hang</cli>"
+    assert worker.created[0].killed
+    assert renderer.started == 0
+    assert not renderer.disabled
+
+    assert renderer.render("a") == "<html>a</html>"
+
+
+def test_worker_render_timeout():
+    """Tests that rendering with a process that doesn't respond times out."""
+    from dispatch.messaging.email.mjml import _MjmlWorker, MjmlRendererTimeout
+
+    worker = _MjmlWorker(args=[sys.executable, "-c", "import time; time.sleep(60)"], timeout=0.1)
+    try:
+        with pytest.raises(MjmlRendererTimeout):
+            worker.render("<mjml></mjml>")
+    finally:
+        worker.kill()
+    assert worker.process.returncode is not None
+
+
+def test_worker_render_exited():
+    """Tests that rendering with a process that has exited raises MjmlRendererExited."""
+    from dispatch.messaging.email.mjml import _MjmlWorker, MjmlRendererExited
+
+    worker = _MjmlWorker(args=[sys.executable, "-c", "pass"], timeout=5)
+    with pytest.raises(MjmlRendererExited):
+        worker.render("<mjml></mjml>")
+    worker.close()
@@ -0,0 +1,31 @@
+def test_metric_batch_coalesces():
+    from dispatch.metrics import MetricBatch
+
+    batch = MetricBatch()
+    batch.add("counter", "server.call.counter", None, {"method": "GET"})
+    batch.add("counter", "server.call.counter", 2, {"method": "GET"})
+    batch.add("timer", "server.call.elapsed", 0.1, {"method": "GET"})
+    batch.add("timer", "server.call.elapsed", 0.2, {"method": "GET"})
+    batch.add("gauge", "queue.size", 1, None)
+    batch.add("gauge", "queue.size", 5, None)
+
+    assert batch.counters[("server.call.counter", (("method", "GET"),))] == 3
+    assert batch.timers[("server.call.elapsed", (("method", "GET"),))] == [0.1, 0.2]
+    assert batch.gauges[("queue.size", ())] == 5
+
+
+def test_metrics_drops_when_full():
+    from dispatch.metrics import Metrics
+
+    metrics = Metrics(flush_interval=60, queue_size=1)
+    metrics._providers = ["test-metric"]
+    metrics.counter("a")
+    metrics.counter("b")
+
+    assert metrics.dropped == 1
+
+    batch = metrics.drain()
+    assert batch.counters[("a", ())] == 1
+    assert batch.counters[("metrics.dropped.counter", ())] == 1
+    assert metrics.dropped == 0
+    metrics.shutdown()
@@ -0,0 +1,27 @@
+def test_get_monitor_status_binds_plugin_per_worker():
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import datetime
+
+    from dispatch.monitor.scheduled import get_monitor_status
+    from dispatch.plugins.bases import MonitorPlugin
+
+    class TestMonitorPlugin(MonitorPlugin):
+        title = "Test Monitor Status"
+        slug = "test-monitor-status"
+
+        def get_match_status(self, weblink: str, last_modified: datetime = None) -> dict:
+            # plugin attributes are thread local, so this fails unless bound in the worker
+            return {"state": f"{self.configuration['token']}:{self.project_id}:{weblink}"}
+
+    weblinks = [f"https://example.com/{i}" for i in range(20)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        statuses = list(
+            executor.map(
+                lambda weblink: get_monitor_status(
+                    TestMonitorPlugin, {"token": "secret"}, 1, weblink, datetime.now()
+                ),
+                weblinks,
+            )
+        )
+
+    assert statuses == [{"state": f"secret:1:{weblink}"} for weblink in weblinks]
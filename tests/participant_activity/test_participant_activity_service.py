@@ -214,3 +214,35 @@ def test_get_incidents_by_plugin(session, participant_activity):
 
     assert activities
     assert participant_activity.id in [activity.id for activity in activities]
+
+
+def test_create_or_update_case_activities(session, case, participant, plugin_event):
+    """Tests that overlapping case activities of the same plugin event are merged."""
+    from datetime import datetime, timedelta
+    from dispatch.participant_activity.service import (
+        create_or_update_case_activities,
+        get_all_case_participant_activities_for_case,
+    )
+
+    participant.case = case
+    session.commit()
+
+    started_at = datetime(2024, 1, 1)
+
+    def activity(start, end):
+        return (
+            participant.id,
+            plugin_event.id,
+            started_at + timedelta(seconds=start),
+            started_at + timedelta(seconds=end),
+        )
+
+    # the first two are given out of order and merged, the last one does not overlap
+    activities = [activity(5, 15), activity(0, 10), activity(20, 30)]
+    create_or_update_case_activities(db_session=session, case_id=case.id, activities=activities)
+
+    recorded = get_all_case_participant_activities_for_case(db_session=session, case_id=case.id)
+    assert [(a.started_at, a.ended_at) for a in recorded] == [
+        (started_at, started_at + timedelta(seconds=15)),
+        (started_at + timedelta(seconds=20), started_at + timedelta(seconds=30)),
+    ]
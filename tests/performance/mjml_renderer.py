@@ -0,0 +1,54 @@
+"""Measures emails rendered per second with the mjml cli and with the MJML renderer processes.
+
+usage: `python tests/performance/mjml_renderer.py` (requires node and the mjml package)
+"""
+
+import time
+
+from dispatch.messaging.email.mjml import MjmlRenderer, render_with_cli
+from dispatch.messaging.email.utils import get_template
+from dispatch.messaging.strings import (
+    INCIDENT_PARTICIPANT_WELCOME_MESSAGE,
+    MessageType,
+    render_message_template,
+)
+
+NUMBER = 50
+
+
+def emails():
+    """Participant welcome emails, each one for a different participant."""
+    template, description = get_template(MessageType.incident_participant_welcome, project_id=0)
+    for i in range(NUMBER):
+        kwargs = {
+            "name": f"incident-{i}",
+            "title": "Incident title",
+            "description": "Incident description",
+            "status": "Active",
+            "visibility": "Open",
+            "commander_fullname": f"Commander {i}",
+            "commander_team": "Team",
+            "commander_weblink": "https://example.com",
+            "contact_fullname": f"Participant {i}",
+            "contact_weblink": "https://example.com",
+        }
+        items = render_message_template(INCIDENT_PARTICIPANT_WELCOME_MESSAGE, **kwargs)
+        yield template.render(items=items, description=description, **kwargs)
+
+
+def main():
+    mjml = list(emails())
+    renderer = MjmlRenderer(workers=1, cache_size=0)
+
+    for name, render in (("mjml cli", render_with_cli), ("renderer", renderer.render)):
+        start = time.perf_counter()
+        for email in mjml:
+            render(email)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<10} {NUMBER / elapsed:.1f} emails/s")
+
+    renderer.close()
+
+
+if __name__ == "__main__":
+    main()
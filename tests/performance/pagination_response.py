@@ -0,0 +1,63 @@
+"""Times serializing pages of incidents, cases and signal instances for the list endpoints.
+
+usage: `pytest tests/performance/pagination_response.py -s`
+"""
+
+import json
+import timeit
+from functools import partial
+
+from starlette.responses import JSONResponse
+
+from dispatch.case.models import CasePagination
+from dispatch.common.utils.views import create_pagination_response
+from dispatch.database.service import search_filter_sort_paginate
+from dispatch.enums import UserRoles
+from dispatch.incident.models import IncidentPagination
+from dispatch.signal.models import SignalInstancePagination
+
+from ..factories import CaseFactory, IncidentFactory, SignalInstanceFactory
+
+ITEMS = 100
+NUMBER = 10
+
+
+def json_round_trip(pagination_model, pagination):
+    """The previous implementation, dumping the page to a string and loading it back."""
+    return JSONResponse(json.loads(pagination_model(**pagination).json()))
+
+
+def test_pagination_response(session, user):
+    pages = []
+    for model, factory, pagination_model in (
+        ("Incident", IncidentFactory, IncidentPagination),
+        ("Case", CaseFactory, CasePagination),
+        ("SignalInstance", SignalInstanceFactory, SignalInstancePagination),
+    ):
+        factory.create_batch(ITEMS)
+        pagination = search_filter_sort_paginate(
+            db_session=session,
+            model=model,
+            items_per_page=ITEMS,
+            current_user=user,
+            role=UserRoles.owner,
+        )
+        pages.append((model, pagination_model, pagination))
+
+    print()
+    for model, pagination_model, pagination in pages:
+        assert json.loads(json_round_trip(pagination_model, pagination).body) == json.loads(
+            create_pagination_response(pagination_model, pagination).body
+        )
+
+        before = timeit.timeit(
+            partial(json_round_trip, pagination_model, pagination), number=NUMBER
+        )
+        after = timeit.timeit(
+            partial(create_pagination_response, pagination_model, pagination), number=NUMBER
+        )
+        print(
+            f"{model:<16} {len(pagination['items'])} items,"
+            f" per page before: {before / NUMBER * 1e3:.1f}ms"
+            f" after: {after / NUMBER * 1e3:.1f}ms"
+        )
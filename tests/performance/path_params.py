@@ -0,0 +1,51 @@
+"""Micro-benchmark for the organization path param extraction done by the db session middleware.
+
+usage: `python tests/performance/path_params.py` (requires the dispatch environment variables)
+"""
+
+import timeit
+from functools import partial
+
+from starlette.routing import compile_path
+
+from dispatch.main import api_router, get_path_params_from_request
+
+PATHS = [
+    "/api/v1/default/incidents",
+    "/api/v1/default/incidents/1",
+    "/api/v1/default/signals/instances",
+    "/api/v1/default/cases/1/join",
+    "/api/v1/organizations/1",
+    "/api/v1/healthcheck",
+]
+NUMBER = 1000
+
+
+def compile_on_every_request(request):
+    """The previous implementation, compiling every route on every request."""
+    path_params = {}
+    for r in api_router.routes:
+        path_regex, path_format, param_converters = compile_path(r.path)
+        path = request["path"].removeprefix("/api/v1")
+        match = path_regex.match(path)
+        if match:
+            path_params = match.groupdict()
+    return path_params
+
+
+def main():
+    print(f"{len(api_router.routes)} routes")
+    for path in PATHS:
+        request = {"path": path}
+        assert compile_on_every_request(request) == get_path_params_from_request(request)
+
+        before = timeit.timeit(partial(compile_on_every_request, request), number=NUMBER // 10)
+        after = timeit.timeit(partial(get_path_params_from_request, request), number=NUMBER)
+        print(
+            f"{path:<40} before: {before / (NUMBER // 10) * 1e6:10.1f}us"
+            f" after: {after / NUMBER * 1e6:8.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
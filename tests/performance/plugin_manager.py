@@ -0,0 +1,87 @@
+"""Counts and times plugin manager lookups made while creating a case with the dispatch_test plugins.
+
+usage: `pytest tests/performance/plugin_manager.py -s`
+"""
+
+import timeit
+from collections import Counter
+from unittest import mock
+
+from dispatch.plugins.base import plugins
+from dispatch.plugins.base.manager import PluginManager
+from dispatch.plugins.dispatch_test import (
+    contact,
+    conversation,
+    document,
+    oncall,
+    participant,
+    participant_group,
+    storage,
+    ticket,
+)
+
+from ..factories import PluginFactory, PluginInstanceFactory
+
+TEST_PLUGINS = [
+    contact.TestContactPlugin,
+    conversation.TestConversationPlugin,
+    document.TestDocumentPlugin,
+    oncall.TestOncallPlugin,
+    participant.TestParticipantPlugin,
+    participant_group.TestParticipantGroupPlugin,
+    storage.TestStoragePlugin,
+    ticket.TestTicketPlugin,
+]
+
+
+def linear_get(manager, slug):
+    """The previous implementation, sorting and scanning all plugins on every lookup."""
+    for version in (1, 2):
+        for plugin in sorted(super(PluginManager, manager).all(), key=lambda x: x.get_title()):
+            if plugin.__version__ == version and plugin.slug == slug:
+                return plugin
+    raise KeyError(slug)
+
+
+def test_case_create_plugin_lookups(session, case):
+    from dispatch.case import flows as case_flows
+
+    for cls in TEST_PLUGINS:
+        plugins.register(cls)
+        PluginInstanceFactory(
+            project=case.project,
+            enabled=True,
+            plugin=PluginFactory(slug=cls.slug, title=cls.title, type=cls.type),
+        )
+
+    lookups = Counter()
+    get, all = plugins.get, plugins.all
+
+    def counting_get(slug):
+        lookups[f"get:{slug}"] += 1
+        return get(slug)
+
+    def counting_all(*args, **kwargs):
+        lookups["all"] += 1
+        return all(*args, **kwargs)
+
+    with (
+        mock.patch.object(plugins, "get", counting_get),
+        mock.patch.object(plugins, "all", counting_all),
+    ):
+        case_flows.case_new_create_flow(case_id=case.id, db_session=session)
+
+    total = sum(lookups.values())
+    print(f"\n{total} plugin manager lookups during case creation")
+    for lookup, count in lookups.most_common():
+        print(f"{lookup:<40} {count}")
+
+    slugs = [lookup.removeprefix("get:") for lookup in lookups if lookup.startswith("get:")]
+    number = 1000
+    before = timeit.timeit(lambda: [linear_get(plugins, slug) for slug in slugs], number=number)
+    after = timeit.timeit(lambda: [plugins.get(slug) for slug in slugs], number=number)
+    print(
+        f"{len(plugins)} plugins registered,"
+        f" per lookup before: {before / number / max(len(slugs), 1) * 1e6:.1f}us"
+        f" after: {after / number / max(len(slugs), 1) * 1e6:.1f}us"
+    )
@@ -0,0 +1,29 @@
+import pytest
+
+
+def test_plugin_manager_get():
+    from dispatch.plugins.base.manager import PluginManager
+    from dispatch.plugins.dispatch_test.ticket import TestTicketPlugin
+
+    manager = PluginManager()
+    manager.register(TestTicketPlugin)
+
+    assert isinstance(manager.get(TestTicketPlugin.slug), TestTicketPlugin)
+
+    manager.unregister(TestTicketPlugin)
+    with pytest.raises(KeyError):
+        manager.get(TestTicketPlugin.slug)
+
+
+def test_plugin_manager_all_by_type():
+    from dispatch.plugins.base.manager import PluginManager
+    from dispatch.plugins.dispatch_test.storage import TestStoragePlugin
+    from dispatch.plugins.dispatch_test.ticket import TestTicketPlugin
+
+    manager = PluginManager()
+    manager.register(TestTicketPlugin)
+    manager.register(TestStoragePlugin)
+
+    assert [p.slug for p in manager.all(plugin_type="ticket")] == [TestTicketPlugin.slug]
+    assert len(list(manager.all())) == 2
+    assert list(manager.all(version=2)) == []
@@ -111,3 +111,12 @@ def test_get_all_events_for_plugin(*, session, plugin_event):
             is_member = True
             break
     assert is_member
+
+
+def test_plugin_instance_is_bound(session, conversation_plugin_instance):
+    from dispatch.plugins.base import plugins
+
+    instance = conversation_plugin_instance.instance
+    assert instance is not plugins.get(conversation_plugin_instance.plugin.slug)
+    assert instance.project_id == conversation_plugin_instance.project_id
+    assert conversation_plugin_instance.instance is instance
@@ -0,0 +1,43 @@
+def test_jwks_cache(monkeypatch):
+    from dispatch.plugins.dispatch_core import plugin
+
+    responses = [
+        {"keys": [{"kid": "1"}]},
+        {"keys": [{"kid": "1"}, {"kid": "2"}]},
+    ]
+    fetches = []
+
+    class Response:
+        def __init__(self, data):
+            self.data = data
+
+        def json(self):
+            return self.data
+
+    def get(url, **kwargs):
+        fetches.append(url)
+        return Response(responses[len(fetches) - 1])
+
+    monkeypatch.setattr(plugin.requests, "get", get)
+
+    cache = plugin.JWKSCache("https://example.com/jwks", ttl=3600, min_refresh_interval=0)
+    assert cache.get_key("1") == {"kid": "1"}
+    assert cache.get_key("1") == {"kid": "1"}
+    assert len(fetches) == 1
+
+    # an unknown key id refreshes the key set
+    assert cache.get_key("2") == {"kid": "2"}
+    assert len(fetches) == 2
+
+
+def test_jwks_cache_keeps_keys_when_unavailable(monkeypatch):
+    from dispatch.plugins.dispatch_core import plugin
+
+    cache = plugin.JWKSCache("https://example.com/jwks", ttl=0, min_refresh_interval=0)
+    cache._keys = {"1": {"kid": "1"}}
+
+    def get(url, **kwargs):
+        raise ConnectionError()
+
+    monkeypatch.setattr(plugin.requests, "get", get)
+    assert cache.get_key("1") == {"kid": "1"}
@@ -0,0 +1,48 @@
+def test_get_match_status_conditional_requests(monkeypatch):
+    from dispatch.plugins.dispatch_github import plugin
+
+    class Response:
+        def __init__(self, status_code, headers=None, data=None):
+            self.status_code = status_code
+            self.headers = headers or {}
+            self.data = data
+
+        def json(self):
+            return self.data
+
+    responses = [
+        Response(200, {"ETag": '"1"'}, {"title": "Fix", "state": "open"}),
+        Response(304),
+        Response(304, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1000"}),
+    ]
+    requests = []
+
+    def get(url, headers, **kwargs):
+        requests.append(headers)
+        return responses[len(requests) - 1]
+
+    now = [0]
+    monkeypatch.setattr(plugin.session, "get", get)
+    monkeypatch.setattr(plugin.time, "time", lambda: now[0])
+    monkeypatch.setattr(plugin, "rate_limit", plugin.RateLimit())
+
+    github = plugin.GithubMonitorPlugin()
+    weblink = "https://github.com/netflix/dispatch/pull/1"
+
+    assert github.get_match_status(weblink) == {"title": "Fix", "state": "open"}
+    assert github.get_match_status(weblink) is None
+    assert requests[1]["If-None-Match"] == '"1"'
+
+    # unchanged matches are not polled again right away
+    now[0] = 10
+    assert github.get_match_status(weblink) is None
+    assert len(requests) == 2
+
+    now[0] = 50
+    assert github.get_match_status(weblink) is None
+    assert len(requests) == 3
+
+    # no requests are sent until the rate limit resets
+    now[0] = 500
+    assert github.get_match_status(weblink) is None
+    assert len(requests) == 3
@@ -0,0 +1,54 @@
+def test_get_service_reuses_clients(monkeypatch):
+    import threading
+
+    from dispatch.plugins.dispatch_google import common
+    from dispatch.plugins.dispatch_google.config import GoogleConfiguration
+
+    class Credentials:
+        def with_subject(self, subject):
+            return self
+
+    credentials = []
+    builds = []
+
+    def from_service_account_info(info, scopes):
+        credentials.append(info)
+        return Credentials()
+
+    def build_from_document(document, **kwargs):
+        builds.append(document)
+        return object()
+
+    monkeypatch.setattr(
+        common.service_account.Credentials, "from_service_account_info", from_service_account_info
+    )
+    monkeypatch.setattr(
+        common.googleapiclient.discovery, "build_from_document", build_from_document
+    )
+
+    config = GoogleConfiguration(
+        developer_key="key",
+        service_account_client_email="dispatch@example.com",
+        service_account_client_id="1",
+        service_account_private_key="private-key",
+        service_account_private_key_id="2",
+        service_account_delegated_account="dispatch@example.com",
+        service_account_project_id="reuse-clients",
+        google_domain="example.com",
+    )
+    scopes = ["https://www.googleapis.com/auth/drive"]
+
+    service = common.get_service(config, "drive", "v3", scopes)
+    assert common.get_service(config, "drive", "v3", scopes) is service
+
+    # other threads get their own client built from the same credentials
+    other_services = []
+    thread = threading.Thread(
+        target=lambda: other_services.append(common.get_service(config, "drive", "v3", scopes))
+    )
+    thread.start()
+    thread.join()
+
+    assert other_services[0] is not service
+    assert len(builds) == 2
+    assert len(credentials) == 1
@@ -0,0 +1,115 @@
+class Request:
+    def __init__(self, service, body):
+        self.service = service
+        self.body = body
+
+    def execute(self):
+        self.service.sent.append(self.body)
+        return {"threadId": f"thread-{self.body['raw']}"}
+
+
+class Batch:
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.service.batches.append(len(self.requests))
+        for request_id, request in self.requests:
+            if isinstance(request, Request) and request.body["raw"] in self.service.failing:
+                self.service.failing.remove(request.body["raw"])
+                self.callback(request_id, None, Exception("Rate limit exceeded"))
+            else:
+                self.callback(request_id, request.execute(), None)
+
+
+class Execute:
+    def __init__(self, response):
+        self.response = response
+
+    def execute(self):
+        return self.response
+
+
+class Service:
+    def __init__(self, failing=(), bounces=(), threads=None):
+        self.failing = set(failing)
+        self.sent = []
+        self.batches = []
+        self.bounces = list(bounces)
+        self.threads_by_id = threads or {}
+
+    def new_batch_http_request(self, callback):
+        return Batch(self, callback)
+
+    def users(self):
+        return self
+
+    def messages(self):
+        return self
+
+    def threads(self):
+        return self
+
+    def send(self, userId, body):
+        return Request(self, body)
+
+    def list(self, userId, q, maxResults):
+        return Execute({"messages": self.bounces})
+
+    def list_next(self, request, response):
+        return None
+
+    def get(self, userId, id, format, metadataHeaders):
+        return Execute(self.threads_by_id[id])
+
+
+def test_send_messages_batches():
+    from dispatch.plugins.dispatch_google.gmail.plugin import BATCH_SIZE, send_messages
+
+    messages = [{"raw": str(i)} for i in range(BATCH_SIZE + 10)]
+    service = Service(failing={"3"})
+
+    thread_ids = send_messages(service, messages)
+
+    assert service.batches == [BATCH_SIZE, 10]
+    # the message that failed within its batch is sent again on its own
+    assert thread_ids == [f"thread-{i}" for i in range(BATCH_SIZE + 10)]
+
+
+def test_reconcile_bounces(monkeypatch):
+    from dispatch.plugins.dispatch_google.gmail import plugin
+
+    def thread(recipient):
+        return {
+            "messages": [
+                {
+                    "labelIds": ["SENT"],
+                    "payload": {"headers": [{"name": "To", "value": recipient}]},
+                },
+                {
+                    "labelIds": ["INBOX"],
+                    "payload": {"headers": [{"name": "To", "value": "dispatch@example.com"}]},
+                },
+            ]
+        }
+
+    service = Service(
+        bounces=[{"id": "bounce-1", "threadId": "thread-1"}],
+        threads={"thread-1": thread("alice@example.com")},
+    )
+    monkeypatch.setattr(plugin, "get_service", lambda *args: service)
+
+    class Configuration:
+        service_account_delegated_account = "reconcile@example.com"
+
+    gmail = plugin.GoogleGmailEmailPlugin()
+    gmail.configuration = Configuration()
+
+    assert gmail.reconcile_bounces() == ["alice@example.com"]
+    # bounces are reported once
+    assert gmail.reconcile_bounces() == []
@@ -0,0 +1,63 @@
+def test_cursor_round_trip():
+    from dispatch.search.utils import decode_cursor, encode_cursor
+
+    cursor = (0.1, "Incident", 42)
+    assert decode_cursor(encode_cursor(cursor)) == cursor
+
+
+def test_decode_invalid_cursor():
+    import pytest
+
+    from dispatch.search.utils import decode_cursor
+
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_composite_search_filters_restricted_incidents(session, user, incidents):
+    from dispatch.database.service import composite_search
+    from dispatch.enums import Visibility
+    from dispatch.incident.models import Incident
+
+    open_incident, restricted_incident = incidents[0], incidents[1]
+    open_incident.title = "searchable composite"
+    open_incident.visibility = Visibility.open
+    restricted_incident.title = "searchable composite"
+    restricted_incident.visibility = Visibility.restricted
+    session.flush()
+
+    results, cursor = composite_search(
+        db_session=session, query_str="searchable", models=[Incident], current_user=user
+    )
+    ids = [incident.id for incident in results["Incident"]]
+    assert open_incident.id in ids
+    assert restricted_incident.id not in ids
+    assert cursor is None
+
+
+def test_composite_search_pagination(session, user, incidents):
+    from dispatch.database.service import composite_search
+    from dispatch.enums import Visibility
+    from dispatch.incident.models import Incident
+
+    for incident in incidents:
+        incident.title = "paginated composite"
+        incident.visibility = Visibility.open
+    session.flush()
+
+    ids = []
+    cursor = None
+    while True:
+        results, cursor = composite_search(
+            db_session=session,
+            query_str="paginated",
+            models=[Incident],
+            current_user=user,
+            limit=1,
+            cursor=cursor,
+        )
+        ids.extend(incident.id for incident in results["Incident"])
+        if not cursor:
+            break
+
+    assert sorted(ids) == sorted(incident.id for incident in incidents)
@@ -0,0 +1,41 @@
+def test_supervise_restarts_with_backoff(monkeypatch):
+    from dispatch.signal.consumer import ConsumerKey, SignalConsumerSupervisor, _Consumer
+
+    supervisor = SignalConsumerSupervisor(min_backoff=1, max_backoff=4)
+    monkeypatch.setattr(supervisor, "consume", lambda consumer: None)
+
+    consumer = _Consumer(
+        ConsumerKey(
+            organization_slug="default", project_id=1, plugin_instance_id=1, plugin_slug="test"
+        )
+    )
+
+    supervisor.supervise(consumer, now=0)
+    consumer.thread.join()
+
+    backoffs = []
+    for now in (10, 20, 30, 40):
+        supervisor.supervise(consumer, now=now)
+        backoffs.append(consumer.backoff)
+        # the consumer is not restarted before its backoff has elapsed
+        assert consumer.thread is None
+        supervisor.supervise(consumer, now=now + consumer.backoff)
+        consumer.thread.join()
+
+    assert backoffs == [1, 2, 4, 4]
+    assert consumer.stats.restarts == 4
+
+
+def test_consumer_stats_record():
+    from dispatch.signal.consumer import ConsumerKey, ConsumerStats
+
+    stats = ConsumerStats(
+        key=ConsumerKey(
+            organization_slug="default", project_id=1, plugin_instance_id=1, plugin_slug="test"
+        )
+    )
+    stats.record(received=10)
+    stats.record(received=5, errors=2)
+
+    assert stats.received == 15
+    assert stats.errors == 2
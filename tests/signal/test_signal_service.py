@@ -824,3 +824,104 @@ def test_canary_signals_not_deduplicated(session, signal, project):
     # Check that the canary signal instance is not deduplicated (should have same case_id as before)
     assert canary_signal_instance.case_id == initial_case_id
     assert canary_signal_instance.filter_action != SignalFilterAction.deduplicate
+
+
+def test_claim_unprocessed_signal_instances(session, signal_instance):
+    from dispatch.signal.service import (
+        claim_unprocessed_signal_instances,
+        release_signal_instance,
+    )
+
+    signal_instance.filter_action = None
+    signal_instance.case_id = None
+    session.flush()
+
+    claimed = claim_unprocessed_signal_instances(session, "default", limit=1000)
+    assert signal_instance.id in [id for id, _ in claimed]
+
+    # instances claimed by this connection are skipped by the next claim
+    assert signal_instance.id not in [
+        id for id, _ in claim_unprocessed_signal_instances(session, "default", limit=1000)
+    ]
+
+    for id, _ in claimed:
+        release_signal_instance(session, "default", id)
+
+
+def test_create_instances(session, signal, signal_instance):
+    import uuid
+
+    from dispatch.signal.models import SignalInstanceCreate
+    from dispatch.signal.service import SignalDefinitionCache, create_instances
+
+    signal.external_id = str(uuid.uuid4())
+    session.flush()
+
+    new_id = str(uuid.uuid4())
+    signal_instances_in = [
+        SignalInstanceCreate(raw={"id": new_id}, external_id=signal.external_id),
+        SignalInstanceCreate(raw={"id": str(signal_instance.id)}, external_id=signal.external_id),
+        SignalInstanceCreate(raw={"id": "not-a-uuid"}, external_id=signal.external_id),
+        # signal instances must identify their signal definition
+        SignalInstanceCreate(raw={"id": str(uuid.uuid4())}),
+    ]
+
+    ids, created = create_instances(
+        db_session=session,
+        project=signal.project,
+        signal_instances_in=signal_instances_in,
+        definition_cache=SignalDefinitionCache(),
+    )
+
+    assert ids == [new_id, str(signal_instance.id), None, None]
+    assert created == {new_id}
+
+
+def test_create_instances_skips_rows_failing_to_insert(session, signal):
+    import uuid
+
+    from dispatch.signal.models import SignalInstanceCreate
+    from dispatch.signal.service import SignalDefinitionCache, create_instances
+
+    signal.external_id = str(uuid.uuid4())
+    session.flush()
+
+    new_id = str(uuid.uuid4())
+    signal_instances_in = [
+        SignalInstanceCreate(raw={"id": new_id}, external_id=signal.external_id),
+        # Postgres rejects null characters in jsonb values
+        SignalInstanceCreate(
+            raw={"id": str(uuid.uuid4()), "name": "\x00"}, external_id=signal.external_id
+        ),
+    ]
+
+    ids, created = create_instances(
+        db_session=session,
+        project=signal.project,
+        signal_instances_in=signal_instances_in,
+        definition_cache=SignalDefinitionCache(),
+    )
+
+    assert ids == [new_id, None]
+    assert created == {new_id}
+
+
+def test_get_recent_cases_for_signal(session, signal_instance):
+    from dispatch.case.enums import CaseResolutionReason
+    from dispatch.signal.service import (
+        get_first_instance_raw_by_case_id,
+        get_recent_cases_for_signal,
+    )
+
+    case = signal_instance.case
+    case.resolution_reason = CaseResolutionReason.benign
+    session.flush()
+
+    cases = get_recent_cases_for_signal(session, signal_id=signal_instance.signal_id)
+    assert case in cases
+    assert not get_recent_cases_for_signal(
+        session, signal_id=signal_instance.signal_id, exclude_case_id=case.id
+    )
+
+    raws = get_first_instance_raw_by_case_id(session, case_ids=[case.id])
+    assert raws[case.id] == signal_instance.raw
@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+
+def _item(id, tag_ids):
+    return SimpleNamespace(id=id, tags=[SimpleNamespace(id=t) for t in tag_ids])
+
+
+def test_recommend():
+    from dispatch.tag.recommender import TagModel
+
+    model = TagModel.build([_item(1, [1, 2]), _item(2, [1, 2, 3]), _item(3, [3])])
+
+    assert model.recommend(1, 5) == [2, 3]
+    assert model.recommend(4, 5) == []
+
+
+def test_update():
+    from dispatch.tag.recommender import TagModel
+
+    model = TagModel.build([_item(1, [1, 2]), _item(2, [1, 2, 3]), _item(3, [3])])
+    updated = model.update(3, [3, 4])
+    expected = TagModel.build([_item(1, [1, 2]), _item(2, [1, 2, 3]), _item(3, [3, 4])])
+
+    assert model.recommend(3, 5) == [1, 2]
+    assert updated.recommend(3, 5) == [4, 1, 2]
+    assert (updated.counts != expected.counts).nnz == 0
+
+
+def test_update_model(tmp_path, monkeypatch):
+    import tempfile
+    from datetime import datetime
+
+    from dispatch.tag.recommender import build_model, load_model, update_model
+
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    build_model([_item(1, [1, 2]), _item(2, [2])], "default", "test", "incident")
+    update_model([_item(2, [1, 2])], datetime(2001, 1, 1), "default", "test", "incident")
+
+    model = load_model("default", "test", "incident")
+    assert model.updated_at == datetime(2001, 1, 1)
+    assert model.item_tags[2] == frozenset([1, 2])
+    assert model.recommend(2, 5) == [1]